@@ -32,10 +32,13 @@ class AVROData(JSONData, BaseData):
             options = dict(
                 data_format= type: str, choices: "dataframe", "records", "avro"
                 selected_keys= type: list(str)
+                keep_native_numeric= type: bool
             )
 
         data_format: user selected format can only be of specified types
         selected_keys: keys being selected from the entire dataset
+        keep_native_numeric: keep the int and float64 columns typed by the avro
+            schema as is in the dataframe instead of converting them to strings
 
         :param input_file_path: path to the file being loaded or None
         :type input_file_path: str
@@ -4,7 +4,7 @@ import random
 import re
 from collections import Counter
 from io import StringIO
-from typing import Dict, List, Optional, Tuple, Union, cast
+from typing import Dict, Generator, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -41,6 +41,7 @@ class CSVData(SpreadSheetDataMixin, BaseData):
                 record_samples_per_line= type: int (only for "records")
                 selected_columns= type: list(str)
                 header= type: any
+                chunk_size= type: int
             )
 
         delimiter: delimiter used to decipher the csv input file
@@ -55,6 +56,8 @@ class CSVData(SpreadSheetDataMixin, BaseData):
         selected_columns: columns being selected from the entire dataset
         header: location of the header in the file
         quotechar: quote character used in the delimited file
+        chunk_size: number of rows to read per chunk when the data is streamed
+            to a profiler instead of being loaded into memory at once
 
         :param input_file_path: path to the file being loaded or None
         :type input_file_path: str
@@ -77,6 +80,7 @@ class CSVData(SpreadSheetDataMixin, BaseData):
         #  _delimiter: delimiter used to decipher the csv input file
         #  _selected_columns: columns being selected from the entire dataset
         #  _header: any information pertaining to the file header.
+        #  _chunk_size: number of rows read per chunk when streaming the file
         self._data_formats["records"] = self._get_data_as_records
         self.SAMPLES_PER_LINE_DEFAULT: int = options.get("record_samples_per_line", 1)
         self._selected_data_format: str = options.get("data_format", "dataframe")
@@ -85,6 +89,7 @@ class CSVData(SpreadSheetDataMixin, BaseData):
         self._selected_columns: List[str] = options.get("selected_columns", list())
         self._header: Optional[Union[str, int]] = options.get("header", "auto")
         self._checked_header: bool = "header" in options and self._header != "auto"
+        self._chunk_size: Optional[int] = options.get("chunk_size", None)
         self._default_delimiter: str = ","
         self._default_quotechar: str = '"'
 
@@ -115,6 +120,11 @@ class CSVData(SpreadSheetDataMixin, BaseData):
         """Return header."""
         return self._header
 
+    @property
+    def chunk_size(self) -> Optional[int]:
+        """Return number of rows read per chunk when streaming."""
+        return self._chunk_size
+
     @property
     def is_structured(self) -> bool:
         """Determine compatibility with StructuredProfiler."""
@@ -168,6 +178,12 @@ class CSVData(SpreadSheetDataMixin, BaseData):
                 raise ValueError(
                     "'record_samples_per_line' must be an int " "more than 0"
                 )
+        if "chunk_size" in options:
+            value = options["chunk_size"]
+            if value is not None and (
+                not isinstance(value, int) or isinstance(value, bool) or value < 1
+            ):
+                raise ValueError("'chunk_size' must be None or an int more than 0")
         return options
 
     @staticmethod
@@ -553,8 +569,8 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             read_in_string=True,
         )
 
-    def _load_data_from_file(self, input_file_path: str) -> pd.DataFrame:
-        """Load the data into memory from the file."""
+    def _detect_file_format(self, input_file_path: str) -> None:
+        """Determine the delimiter, quotechar and header of the file."""
         data_as_str = data_utils.load_as_str_from_file(
             input_file_path, self.file_encoding
         )
@@ -591,6 +607,9 @@ class CSVData(SpreadSheetDataMixin, BaseData):
                 if count_delimiter_last == num_lines_read:
                     self._delimiter = None
 
+    def _load_data_from_file(self, input_file_path: str) -> pd.DataFrame:
+        """Load the data into memory from the file."""
+        self._detect_file_format(input_file_path)
         return data_utils.read_csv_df(
             input_file_path,
             self.delimiter,
@@ -600,6 +619,43 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             encoding=self.file_encoding,
         )
 
+    def get_chunk_generator(
+        self, chunk_size: Optional[int] = None
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Yield the dataset as dataframes of at most `chunk_size` rows.
+
+        When the data has not already been loaded into memory, the file is
+        streamed such that only a single chunk is held in memory at a time.
+
+        :param chunk_size: number of rows per chunk, defaults to the
+            `chunk_size` option of the data class
+        :type chunk_size: int
+        :return: generator of dataframes
+        :rtype: Generator(pd.DataFrame)
+        """
+        if chunk_size is None:
+            chunk_size = self._chunk_size
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("`chunk_size` must be an int more than 0")
+
+        if self._data is not None or not self.input_file_path:
+            data = self.data
+            for i in range(0, len(data), chunk_size):
+                yield data.iloc[i : i + chunk_size]
+            return
+
+        self._detect_file_format(self.input_file_path)
+        yield from data_utils.read_csv_df_in_chunks(
+            self.input_file_path,
+            self.delimiter,
+            cast(Optional[int], self.header),
+            chunk_size,
+            self.selected_columns,
+            read_in_string=True,
+            encoding=self.file_encoding,
+        )
+
     def _get_data_as_records(self, data: pd.DataFrame) -> List[str]:
         """Return data as records."""
         sep = self.delimiter if self.delimiter else self._default_delimiter
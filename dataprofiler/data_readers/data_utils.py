@@ -18,6 +18,7 @@ from typing import (
 )
 
 import dateutil
+import numpy as np
 import pandas as pd
 import pyarrow.parquet as pq
 import requests
@@ -113,10 +114,44 @@ def unicode_to_str(data: JSONType, ignore_dicts: bool = False) -> JSONType:
     return data
 
 
+def convert_to_str(
+    data: pd.DataFrame, keep_native_numeric: bool = False
+) -> pd.DataFrame:
+    """
+    Convert the columns of a dataframe to strings.
+
+    :param data: dataframe to convert
+    :type data: pd.DataFrame
+    :param keep_native_numeric: if True, the columns with an int or float64
+        dtype are kept as is, which the profilers use without parsing strings
+    :type keep_native_numeric: bool
+    :return: dataframe of strings
+    :rtype: pd.DataFrame
+    """
+    is_native_numeric = [
+        keep_native_numeric
+        and isinstance(dtype, np.dtype)
+        and (dtype.kind in "iu" or dtype == np.float64)
+        for dtype in data.dtypes
+    ]
+    if not any(is_native_numeric):
+        return data.astype(str)
+    elif all(is_native_numeric):
+        return data
+    return pd.concat(
+        [
+            column if is_native else column.astype(str)
+            for (_, column), is_native in zip(data.items(), is_native_numeric)
+        ],
+        axis=1,
+    )
+
+
 def json_to_dataframe(
     json_lines: List[JSONType],
     selected_columns: Optional[List[str]] = None,
     read_in_string: bool = False,
+    keep_native_numeric: bool = False,
 ) -> Tuple[pd.DataFrame, pd.Series]:
     """
     Take list of json objects and return dataframe representing json list.
@@ -128,6 +163,9 @@ def json_to_dataframe(
     :param read_in_string: if True, all the values in dataframe will be
         converted to string
     :type read_in_string: bool
+    :param keep_native_numeric: if True, the int and float64 columns are not
+        converted to string
+    :type keep_native_numeric: bool
     :return: dataframe converted from json list and list of dtypes for each
         column
     :rtype: tuple(pd.DataFrame, pd.Series(dtypes))
@@ -147,7 +185,7 @@ def json_to_dataframe(
         df = pd.DataFrame(json_lines)
     original_df_dtypes = df.dtypes
 
-    df[df.columns] = df[df.columns].astype(str)
+    df = convert_to_str(df, keep_native_numeric)
 
     # filter some columns to be processed if specified by users
     if selected_columns:
@@ -268,19 +306,16 @@ def read_json(
     return lines
 
 
-def read_csv_df(
-    file_path: Union[str, BytesIO, TextIOWrapper],
+def _get_read_csv_args(
     delimiter: Optional[str],
     header: Optional[int],
-    selected_columns: List[str] = [],
-    read_in_string: bool = False,
-    encoding: Optional[str] = "utf-8",
-) -> pd.DataFrame:
+    selected_columns: List[str],
+    read_in_string: bool,
+    encoding: Optional[str],
+) -> Dict[str, Any]:
     """
-    Read a CSV file in chunks and return dataframe in form of iterator.
+    Create the keyword arguments shared by the csv readers.
 
-    :param file_path: path to the CSV file.
-    :type file_path: str
     :param delimiter: character used to separate csv values.
     :type delimiter: str
     :param header: the header row in the csv file.
@@ -290,8 +325,10 @@ def read_csv_df(
     :param read_in_string: if True, all the values in dataframe will be
         converted to string
     :type read_in_string: bool
-    :return: Iterator
-    :rtype: pd.DataFrame
+    :param encoding: encoding of the csv file
+    :type encoding: str
+    :return: arguments for pd.read_csv
+    :rtype: dict
     """
     args: Dict[str, Any] = {
         "delimiter": delimiter,
@@ -312,6 +349,38 @@ def read_csv_df(
     if len(selected_columns) > 0:
         args["usecols"] = selected_columns
 
+    return args
+
+
+def read_csv_df(
+    file_path: Union[str, BytesIO, TextIOWrapper],
+    delimiter: Optional[str],
+    header: Optional[int],
+    selected_columns: List[str] = [],
+    read_in_string: bool = False,
+    encoding: Optional[str] = "utf-8",
+) -> pd.DataFrame:
+    """
+    Read a CSV file in chunks and return dataframe in form of iterator.
+
+    :param file_path: path to the CSV file.
+    :type file_path: str
+    :param delimiter: character used to separate csv values.
+    :type delimiter: str
+    :param header: the header row in the csv file.
+    :type header: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :return: Iterator
+    :rtype: pd.DataFrame
+    """
+    args = _get_read_csv_args(
+        delimiter, header, selected_columns, read_in_string, encoding
+    )
+
     # account for py3.6 requirement for pandas, can remove if >= py3.7
     is_buf_wrapped = False
     if isinstance(file_path, BytesIO):
@@ -332,52 +401,172 @@ def read_csv_df(
     return data
 
 
+def read_csv_df_in_chunks(
+    file_path: Union[str, BytesIO, TextIOWrapper],
+    delimiter: Optional[str],
+    header: Optional[int],
+    chunk_size: int,
+    selected_columns: List[str] = [],
+    read_in_string: bool = False,
+    encoding: Optional[str] = "utf-8",
+) -> Generator[pd.DataFrame, None, None]:
+    """
+    Read a CSV file and yield it as dataframes of at most `chunk_size` rows.
+
+    Only one chunk is held in memory at a time, the index of each chunk
+    continues from the previous one.
+
+    :param file_path: path to the CSV file.
+    :type file_path: str
+    :param delimiter: character used to separate csv values.
+    :type delimiter: str
+    :param header: the header row in the csv file.
+    :type header: int
+    :param chunk_size: number of rows to read per chunk
+    :type chunk_size: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :param encoding: encoding of the csv file
+    :type encoding: str
+    :return: generator of dataframes
+    :rtype: Generator(pd.DataFrame)
+    """
+    args = _get_read_csv_args(
+        delimiter, header, selected_columns, read_in_string, encoding
+    )
+    args["chunksize"] = chunk_size
+
+    is_buf_wrapped = False
+    if isinstance(file_path, BytesIO):
+        file_path = TextIOWrapper(file_path, encoding=encoding)
+        is_buf_wrapped = True
+
+    fo = pd.read_csv(file_path, **args)
+    try:
+        yield from fo
+    finally:
+        # if the buffer was wrapped, detach it before returning
+        if is_buf_wrapped:
+            file_path = cast(TextIOWrapper, file_path)
+            file_path.detach()
+        fo.close()
+
+
+def _read_parquet_row_group(
+    parquet_file: pq.ParquetFile,
+    row_group: int,
+    selected_columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read a single row group of a parquet file into a dataframe.
+
+    Only the selected columns are read from the file and string / mixed
+    columns are stripped and decoded to utf-8.
+
+    :param parquet_file: opened parquet file
+    :type parquet_file: pyarrow.parquet.ParquetFile
+    :param row_group: index of the row group to read
+    :type row_group: int
+    :param selected_columns: a list of columns to be read
+    :type selected_columns: list(str)
+    :return: the row group as a dataframe
+    :rtype: pd.DataFrame
+    """
+    columns = selected_columns if selected_columns else None
+    data_row_df = parquet_file.read_row_group(row_group, columns=columns).to_pandas()
+
+    # Convert all the unicode columns to utf-8
+    types = data_row_df.apply(lambda x: pd.api.types.infer_dtype(x.values, skipna=True))
+
+    mixed_and_unicode_cols = types[types == "unicode"].index.union(
+        types[types == "mixed"].index
+    )
+
+    def _decode_and_strip(x: Any) -> Any:
+        if isinstance(x, str):
+            return x.strip()
+        elif isinstance(x, bytes):
+            return x.decode("utf-8").strip()
+        return x
+
+    for col in mixed_and_unicode_cols:
+        data_row_df[col] = data_row_df[col].map(_decode_and_strip)
+
+    if selected_columns:
+        data_row_df = data_row_df[selected_columns]
+    return data_row_df
+
+
 def read_parquet_df(
     file_path: str,
     selected_columns: Optional[List[str]] = None,
     read_in_string: bool = False,
+    keep_native_numeric: bool = False,
 ) -> Tuple[pd.DataFrame, pd.Series]:
     """
     Return an iterator that returns one row group each time.
 
     :param file_path: path to the Parquet file.
     :type file_path: str
+    :param keep_native_numeric: if True, the int and float64 columns are not
+        converted to string
+    :type keep_native_numeric: bool
     :return:
     :rtype: Iterator(pd.DataFrame)
     """
     parquet_file = pq.ParquetFile(file_path)
-    data = pd.DataFrame()
-    for i in range(parquet_file.num_row_groups):
+    row_group_dfs = [
+        _read_parquet_row_group(parquet_file, i, selected_columns)
+        for i in range(parquet_file.num_row_groups)
+    ]
+    data = pd.concat(row_group_dfs) if row_group_dfs else pd.DataFrame()
 
-        data_row_df = parquet_file.read_row_group(i).to_pandas()
-
-        # Convert all the unicode columns to utf-8
-        types = data_row_df.apply(
-            lambda x: pd.api.types.infer_dtype(x.values, skipna=True)
-        )
-
-        mixed_and_unicode_cols = types[types == "unicode"].index.union(
-            types[types == "mixed"].index
-        )
+    original_df_dtypes = data.dtypes
+    if read_in_string:
+        data = convert_to_str(data, keep_native_numeric)
 
-        for col in mixed_and_unicode_cols:
-            data_row_df[col] = data_row_df[col].apply(
-                lambda x: x.encode("utf-8").strip() if isinstance(x, str) else x
-            )
-            data_row_df[col] = data_row_df[col].apply(
-                lambda x: x.decode("utf-8").strip() if isinstance(x, bytes) else x
-            )
+    return data, original_df_dtypes
 
-        if selected_columns:
-            data_row_df = data_row_df[selected_columns]
 
-        data = pd.concat([data, data_row_df])
+def read_parquet_df_by_row_group(
+    file_path: str,
+    selected_columns: Optional[List[str]] = None,
+    read_in_string: bool = False,
+    keep_native_numeric: bool = False,
+) -> Generator[Tuple[pd.DataFrame, pd.Series], None, None]:
+    """
+    Yield a parquet file as dataframes, one row group at a time.
 
-    original_df_dtypes = data.dtypes
-    if read_in_string:
-        data = data.astype(str)
+    Only one row group of the selected columns is held in memory at a time,
+    the index of each row group continues from the previous one.
 
-    return data, original_df_dtypes
+    :param file_path: path to the Parquet file.
+    :type file_path: str
+    :param selected_columns: a list of columns to be read
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :param keep_native_numeric: if True, the int and float64 columns are not
+        converted to string
+    :type keep_native_numeric: bool
+    :return: generator of the row group dataframe and its original dtypes
+    :rtype: Generator(tuple(pd.DataFrame, pd.Series(dtypes)))
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    row_offset = 0
+    for i in range(parquet_file.num_row_groups):
+        data = _read_parquet_row_group(parquet_file, i, selected_columns)
+        data.index = pd.RangeIndex(row_offset, row_offset + len(data))
+        row_offset += len(data)
+
+        original_df_dtypes = data.dtypes
+        if read_in_string:
+            data = convert_to_str(data, keep_native_numeric)
+        yield data, original_df_dtypes
 
 
 def read_text_as_list_of_strs(
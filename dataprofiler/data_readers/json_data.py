@@ -40,6 +40,7 @@ class JSONData(SpreadSheetDataMixin, BaseData):
                  "flattened_dataframe"
                 selected_keys= type: list(str)
                 payload_keys= type: Union[str, list(str)]
+                keep_native_numeric= type: bool
             )
 
 
@@ -47,6 +48,8 @@ class JSONData(SpreadSheetDataMixin, BaseData):
         can only be of specified types
         selected_keys: keys being selected from the entire dataset
         payload_keys: list of dictionary keys that determine the payload
+        keep_native_numeric: keep the int and float64 columns as is in the
+            dataframe instead of converting them to strings
 
         :param input_file_path: path to the file being loaded or None
         :type input_file_path: str
@@ -68,6 +71,7 @@ class JSONData(SpreadSheetDataMixin, BaseData):
         #                         can only be of types in _data_formats
         #  _selected_keys: keys being selected from the entire dataset
         #  _payload_keys: (list of) dictionary key(s) that determines the payload
+        #  _keep_native_numeric: keep the int and float64 columns of the data
 
         self._data_formats["records"] = self._get_data_as_records
         self._data_formats["json"] = self._get_data_as_json
@@ -82,6 +86,7 @@ class JSONData(SpreadSheetDataMixin, BaseData):
             self._payload_keys = [self._payload_keys]
         self._key_separator: str = options.get("key_separator", ".")
         self._selected_keys: Optional[List[str]] = options.get("selected_keys", list())
+        self._keep_native_numeric: bool = options.get("keep_native_numeric", False)
         self._metadata: Optional[pd.DataFrame] = None
         if data is not None:
             self._load_data(data)
@@ -112,6 +117,23 @@ class JSONData(SpreadSheetDataMixin, BaseData):
         """Determine compatibility with StructuredProfiler."""
         return self.data_format in ["dataframe", "flattened_dataframe"]
 
+    @staticmethod
+    def _check_and_return_options(options: Optional[Dict]) -> Dict:
+        """
+        Ensure options are valid inputs to the data reader.
+
+        :param options: dictionary of options for the json reader to validate
+        :type options: dict
+        :return: None
+        """
+        options = super(JSONData, JSONData)._check_and_return_options(options)
+
+        if "keep_native_numeric" in options:
+            value = options["keep_native_numeric"]
+            if not isinstance(value, bool):
+                raise ValueError("'keep_native_numeric' must be a bool")
+        return options
+
     def _find_data(self, json_data, path=""):
         """
         Find all the col headers/data in Json and return them as list.
@@ -196,6 +218,7 @@ class JSONData(SpreadSheetDataMixin, BaseData):
                         json_lines=payload_data,
                         selected_columns=self.selected_keys,
                         read_in_string=False,
+                        keep_native_numeric=self._keep_native_numeric,
                     )
                     for column in payload_data.columns:
                         payload_data.rename(
@@ -228,6 +251,7 @@ class JSONData(SpreadSheetDataMixin, BaseData):
             json_lines=json_lines,
             selected_columns=self.selected_keys,
             read_in_string=False,
+            keep_native_numeric=self._keep_native_numeric,
         )
         self._original_df_dtypes = original_df_dtypes
 
@@ -323,7 +347,10 @@ class JSONData(SpreadSheetDataMixin, BaseData):
         if isinstance(data, dict):
             data = [data]
         data, original_df_dtypes = data_utils.json_to_dataframe(
-            json_lines=data, selected_columns=self.selected_keys, read_in_string=False
+            json_lines=data,
+            selected_columns=self.selected_keys,
+            read_in_string=False,
+            keep_native_numeric=self._keep_native_numeric,
         )
         self._original_df_dtypes = original_df_dtypes
         return data
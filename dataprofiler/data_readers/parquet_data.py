@@ -1,6 +1,6 @@
 """Contains class to save and load parquet data."""
 from io import BytesIO, StringIO
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Union
 
 import pandas as pd
 import pyarrow.parquet as pq
@@ -32,11 +32,17 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
                 data_format= type: str, choices: "dataframe", "records", "json"
                 selected_columns= type: list(str)
                 header= type: any
+                chunk_by_row_group= type: bool
+                keep_native_numeric= type: bool
             )
 
         data_format: user selected format in which to return data
         can only be of specified types
         selected_columns: columns being selected from the entire dataset
+        chunk_by_row_group: when profiled, stream the file one row group at a
+            time instead of loading it into memory at once
+        keep_native_numeric: keep the int and float64 columns of the file as
+            is in the dataframe instead of converting them to strings
 
         :param input_file_path: path to the file being loaded or None
         :type input_file_path: str
@@ -57,10 +63,14 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
         #  _selected_data_format: user selected format in which to return data
         #                         can only be of types in _data_formats
         #  _selected_columns: columns being selected from the entire dataset
+        #  _chunk_by_row_group: stream the file one row group at a time
+        #  _keep_native_numeric: keep the int and float64 columns of the file
         self._data_formats["records"] = self._get_data_as_records
         self._data_formats["json"] = self._get_data_as_json
         self._selected_data_format: str = options.get("data_format", "dataframe")
         self._selected_columns: List[str] = options.get("selected_columns", list())
+        self._chunk_by_row_group: bool = options.get("chunk_by_row_group", False)
+        self._keep_native_numeric: bool = options.get("keep_native_numeric", False)
 
         if data is not None:
             self._load_data(data)
@@ -83,11 +93,37 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
         """Return selected columns."""
         return self._selected_columns
 
+    @property
+    def chunk_by_row_group(self) -> bool:
+        """Return whether the data is streamed one row group at a time."""
+        return self._chunk_by_row_group
+
     @property
     def is_structured(self) -> bool:
         """Determine compatibility with StructuredProfiler."""
         return self.data_format == "dataframe"
 
+    @staticmethod
+    def _check_and_return_options(options: Optional[Dict]) -> Dict:
+        """
+        Ensure options are valid inputs to the data reader.
+
+        :param options: dictionary of options for the parquet reader to validate
+        :type options: dict
+        :return: None
+        """
+        options = super(ParquetData, ParquetData)._check_and_return_options(options)
+
+        if "chunk_by_row_group" in options:
+            value = options["chunk_by_row_group"]
+            if not isinstance(value, bool):
+                raise ValueError("'chunk_by_row_group' must be a bool")
+        if "keep_native_numeric" in options:
+            value = options["keep_native_numeric"]
+            if not isinstance(value, bool):
+                raise ValueError("'keep_native_numeric' must be a bool")
+        return options
+
     def _load_data_from_str(self, data_as_str: str) -> pd.DataFrame:
         """Return data from string."""
         data_generator = data_utils.data_generator(data_as_str.splitlines())
@@ -100,13 +136,43 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
     def _load_data_from_file(self, input_file_path: str) -> pd.DataFrame:
         """Return data from file."""
         data, original_df_dtypes = data_utils.read_parquet_df(
-            input_file_path, self.selected_columns, read_in_string=True
+            input_file_path,
+            self.selected_columns,
+            read_in_string=True,
+            keep_native_numeric=self._keep_native_numeric,
         )
         self._original_df_dtypes = original_df_dtypes
         return data
 
+    def get_chunk_generator(self) -> Generator[pd.DataFrame, None, None]:
+        """
+        Yield the dataset as dataframes, one parquet row group at a time.
+
+        When the data has not already been loaded into memory, only the
+        selected columns of a single row group are held in memory at a time.
+
+        :return: generator of dataframes
+        :rtype: Generator(pd.DataFrame)
+        """
+        if self._data is not None or not self.input_file_path:
+            yield self.data
+            return
+
+        for data, original_df_dtypes in data_utils.read_parquet_df_by_row_group(
+            self.input_file_path,
+            self.selected_columns,
+            read_in_string=True,
+            keep_native_numeric=self._keep_native_numeric,
+        ):
+            if self._original_df_dtypes is None:
+                self._original_df_dtypes = original_df_dtypes
+            yield data
+
     def _get_data_as_records(self, data: pd.DataFrame) -> List[str]:
         """Return data records."""
+        # the numeric columns may have been kept native when read from the file
+        if self._keep_native_numeric and self.input_file_path:
+            data = data.astype(str)
         # split into row samples separate by `\n`
         data = data.to_json(orient="records", lines=True)
         data = data.splitlines()
@@ -114,6 +180,9 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
 
     def _get_data_as_json(self, data: pd.DataFrame) -> List[str]:
         """Return json data."""
+        # the numeric columns may have been kept native when read from the file
+        if self._keep_native_numeric and self.input_file_path:
+            data = data.astype(str)
         data = data.to_json(orient="records")
         chars_per_line = min(len(data), self.SAMPLES_PER_LINE_DEFAULT)
         return list(map("".join, zip(*[iter(data)] * chars_per_line)))
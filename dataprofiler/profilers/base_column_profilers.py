@@ -6,7 +6,7 @@ from __future__ import annotations
 import abc
 import warnings
 from collections import defaultdict
-from typing import Any, Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar, cast
 
 import numpy as np
 import pandas as pd
@@ -18,6 +18,127 @@ from . import utils
 BaseColumnProfilerT = TypeVar("BaseColumnProfilerT", bound="BaseColumnProfiler")
 
 
+class ColumnView:
+    """
+    View of a cleaned column batch which is shared by the column profilers.
+
+    Holds the column as strings and, if the source data has a native int or
+    float64 dtype, the natively typed values, such that numeric profilers do
+    not need to parse the strings. The conversions of the column used by
+    multiple profilers are computed lazily, once per batch.
+    """
+
+    def __init__(self, df_series: pd.Series) -> None:
+        """
+        Initialize the view of a cleaned column.
+
+        :param df_series: cleaned column of strings or of a native numeric dtype
+        :type df_series: pandas.core.series.Series
+        """
+        self.name = df_series.name
+        self._str_series: pd.Series | None = None
+        self._native_series: pd.Series | None = None
+        self._parsed_floats: tuple[np.ndarray, np.ndarray] | None = None
+        self._numeric_type_masks: tuple[
+            np.ndarray, np.ndarray, np.ndarray
+        ] | None = None
+        self._str_lengths: pd.Series | None = None
+        self._value_counts: pd.Series | None = None
+        if self.is_native_numeric(df_series):
+            self._native_series = df_series
+        else:
+            self._str_series = df_series
+
+    def __len__(self) -> int:
+        """Return the number of values in the column."""
+        return len(self.series)
+
+    @staticmethod
+    def is_native_numeric(df_series: pd.Series) -> bool:
+        """
+        Return True if the series has a native int or float64 dtype.
+
+        Lower precision floats are excluded as their string representation
+        does not parse back into the same float64 value.
+
+        :param df_series: series to check
+        :type df_series: pandas.core.series.Series
+        :rtype: bool
+        """
+        dtype = df_series.dtype
+        return isinstance(dtype, np.dtype) and (
+            dtype.kind in "iu" or dtype == np.float64
+        )
+
+    @classmethod
+    def from_series(cls, df_series: pd.Series | ColumnView) -> ColumnView:
+        """
+        Return the view of a column, creating it if not already a view.
+
+        :param df_series: column or view of a column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
+        :rtype: ColumnView
+        """
+        if isinstance(df_series, ColumnView):
+            return df_series
+        return cls(df_series)
+
+    @property
+    def series(self) -> pd.Series:
+        """Return the column as natively typed values if possible else strings."""
+        if self._native_series is not None:
+            return self._native_series
+        return self.str_series
+
+    @property
+    def native_series(self) -> pd.Series | None:
+        """Return the column with its native numeric dtype if it has one."""
+        return self._native_series
+
+    @property
+    def str_series(self) -> pd.Series:
+        """Return the column as strings."""
+        if self._str_series is None:
+            self._str_series = cast(pd.Series, self._native_series).apply(str)
+            self._str_series = self._str_series.astype(object)
+        return self._str_series
+
+    @property
+    def parsed_floats(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the column as floats and the mask of convertible values."""
+        if self._parsed_floats is None:
+            self._parsed_floats = utils.parse_floats(self.series)
+        return self._parsed_floats
+
+    @property
+    def float_values(self) -> np.ndarray:
+        """Return the column as floats, NaN where not convertible to a float."""
+        return self.parsed_floats[0]
+
+    @property
+    def numeric_type_masks(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the int, float and text masks of the column."""
+        if self._numeric_type_masks is None:
+            self._numeric_type_masks = utils.get_numeric_type_masks(
+                self.series, self.parsed_floats
+            )
+        return self._numeric_type_masks
+
+    @property
+    def str_lengths(self) -> pd.Series:
+        """Return the length of each string in the column."""
+        if self._str_lengths is None:
+            self._str_lengths = self.str_series.str.len()
+        return self._str_lengths
+
+    @property
+    def value_counts(self) -> pd.Series:
+        """Return the count of each unique string in the column."""
+        if self._value_counts is None:
+            self._value_counts = self.str_series.value_counts(dropna=False)
+        return self._value_counts
+
+
 class BaseColumnProfiler(Generic[BaseColumnProfilerT], metaclass=abc.ABCMeta):
     """Abstract class for profiling a column of data."""
 
@@ -285,6 +406,17 @@ class BaseColumnPrimitiveTypeProfiler(
         self.match_count += profile.pop("match_count")
         BaseColumnProfiler._update_column_base_properties(self, profile)
 
+    def _count_matches(self, column_view: ColumnView) -> int:
+        """
+        Count the values of a column which match the data type of the profile.
+
+        :param column_view: view of the column
+        :type column_view: ColumnView
+        :return: number of matching values
+        :rtype: int
+        """
+        return len(column_view)
+
     def _add_helper(
         self,
         other1: BaseColumnPrimitiveTypeProfilerT,
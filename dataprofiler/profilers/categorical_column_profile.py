@@ -1,6 +1,7 @@
 """Contains class for categorical column profiler."""
 from __future__ import annotations
 
+import copy
 from collections import defaultdict
 from operator import itemgetter
 from typing import cast
@@ -8,7 +9,9 @@ from typing import cast
 from pandas import DataFrame, Series
 
 from . import BaseColumnProfiler, utils
+from .base_column_profilers import ColumnView
 from .profiler_options import CategoricalOptions
+from .sketches import HeavyHitterSketch
 
 
 class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
@@ -52,8 +55,18 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
 
         self._stopped_at_unique_ratio: float | None = None
         self._stopped_at_unique_count: int | None = None
+
+        # Sketch of the most frequent categories, kept instead of exact counts
+        self._heavy_hitters: HeavyHitterSketch | None = None
         if options:
             self._top_k_categories = options.top_k_categories
+            if options.heavy_hitters.is_enabled:
+                self._heavy_hitters = HeavyHitterSketch(
+                    capacity=options.heavy_hitters.capacity,
+                    width=options.heavy_hitters.width,
+                    depth=options.heavy_hitters.depth,
+                    seed=options.heavy_hitters.seed,
+                )
             self.stop_condition_unique_value_ratio = (
                 options.stop_condition_unique_value_ratio
             )
@@ -85,9 +98,15 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
         )
         # If both profiles have not met stop condition
         if not (self._stop_condition_is_met or other._stop_condition_is_met):
-            merged_profile._categories = utils.add_nested_dictionaries(
-                self._categories, other._categories
-            )
+            if self._heavy_hitters is not None or other._heavy_hitters is not None:
+                merged_profile._heavy_hitters = self._merge_heavy_hitters(other)
+                merged_profile._categories = merged_profile._heavy_hitters.top_counts()[
+                    0
+                ]
+            else:
+                merged_profile._categories = utils.add_nested_dictionaries(
+                    self._categories, other._categories
+                )
 
             # Transfer stop condition variables of 1st profile object to merged profile
             # if they are not None else set to 2nd profile
@@ -133,6 +152,27 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
 
         return merged_profile
 
+    def _merge_heavy_hitters(self, other: CategoricalColumn) -> HeavyHitterSketch:
+        """
+        Merge the category counts of two profiles, one of them being sketched.
+
+        The exact counts of a profile without a sketch are added to the
+        sketch of the other.
+
+        :param other: profile being merged with this one
+        :type other: CategoricalColumn
+        :return: sketch of the categories of both profiles
+        :rtype: HeavyHitterSketch
+        """
+        if self._heavy_hitters is None:
+            return other._merge_heavy_hitters(self)
+        merged_sketch = copy.deepcopy(self._heavy_hitters)
+        if other._heavy_hitters is not None:
+            merged_sketch.merge(other._heavy_hitters)
+        else:
+            merged_sketch.update(other._categories)
+        return merged_sketch
+
     def diff(self, other_profile: CategoricalColumn, options: dict = None) -> dict:
         """
         Find the differences for CategoricalColumns.
@@ -234,11 +274,17 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
             profile["statistics"]["categories"] = self.categories
             profile["statistics"]["gini_impurity"] = self.gini_impurity
             profile["statistics"]["unalikeability"] = self.unalikeability
-            profile["statistics"]["categorical_count"] = dict(
-                sorted(self._categories.items(), key=itemgetter(1), reverse=True)[
-                    : self._top_k_categories
-                ]
-            )
+            if self._heavy_hitters is not None:
+                (
+                    profile["statistics"]["categorical_count"],
+                    profile["statistics"]["categorical_count_error"],
+                ) = self._heavy_hitters.top_counts(self._top_k_categories)
+            else:
+                profile["statistics"]["categorical_count"] = dict(
+                    sorted(self._categories.items(), key=itemgetter(1), reverse=True)[
+                        : self._top_k_categories
+                    ]
+                )
         return profile
 
     @property
@@ -258,15 +304,21 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
             return cast(float, self._stopped_at_unique_ratio)
 
         if self.sample_size:
-            return len(self.categories) / self.sample_size
+            return self.unique_count / self.sample_size
         return 0
 
     @property
     def unique_count(self) -> int:
-        """Return ratio of unique categories to sample_size."""
+        """
+        Return the number of unique categories.
+
+        Estimated once the sketch of the categories no longer holds them all.
+        """
         if self._stop_condition_is_met:
             return cast(int, self._stopped_at_unique_count)
 
+        if self._heavy_hitters is not None:
+            return self._heavy_hitters.distinct_count()
         return len(self.categories)
 
     @property
@@ -276,7 +328,7 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
             return False
 
         is_match = False
-        unique = len(self._categories)
+        unique = self.unique_count
         if unique <= self._MAXIMUM_UNIQUE_VALUES_TO_CLASSIFY_AS_CATEGORICAL:
             is_match = True
         elif (
@@ -312,7 +364,7 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
         :type data: DataFrame
         :return: boolean for stop conditions
         """
-        merged_unique_count = len(self._categories)
+        merged_unique_count = self.unique_count
         merged_sample_size = self.sample_size + len(data)
         merged_unique_ratio = merged_unique_count / merged_sample_size
 
@@ -326,7 +378,7 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
     @BaseColumnProfiler._timeit(name="categories")
     def _update_categories(
         self,
-        df_series: DataFrame,
+        df_series: DataFrame | ColumnView,
         prev_dependent_properties: dict = None,
         subset_properties: dict = None,
     ) -> None:
@@ -341,14 +393,21 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
         :param subset_properties: Contains the results of the properties of the
         subset before they are merged into the main data profile.
         :type subset_properties: dict
-        :param df_series: Data to be profiled
-        :type df_series: pandas.DataFrame
+        :param df_series: Data to be profiled or view of the column
+        :type df_series: Union[pandas.DataFrame, ColumnView]
         :return: None
         """
-        category_count = df_series.value_counts(dropna=False).to_dict()
-        self._categories = utils.add_nested_dictionaries(
-            self._categories, category_count
-        )
+        if isinstance(df_series, ColumnView):
+            category_count = df_series.value_counts
+        else:
+            category_count = df_series.value_counts(dropna=False)
+        if self._heavy_hitters is not None:
+            self._heavy_hitters.update(category_count)
+            self._categories = self._heavy_hitters.top_counts()[0]
+        else:
+            self._categories = utils.add_nested_dictionaries(
+                self._categories, category_count.to_dict()
+            )
         self._update_stop_condition(df_series)
         if self._stop_condition_is_met:
             self._categories = {}
@@ -365,12 +424,12 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series: Series) -> CategoricalColumn:
+    def update(self, df_series: Series | ColumnView) -> CategoricalColumn:
         """
         Update the column profile.
 
-        :param df_series: Data to profile.
-        :type df_series: pandas.core.series.Series
+        :param df_series: Data to profile or view of the column.
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: updated CategoricalColumn
         :rtype: CategoricalColumn
         """
@@ -378,8 +437,10 @@ class CategoricalColumn(BaseColumnProfiler["CategoricalColumn"]):
         if len(df_series) == 0 or self._stop_condition_is_met:
             return self
 
+        column_view = ColumnView.from_series(df_series)
+        df_series = column_view.str_series
         profile = dict(sample_size=len(df_series))
-        CategoricalColumn._update_categories(self, df_series)
+        CategoricalColumn._update_categories(self, column_view)
         BaseColumnProfiler._perform_property_calcs(
             self,
             self.__calculations,
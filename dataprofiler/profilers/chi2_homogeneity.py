@@ -0,0 +1,213 @@
+"""Contains the chi-squared tests for homogeneity between categorical columns."""
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import scipy.sparse
+import scipy.stats
+
+
+class Chi2HomogeneityMatrix:
+    """
+    P-values of the chi-squared tests for homogeneity of all column pairs.
+
+    The category counts of each column are kept sparse, as the ids of its
+    categories and their counts, hence the memory grows with the categories
+    of each column rather than with every category seen across the columns.
+    Each changed column is tested against all the others at once over its
+    own categories, the categories of only the other column adding up to a
+    closed form term. Only the pairs involving a column whose sample size
+    changed since the last computation are recomputed.
+
+    The counts are not saved with a profile, hence are rebuilt from the
+    category profiles of all the columns when first updated after a load.
+    """
+
+    # Elements of the pairwise arrays broadcast at once
+    _chunk_size = 2**22
+
+    def __init__(self, column_count: int) -> None:
+        """
+        Initialize the matrix of columns without any category.
+
+        :param column_count: number of columns
+        :type column_count: int
+        """
+        self._category_ids: dict = {}
+        self._column_categories: list[np.ndarray] = [
+            np.empty(0, dtype=np.int64) for _ in range(column_count)
+        ]
+        self._column_counts: list[np.ndarray] = [
+            np.empty(0) for _ in range(column_count)
+        ]
+        self._sample_sizes = np.zeros(column_count)
+        self._is_category = np.zeros(column_count, dtype=bool)
+        self._last_sample_sizes = np.full(column_count, -1.0)
+        self.p_values = np.full((column_count, column_count), np.nan)
+
+    def _set_column(self, idx: int, categories: dict, sample_size: int) -> None:
+        """Set the ids and counts of the categories of a column."""
+        self._column_categories[idx] = np.fromiter(
+            (
+                self._category_ids.setdefault(category, len(self._category_ids))
+                for category in categories
+            ),
+            dtype=np.int64,
+            count=len(categories),
+        )
+        self._column_counts[idx] = np.fromiter(
+            categories.values(), dtype=float, count=len(categories)
+        )
+        self._sample_sizes[idx] = sample_size
+
+    def update(self, columns: list[tuple[dict, int] | None]) -> np.ndarray:
+        """
+        Update the p-values of the pairs of columns which changed.
+
+        :param columns: category counts and sample size of each column, None
+            if the column is not categorical
+        :type columns: list(Union[tuple(dict, int), None])
+        :return: symmetric matrix of p-values, NaN for non-categorical columns
+        :rtype: numpy.ndarray
+        """
+        changed = []
+        for idx, column in enumerate(columns):
+            is_category = column is not None
+            sample_size = column[1] if column is not None else -1
+            if (
+                is_category == self._is_category[idx]
+                and sample_size == self._last_sample_sizes[idx]
+            ):
+                continue
+            changed.append(idx)
+            self._is_category[idx] = is_category
+            self._last_sample_sizes[idx] = sample_size
+            if column is not None:
+                self._set_column(idx, *column)
+
+        changed_ids = np.array(changed, dtype=int)
+        self.p_values[changed_ids, :] = np.nan
+        self.p_values[:, changed_ids] = np.nan
+        changed_ids = changed_ids[self._is_category[changed_ids]]
+        if not len(changed_ids):
+            return self.p_values.copy()
+
+        # Sparse matrices of the counts and presence of the categories of the
+        # categorical columns, sliced by the categories of each changed column
+        category_ids = np.flatnonzero(self._is_category)
+        column_counts = [self._column_counts[idx] for idx in category_ids]
+        num_cats = np.array([len(counts) for counts in column_counts])
+        totals = np.array([counts.sum() for counts in column_counts])
+        zero_cats = np.array(
+            [np.count_nonzero(counts == 0) for counts in column_counts]
+        )
+        indices = np.concatenate([self._column_categories[idx] for idx in category_ids])
+        indptr = np.concatenate([[0], np.cumsum(num_cats)])
+        shape = (len(category_ids), len(self._category_ids))
+        counts = scipy.sparse.csc_matrix(
+            scipy.sparse.csr_matrix(
+                (np.concatenate(column_counts), indices, indptr), shape=shape
+            )
+        )
+        is_present = scipy.sparse.csc_matrix(
+            scipy.sparse.csr_matrix(
+                (np.ones(len(indices), dtype=bool), indices, indptr), shape=shape
+            )
+        )
+
+        for row in changed_ids:
+            positions = self._column_categories[row]
+            row_counts = counts[:, positions].tocsr()
+            row_is_present = is_present[:, positions].tocsr()
+
+            # Chunks of the other columns are tested against the changed one
+            chunk_size = max(1, self._chunk_size // max(1, len(positions)))
+            for start in range(0, len(category_ids), chunk_size):
+                chunk = slice(start, start + chunk_size)
+                p_values = self._get_p_values(
+                    row,
+                    category_ids[chunk],
+                    row_counts[chunk].toarray(),
+                    row_is_present[chunk].toarray(),
+                    totals[chunk],
+                    num_cats[chunk],
+                    zero_cats[chunk],
+                )
+                self.p_values[row, category_ids[chunk]] = p_values
+                self.p_values[category_ids[chunk], row] = p_values
+        return self.p_values.copy()
+
+    def _get_p_values(
+        self,
+        row: int,
+        columns: np.ndarray,
+        counts2: np.ndarray,
+        is_shared: np.ndarray,
+        totals2: np.ndarray,
+        num_cats2: np.ndarray,
+        zero_cats2: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Return the p-values of the tests of a column against each column.
+
+        :param row: index of the column tested
+        :type row: int
+        :param columns: indexes of the columns it is tested against
+        :type columns: numpy.ndarray
+        :param counts2: counts of the categories of the tested column in each
+            of the other columns
+        :type counts2: numpy.ndarray
+        :param is_shared: whether the categories of the tested column are in
+            each of the other columns
+        :type is_shared: numpy.ndarray
+        :param totals2: sum of the counts of each of the other columns
+        :type totals2: numpy.ndarray
+        :param num_cats2: number of categories of each of the other columns
+        :type num_cats2: numpy.ndarray
+        :param zero_cats2: number of categories of a zero count of each of the
+            other columns
+        :type zero_cats2: numpy.ndarray
+        :return: p-value of the test against each column
+        :rtype: numpy.ndarray
+        """
+        is_pair = columns != row
+        counts1 = self._column_counts[row][None, :]
+        sizes1 = self._sample_sizes[row]
+        sizes2 = self._sample_sizes[columns][:, None]
+
+        cat_counts = counts1 + counts2
+        total = sizes1 + sizes2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            expected1 = sizes1 * cat_counts / total
+            expected2 = sizes2 * cat_counts / total
+            terms = (counts1 - expected1) ** 2 / expected1 + (
+                counts2 - expected2
+            ) ** 2 / expected2
+            # Each category of only the other column adds count * size1 / size2
+            other_terms = (totals2 - counts2.sum(axis=-1)) * sizes1 / sizes2[:, 0]
+        chi2_statistics = terms.sum(axis=-1) + other_terms
+
+        num_cats = counts1.shape[1] + num_cats2 - is_shared.sum(axis=-1)
+        if (is_pair & (num_cats <= 1)).any():
+            warnings.warn(
+                "Insufficient number of categories. "
+                "Chi-squared test cannot be performed.",
+                RuntimeWarning,
+            )
+
+        # A zero expected count makes the statistic infinite
+        other_zero_cats = zero_cats2 - (is_shared & (counts2 == 0)).sum(axis=-1)
+        has_zero = (
+            (sizes1 == 0)
+            | (sizes2[:, 0] == 0)
+            | (cat_counts == 0).any(axis=-1)
+            | (other_zero_cats > 0)
+        )
+        with np.errstate(invalid="ignore"):
+            p_values = 1 - scipy.stats.chi2(np.maximum(num_cats - 1, 1)).cdf(
+                chi2_statistics
+            )
+        p_values = np.where(has_zero, 0.0, p_values)
+        p_values = np.where(num_cats > 1, p_values, np.nan)
+        return np.where(is_pair, p_values, 1.0)
@@ -0,0 +1,128 @@
+"""Contains the co-moments of numeric columns accumulated across batches."""
+from __future__ import annotations
+
+import copy
+import warnings
+
+import numpy as np
+
+
+class CoMoments:
+    """
+    Count, means and co-moment matrix of numeric columns.
+
+    The co-moment matrix holds the sums of products of the deviations of each
+    pair of columns from their means, of which the covariance and correlation
+    matrices are derived. Each batch adds a single matrix product of its
+    centered values, and two accumulators are merged exactly by the pairwise
+    formula of Chan et al. A column missing from any batch has NaN moments.
+    """
+
+    def __init__(self, column_count: int) -> None:
+        """
+        Initialize the accumulator of no rows.
+
+        :param column_count: number of columns
+        :type column_count: int
+        """
+        self.count = 0
+        self.mean: np.ndarray = np.zeros(column_count)
+        self.co_moments: np.ndarray = np.zeros((column_count, column_count))
+
+    def update(self, values: np.ndarray, column_ids: list[int] | np.ndarray) -> None:
+        """
+        Accumulate a batch of rows.
+
+        Missing values of a column are imputed with the mean of the column in
+        the batch, hence do not add to the co-moments. Columns not in the
+        batch or without any value in it have NaN moments from then on.
+
+        :param values: batch of rows of the given columns, NaN where missing
+        :type values: numpy.ndarray
+        :param column_ids: index of each column of the values
+        :type column_ids: Union[list(int), numpy.ndarray]
+        """
+        if not len(values):
+            return
+        column_count = len(self.mean)
+        batch = CoMoments(column_count)
+        batch.count = len(values)
+        batch.mean = np.full(column_count, np.nan)
+        batch.co_moments = np.full((column_count, column_count), np.nan)
+
+        is_missing = np.isnan(values)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            means = np.nanmean(values, axis=0)
+        centered = np.where(is_missing, 0.0, values - means)
+        centered[:, np.isnan(means)] = np.nan
+
+        column_ids = np.asarray(column_ids, dtype=int)
+        batch.mean[column_ids] = means
+        batch.co_moments[np.ix_(column_ids, column_ids)] = centered.T @ centered
+        self._merge(batch)
+
+    def _merge(self, other: CoMoments) -> None:
+        """Merge the moments of other rows into these ones."""
+        if not other.count:
+            return
+        if not self.count:
+            self.count = other.count
+            self.mean = other.mean.copy()
+            self.co_moments = other.co_moments.copy()
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.co_moments = (
+            self.co_moments
+            + other.co_moments
+            + np.outer(delta, delta) * (self.count * other.count / count)
+        )
+        self.mean = self.mean + delta * (other.count / count)
+        self.count = count
+
+    def reorder(self, column_ids: list[int] | np.ndarray) -> CoMoments:
+        """
+        Return the moments with their columns reordered.
+
+        :param column_ids: index of the column now at each position
+        :type column_ids: Union[list(int), numpy.ndarray]
+        :return: reordered moments
+        :rtype: CoMoments
+        """
+        column_ids = np.asarray(column_ids, dtype=int)
+        reordered = CoMoments(len(column_ids))
+        reordered.count = self.count
+        reordered.mean = self.mean[column_ids]
+        reordered.co_moments = self.co_moments[np.ix_(column_ids, column_ids)]
+        return reordered
+
+    def __add__(self, other: CoMoments) -> CoMoments:
+        """
+        Merge two accumulators together overriding the `+` operator.
+
+        :param other: moments of the same columns from other rows
+        :type other: CoMoments
+        :return: moments of the rows of both
+        :rtype: CoMoments
+        """
+        merged = copy.deepcopy(self)
+        merged._merge(other)
+        return merged
+
+    def correlation(self) -> np.ndarray:
+        """
+        Return the Pearson correlation matrix of the columns.
+
+        :return: correlation matrix, NaN for columns without variance
+        :rtype: numpy.ndarray
+        """
+        std = np.sqrt(np.diag(self.co_moments))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr_mat = np.clip(self.co_moments / np.outer(std, std), -1, 1)
+        np.fill_diagonal(corr_mat, 1.0)
+        has_variance = std > 0
+        corr_mat[~has_variance, :] = np.nan
+        corr_mat[:, ~has_variance] = np.nan
+        return corr_mat
@@ -0,0 +1,361 @@
+"""Contains the persistent executors profiling the columns in parallel."""
+from __future__ import annotations
+
+import sys
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.pool import AsyncResult, Pool, ThreadPool
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import psutil
+import pyarrow as pa
+
+from . import utils
+from .base_column_profilers import ColumnView
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to a shared memory block without tracking it in this process.
+
+    Only the process creating a block unlinks it, whereas a worker tracking
+    it would either have its own resource tracker unlink the block as leaked
+    once the worker exits, or unregister the block of the owner if both share
+    the same tracker.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedArray:
+    """
+    Picklable handle to a numpy array copied into shared memory.
+
+    The process creating the handle owns the shared memory block and must
+    unlink it once the workers are done with the array, while workers only
+    map the block without copying it.
+    """
+
+    def __init__(self, array: np.ndarray) -> None:
+        """
+        Copy the array into a new shared memory block.
+
+        :param array: array of a native dtype to share
+        :type array: numpy.ndarray
+        """
+        array = np.ascontiguousarray(array)
+        self.dtype: np.dtype = array.dtype
+        self.shape: tuple[int, ...] = array.shape
+        self.nbytes: int = array.nbytes
+        self._memory: shared_memory.SharedMemory | None = shared_memory.SharedMemory(
+            create=True, size=max(self.nbytes, 1)
+        )
+        self.name: str = self._memory.name
+        if self.nbytes:
+            shared: np.ndarray = np.ndarray(
+                self.shape, dtype=self.dtype, buffer=self._memory.buf
+            )
+            shared[...] = array
+
+    def __getstate__(self) -> dict:
+        """Return the state of the handle without the owned memory block."""
+        state = self.__dict__.copy()
+        state["_memory"] = None
+        return state
+
+    def load(self) -> np.ndarray:
+        """
+        Map the shared array without copying it.
+
+        The array is a read-only view of the shared memory block, which stays
+        attached until the array and its views are released.
+
+        :return: view of the shared array
+        :rtype: numpy.ndarray
+        """
+        memory = _attach_shared_memory(self.name)
+        array: np.ndarray = np.ndarray(self.shape, dtype=self.dtype, buffer=memory.buf)
+        array.flags.writeable = False
+        # Views keep the array referenced as their base
+        weakref.finalize(array, memory.close)
+        return array
+
+    def unlink(self) -> None:
+        """Free the shared memory block if owned by this process."""
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+
+class SharedSeries:
+    """
+    Picklable handle to a column copied into shared memory.
+
+    Native numeric and datetime columns are shared as their raw values, while
+    columns of strings are shared as the offsets and data buffers of an Arrow
+    string array. Columns which can be shared neither way raise a ValueError.
+    """
+
+    def __init__(self, df_series: pd.Series | ColumnView) -> None:
+        """
+        Copy the column into shared memory.
+
+        :param df_series: column or view of a column to share
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
+        """
+        self.is_view = isinstance(df_series, ColumnView)
+        if isinstance(df_series, ColumnView):
+            df_series = df_series.series
+        self.name = df_series.name
+        self.length = len(df_series)
+        self._arrays: list[SharedArray] = []
+        self._arrow_type: pa.DataType | None = None
+
+        if not self._is_native(df_series.dtype):
+            try:
+                strings = pa.array(df_series.to_numpy(), from_pandas=True)
+            except pa.ArrowException:
+                strings = None
+            # NaN and None would both be restored as None, hence only shared
+            # if no value is null
+            if (
+                strings is None
+                or not isinstance(strings, pa.Array)
+                or not pa.types.is_string(strings.type)
+                or strings.null_count
+                or strings.offset
+            ):
+                raise ValueError("Column can only be shared if native or strings.")
+            self._arrow_type = strings.type
+            _, offsets, data = strings.buffers()
+            values: list[np.ndarray] = [
+                np.frombuffer(offsets, dtype=np.int32)[: self.length + 1],
+                np.frombuffer(data, dtype=np.uint8) if data else np.empty(0, np.uint8),
+            ]
+        else:
+            values = [df_series.to_numpy()]
+
+        # Share the index as well unless it is cheap to pickle or not native
+        index = df_series.index
+        self._index: pd.Index | None = index
+        if (
+            not isinstance(index, pd.RangeIndex)
+            and index.nlevels == 1
+            and self._is_native(index.dtype)
+        ):
+            self._index_name = index.name
+            self._index = None
+            values.append(index.to_numpy())
+
+        try:
+            for array in values:
+                self._arrays.append(SharedArray(array))
+        except Exception:
+            self.unlink()
+            raise
+
+    @staticmethod
+    def _is_native(dtype: Any) -> bool:
+        """Return True if the dtype is a numpy bool, numeric or datetime."""
+        return isinstance(dtype, np.dtype) and dtype.kind in "biufmM"
+
+    def load(self) -> pd.Series | ColumnView:
+        """
+        Rebuild the column out of shared memory.
+
+        Native columns and indexes are views of the shared values, while
+        strings are copied into objects.
+
+        :return: shared column
+        :rtype: Union[pandas.core.series.Series, ColumnView]
+        """
+        arrays = [array.load() for array in self._arrays]
+        index = self._index
+        if index is None:
+            index = pd.Index(arrays.pop(), name=self._index_name, copy=False)
+        if self._arrow_type is not None:
+            strings = pa.Array.from_buffers(
+                self._arrow_type,
+                self.length,
+                [None, pa.py_buffer(arrays[0]), pa.py_buffer(arrays[1])],
+            )
+            values = strings.to_numpy(zero_copy_only=False)
+            df_series = pd.Series(values, index=index, name=self.name, dtype=object)
+        else:
+            df_series = pd.Series(arrays[0], index=index, name=self.name, copy=False)
+        if self.is_view:
+            return ColumnView(df_series)
+        return df_series
+
+    def unlink(self) -> None:
+        """Free the shared memory blocks if owned by this process."""
+        for array in self._arrays:
+            array.unlink()
+
+
+def _run_task(func: Callable, args: tuple) -> Any:
+    """Load the shared arguments of a task in the worker and run it."""
+    loaded_args = [
+        arg.load() if isinstance(arg, (SharedArray, SharedSeries)) else arg
+        for arg in args
+    ]
+    return func(*loaded_args)
+
+
+class ColumnExecutor:
+    """
+    Persistent pool of processes or threads which profiles columns in parallel.
+
+    The pool is created on the first batch which warrants it and reused by
+    every following batch, as opposed to spawning new processes for each
+    batch. Columns and arrays sent to worker processes are copied into shared
+    memory once per batch, such that profilers of the same column do not each
+    pickle it through the pool, while threads simply share the data. The
+    executor is never pickled with its pool.
+    """
+
+    # Arguments smaller than this are cheaper to pickle than to share
+    _min_shared_nbytes = 2**16
+
+    def __init__(self, backend: str = "process", max_pool_size: int = None) -> None:
+        """
+        Initialize the executor without starting the pool.
+
+        :param backend: whether the pool runs processes or threads
+            ("process" | "thread")
+        :type backend: str
+        :param max_pool_size: max number of threads of a thread pool, the
+            number of processes being suggested from the available resources
+        :type max_pool_size: int
+        """
+        if backend not in ["process", "thread"]:
+            raise ValueError("The backend must be either 'process' or 'thread'.")
+        self.backend = backend
+        self.max_pool_size = max_pool_size
+        self._pool: Pool | None = None
+        self.pool_size: int | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._shared: dict[int, tuple[Any, SharedArray | SharedSeries | None]] = {}
+
+    def __getstate__(self) -> dict:
+        """Return the state of an executor without a pool."""
+        return {
+            "backend": self.backend,
+            "max_pool_size": self.max_pool_size,
+            "_pool": None,
+            "pool_size": None,
+            "_finalizer": None,
+            "_shared": {},
+        }
+
+    @property
+    def is_active(self) -> bool:
+        """Return True if the pool is running."""
+        return self._pool is not None
+
+    def _generate_thread_pool(self, cols: int = None) -> tuple[Pool | None, int]:
+        """Generate a pool of threads bound by the CPUs rather than memory."""
+        try:
+            pool_size = psutil.cpu_count() - 1
+        except (NotImplementedError, TypeError):
+            pool_size = 0
+        if cols is not None:
+            pool_size = min(pool_size, cols)
+        if self.max_pool_size is not None:
+            pool_size = min(pool_size, self.max_pool_size)
+        if pool_size < 1:
+            return None, pool_size
+        return ThreadPool(pool_size), pool_size
+
+    def start(self, data_size: int = None, cols: int = None) -> bool:
+        """
+        Start the pool unless already running.
+
+        :param data_size: estimated size of the dataset
+        :type data_size: int
+        :param cols: columns of the dataset
+        :type cols: int
+        :return: whether the pool is running
+        :rtype: bool
+        """
+        if self._pool is None:
+            if self.backend == "thread":
+                self._pool, self.pool_size = self._generate_thread_pool(cols)
+            else:
+                self._pool, self.pool_size = utils.generate_pool(
+                    max_pool_size=None, data_size=data_size, cols=cols
+                )
+            if self._pool is not None:
+                self._finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool is not None
+
+    def _share(self, arg: Any) -> Any:
+        """Return the handle to the shared copy of the argument if worthwhile."""
+        if self.backend == "thread" or not isinstance(
+            arg, (pd.Series, ColumnView, np.ndarray)
+        ):
+            return arg
+        if id(arg) in self._shared:
+            return self._shared[id(arg)][1] or arg
+
+        handle: SharedArray | SharedSeries | None = None
+        if isinstance(arg, np.ndarray):
+            if arg.nbytes >= self._min_shared_nbytes and SharedSeries._is_native(
+                arg.dtype
+            ):
+                handle = SharedArray(arg)
+        else:
+            df_series = arg.series if isinstance(arg, ColumnView) else arg
+            if (
+                df_series.memory_usage(index=False, deep=False)
+                >= self._min_shared_nbytes
+            ):
+                try:
+                    handle = SharedSeries(arg)
+                except ValueError:
+                    handle = None
+
+        # Keep the argument referenced such that its id is not reused
+        self._shared[id(arg)] = (arg, handle)
+        return handle or arg
+
+    def apply_async(self, func: Callable, args: tuple = ()) -> AsyncResult:
+        """
+        Submit a task to the pool, sharing its large arguments.
+
+        :param func: function to run in a worker, picklable if in a process
+        :type func: Callable
+        :param args: arguments of the function
+        :type args: tuple
+        :return: pending result of the task
+        :rtype: multiprocessing.pool.AsyncResult
+        """
+        if self._pool is None:
+            raise RuntimeError("The executor must be started to submit tasks.")
+        shared_args = tuple(self._share(arg) for arg in args)
+        return self._pool.apply_async(_run_task, (func, shared_args))
+
+    def release(self) -> None:
+        """Free the shared memory of the batch once its tasks are collected."""
+        for _, handle in self._shared.values():
+            if handle is not None:
+                handle.unlink()
+        self._shared = {}
+
+    def close(self) -> None:
+        """Free the shared memory and terminate the pool."""
+        self.release()
+        if self._finalizer is not None:
+            self._finalizer()
+        self._pool = None
+        self.pool_size = None
+        self._finalizer = None
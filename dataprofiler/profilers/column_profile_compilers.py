@@ -4,18 +4,26 @@ from __future__ import annotations
 import abc
 from collections import OrderedDict
 from multiprocessing.pool import Pool
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, cast
 
 from pandas import Series
 
+from .. import settings
 from . import utils
+from .base_column_profilers import ColumnView
 from .categorical_column_profile import CategoricalColumn
+from .column_executor import ColumnExecutor
 from .data_labeler_column_profile import DataLabelerColumn
 from .datetime_column_profile import DateTimeColumn
 from .float_column_profile import FloatColumn
 from .int_column_profile import IntColumn
 from .order_column_profile import OrderColumn
-from .profiler_options import BaseOption, StructuredOptions, UnstructuredOptions
+from .profiler_options import (
+    BaseOption,
+    StructuredOptions,
+    TypeProbingOptions,
+    UnstructuredOptions,
+)
 from .text_column_profile import TextColumn
 from .unstructured_labeler_profile import UnstructuredLabelerProfile
 from .unstructured_text_profile import TextProfiler
@@ -37,9 +45,9 @@ class BaseCompiler(Generic[BaseCompilerT], metaclass=abc.ABCMeta):
 
     def __init__(
         self,
-        df_series: Series = None,
+        df_series: Series | ColumnView = None,
         options: StructuredOptions = None,
-        pool: Pool = None,
+        pool: Pool | ColumnExecutor | None = None,
     ) -> None:
         """Initialize BaseCompiler object."""
         if not self._profilers:
@@ -70,13 +78,16 @@ class BaseCompiler(Generic[BaseCompilerT], metaclass=abc.ABCMeta):
         return self.report(remove_disabled_flag=False)
 
     def _create_profile(
-        self, df_series: Series, options: StructuredOptions = None, pool: Pool = None
+        self,
+        df_series: Series | ColumnView,
+        options: StructuredOptions = None,
+        pool: Pool | ColumnExecutor | None = None,
     ) -> None:
         """
         Initialize and evaluate all profilers for the given dataframe.
 
         :param df_series: a given column
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :param options: Options for the structured profiler
         :type options: StructuredOptions
         :return: None
@@ -158,26 +169,40 @@ class BaseCompiler(Generic[BaseCompilerT], metaclass=abc.ABCMeta):
             )
         return {}
 
+    def _get_profile_data(self, df_series: Series | ColumnView) -> dict:
+        """
+        Return the data to update each of the profiles with.
+
+        :param df_series: a given column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
+        :return: the data for each profile type
+        :rtype: dict
+        """
+        return {profile_type: df_series for profile_type in self._profiles}
+
     def update_profile(
-        self, df_series: Series, pool: Pool = None
+        self, df_series: Series | ColumnView, pool: Pool | ColumnExecutor | None = None
     ) -> BaseCompiler | None:
         """
         Update the profiles from the data frames.
 
-        :param df_series: a given column, assume df_series in str
-        :type df_series: pandas.core.series.Series
+        :param df_series: a given column, assume df_series in str unless given
+            as a view of the column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :param pool: pool to utilized for multiprocessing
-        :type pool: multiprocessing.Pool
+        :type pool: Union[multiprocessing.Pool, ColumnExecutor]
         :return: Self
         :rtype: BaseCompiler
         """
         if not self._profilers:
             return None
 
+        profile_data = self._get_profile_data(df_series)
+
         # If single process, loop and return
         if pool is None:
             for profile_type in self._profiles:
-                self._profiles[profile_type].update(df_series)
+                self._profiles[profile_type].update(profile_data[profile_type])
             return self
 
         # If multiprocess, setup pool, etc
@@ -191,7 +216,8 @@ class BaseCompiler(Generic[BaseCompilerT], metaclass=abc.ABCMeta):
 
                 try:  # Add update function to be applied on the pool
                     multi_process_dict[profile_type] = pool.apply_async(
-                        self._profiles[profile_type].update, (df_series,)
+                        self._profiles[profile_type].update,
+                        (profile_data[profile_type],),
                     )
                 except Exception:  # Attempt again as a single process
                     self._profiles[profile_type].thread_safe = False
@@ -201,7 +227,7 @@ class BaseCompiler(Generic[BaseCompilerT], metaclass=abc.ABCMeta):
 
         # Single process thread to loop through any known unsafe
         for profile_type in single_process_list:
-            self._profiles[profile_type].update(df_series)
+            self._profiles[profile_type].update(profile_data[profile_type])
 
         # Loop through remaining multi-processes and close them out
         single_process_list = []
@@ -216,7 +242,7 @@ class BaseCompiler(Generic[BaseCompilerT], metaclass=abc.ABCMeta):
 
                 # Single process thread to loop through
         for profile_type in single_process_list:
-            self._profiles[profile_type].update(df_series)
+            self._profiles[profile_type].update(profile_data[profile_type])
         return self
 
 
@@ -233,6 +259,71 @@ class ColumnPrimitiveTypeProfileCompiler(
         TextColumn,
     ]
     _option_class = StructuredOptions
+    _type_probing: TypeProbingOptions | None = None
+
+    def __init__(
+        self,
+        df_series: Series | ColumnView = None,
+        options: StructuredOptions = None,
+        pool: Pool | ColumnExecutor | None = None,
+    ) -> None:
+        """Initialize ColumnPrimitiveTypeProfileCompiler object."""
+        if (
+            options
+            and isinstance(options, self._option_class)
+            and options.type_probing.is_enabled
+        ):
+            self._type_probing = options.type_probing
+        super().__init__(df_series, options, pool)
+
+    def __add__(self, other: BaseCompiler) -> BaseCompiler:
+        """
+        Merge two profile compilers together overriding the `+` operator.
+
+        :param other: profile compiler being add to this one.
+        :type other: ColumnPrimitiveTypeProfileCompiler
+        :return: merger of the two column profilers
+        """
+        # The base merge ensures both compilers are of the same type
+        merged_profile_compiler = cast(
+            ColumnPrimitiveTypeProfileCompiler, super().__add__(other)
+        )
+        merged_profile_compiler._type_probing = (
+            self._type_probing
+            or cast(ColumnPrimitiveTypeProfileCompiler, other)._type_probing
+        )
+        return merged_profile_compiler
+
+    def _get_profile_data(self, df_series: Series | ColumnView) -> dict:
+        """
+        Return the data to update each of the profiles with.
+
+        If type probing is enabled, the profiles not matching their data type
+        for all values of a random probe cannot be the data type of the
+        column, hence they are only updated with a random sample containing
+        the probe, which keeps their data type ratio below 1.
+
+        :param df_series: a given column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
+        :return: the data for each profile type
+        :rtype: dict
+        """
+        type_probing = self._type_probing
+        if type_probing is None or len(df_series) <= type_probing.sample_size:
+            return super()._get_profile_data(df_series)
+
+        column_view = ColumnView.from_series(df_series)
+        profile_data = super()._get_profile_data(column_view)
+
+        sample = column_view.series.sample(
+            type_probing.sample_size, random_state=settings._seed
+        )
+        sample_view = ColumnView(sample)
+        probe_view = ColumnView(sample.iloc[: type_probing.probe_size])
+        for profile_type, profiler in self._profiles.items():
+            if profiler._count_matches(probe_view) < len(probe_view):
+                profile_data[profile_type] = sample_view
+        return profile_data
 
     def report(self, remove_disabled_flag: bool = False) -> dict:
         """
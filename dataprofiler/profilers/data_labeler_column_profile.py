@@ -10,6 +10,7 @@ from pandas import DataFrame, Series
 from ..labelers.base_data_labeler import BaseDataLabeler
 from ..labelers.data_labelers import DataLabeler
 from . import BaseColumnProfiler, utils
+from .base_column_profilers import ColumnView
 from .profiler_options import DataLabelerOptions
 
 
@@ -406,18 +407,21 @@ class DataLabelerColumn(BaseColumnProfiler["DataLabelerColumn"]):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series: Series) -> DataLabelerColumn:
+    def update(self, df_series: Series | ColumnView) -> DataLabelerColumn:
         """
         Update the column profile.
 
-        :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :param df_series: df series or view of the column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: updated DataLabelerColumn
         :rtype: DataLabelerColumn
         """
         if len(df_series) == 0:
             return self
 
+        if isinstance(df_series, ColumnView):
+            df_series = df_series.str_series
+
         sample_size = min(len(df_series), self._max_sample_size)
         df_series = df_series.sample(sample_size)
 
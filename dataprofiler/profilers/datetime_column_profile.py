@@ -4,12 +4,23 @@ from __future__ import annotations
 import datetime
 import re
 import warnings
+from collections import defaultdict
 
 import numpy as np
 import pandas as pd
 
+try:
+    # Private module of CPython which builds the regexes used by `strptime`
+    from _strptime import TimeRE  # type: ignore
+except ImportError:
+    TimeRE = None
+
 from . import utils
-from .base_column_profilers import BaseColumnPrimitiveTypeProfiler, BaseColumnProfiler
+from .base_column_profilers import (
+    BaseColumnPrimitiveTypeProfiler,
+    BaseColumnProfiler,
+    ColumnView,
+)
 from .profiler_options import DateTimeOptions
 
 
@@ -49,9 +60,11 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler["DateTimeColumn"]):
     ]
 
     _compiled_day_suffix_regex = re.compile(
-        r"(\d{1,2})(" + "|".join(_day_suffixes) + ")"
+        r"(?<=\d)(?:" + "|".join(_day_suffixes) + ")"
     )
 
+    _date_format_regexes: dict[str, re.Pattern] = {}
+
     def __init__(self, name: str | None, options: DateTimeOptions = None) -> None:
         """
         Initialize it and the column base properties.
@@ -71,6 +84,8 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler["DateTimeColumn"]):
         self.max = None
         self._dt_obj_min = None  # datetime obj of min
         self._dt_obj_max = None  # datetime obj of max
+        # matches of each date format, used to check the likeliest formats first
+        self._date_format_counts: dict[str, int] = {}
 
         self.__calculations: dict = {}
         self._filter_properties_w_options(self.__calculations, options)
@@ -117,6 +132,9 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler["DateTimeColumn"]):
         merged_profile.date_formats = utils._combine_unique_sets(
             self.date_formats, other.date_formats
         )
+        merged_profile._date_format_counts = utils.add_nested_dictionaries(
+            self._date_format_counts, other._date_format_counts
+        )
         return merged_profile
 
     def report(self, remove_disabled_flag: bool = False) -> dict:
@@ -199,126 +217,193 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler["DateTimeColumn"]):
 
         return converted_date
 
-    @staticmethod
-    def _replace_day_suffix(date: str, pattern: re.Pattern) -> str | float:
+    @classmethod
+    def _get_date_format_regex(cls, date_format: str) -> re.Pattern | None:
         """
-        Check the date for a suffix after the day. Remove suffix if present.
+        Return the regex used by `datetime.strptime` to match a date format.
 
-        :param date: a string that is possibly a date
-        :type date: str
-        :param pattern: precompiled regex pattern that is used to check for day suffixes
-        :type pattern: Pattern
-        :return: either the date string passed in, or Nan
+        :param date_format: a date format that will be checked against dates
+        :type date_format: str
+        :return: precompiled regex which fully matches the dates of the format,
+            None if the regexes of `strptime` are not available
+        :rtype: Union[Pattern, None]
         """
-        try:
-            new_date: str | float = pattern.sub(r"\1", date)
-        except (TypeError):
-            new_date = np.nan
-        return new_date
+        if TimeRE is None:
+            return None
+        if date_format not in cls._date_format_regexes:
+            cls._date_format_regexes[date_format] = TimeRE().compile(date_format)
+        return cls._date_format_regexes[date_format]
+
+    @classmethod
+    def _parse_dates(cls, df_series: pd.Series, date_format: str) -> pd.Series:
+        """
+        Convert the strings of a column matching a date format to datetimes.
+
+        `pd.to_datetime` leniently parses ISO dates regardless of the format,
+        hence only the strings fully matching the format are parsed. Dates out
+        of the bounds of `pd.Timestamp` are converted with `strptime`, as are
+        all the strings if the regexes of `strptime` are not available.
+
+        :param df_series: a column of strings
+        :type df_series: pandas.core.series.Series
+        :param date_format: a date format that will be checked against dates
+        :type date_format: str
+        :return: the datetimes of the strings matching the format, NaN if the
+            matching string is not a valid date
+        :rtype: pandas.core.series.Series
+        """
+        date_format_regex = cls._get_date_format_regex(date_format)
+        if date_format_regex is None:
+            return df_series.apply(lambda x: cls._validate_datetime(x, date_format))
+
+        df_series = df_series[df_series.str.fullmatch(date_format_regex)]
+        dates = pd.to_datetime(df_series, format=date_format, errors="coerce")
+
+        null_dates = dates.isnull()
+        if null_dates.any():
+            dates = dates.astype(object)
+            dates[null_dates] = df_series[null_dates].apply(
+                lambda x: cls._validate_datetime(x, date_format)
+            )
+        return dates
 
     @classmethod
-    def _get_datetime_profile(cls, df_series: pd.Series) -> dict:
+    def _get_datetime_profile(
+        cls, df_series: pd.Series, date_formats: list[str] | None = None
+    ) -> dict:
         """
         Determine for each val in a col its format and if it's a datetime.
 
-        Also collect datetime stats for the column.
+        Also collect datetime stats for the column. Each date is attributed to
+        the first format of `_date_formats` it matches, independent of the
+        order in which the formats are checked.
 
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
+        :param date_formats: the date formats in the order to check them,
+            defaults to `_date_formats`
+        :type date_formats: list[str]
         :return: parameters for datetime columns
         :rtype: dict
         """
+        if date_formats is None:
+            date_formats = cls._date_formats
+
         profile: dict = dict()
         activated_date_formats: list = list()
-        len_df = len(df_series)
+        date_format_counts: dict = dict()
+        min_values: list = list()
+        max_values: list = list()
 
-        is_row_datetime = pd.Series(np.full((len(df_series)), False))
+        df_series = df_series.reset_index(drop=True)
+        df_dates = df_series[df_series.map(type).eq(str)].astype(object)
+        # Every date format contains digits, other strings cannot be dates
+        df_dates = df_dates[df_dates.str.contains(r"\d", regex=True)]
+        df_dates = df_dates.str.replace(cls._compiled_day_suffix_regex, "", regex=True)
 
-        min_value = None
-        max_value = None
-        min_value_obj = datetime.datetime.max
-        max_value_obj = datetime.datetime.min
-        for date_format in cls._date_formats:
-            if is_row_datetime.all():
+        for date_format in date_formats:
+            if df_dates.empty:
                 break
-            valid_dates = df_series.apply(
-                lambda x: cls._validate_datetime(
-                    cls._replace_day_suffix(  # type: ignore
-                        x, cls._compiled_day_suffix_regex
-                    ),
-                    date_format,
-                )
-            )
-
-            df_dates = valid_dates[~valid_dates.isnull()]
+            valid_dates = cls._parse_dates(df_dates, date_format)
+            valid_dates = valid_dates[valid_dates.notnull()]
+            if valid_dates.empty:
+                continue
 
-            if "%b" in date_format and not df_dates.empty:
+            if "%b" in date_format:
                 may_month = 5  # May can be %b or %B we want to force, so check
-                all_may = df_dates.apply(lambda x: x.month == may_month).all()
-                if all_may:
-                    valid_dates[:] = np.nan
-                    df_dates = pd.Series([], dtype=object)
-
-            # Create mask to avoid null dates
-            null_date_mask = valid_dates.isnull()
-            np_date_array = df_dates.values
+                if all(date.month == may_month for date in valid_dates):
+                    continue
 
             # check off any values which were found to be datetime
-            is_row_datetime[~is_row_datetime] = (~null_date_mask).values
-
-            if len(df_dates) > 0:
-
-                # Converts to numpy prior to finding max index
-                min_idx = np.argmin(np_date_array)
-                max_idx = np.argmax(np_date_array)
-
-                # Selects the min, ma value objects for comparison
-                tmp_min_value_obj = df_dates.iloc[min_idx]
-                tmp_max_value_obj = df_dates.iloc[max_idx]
-
-                # If minimum value, keep reference
-                if tmp_min_value_obj < min_value_obj:
-                    min_value = df_series[~null_date_mask].iloc[min_idx]
-                    min_value_obj = tmp_min_value_obj
-
-                # If maximum value, keep reference
-                if tmp_max_value_obj > max_value_obj:
-                    max_value = df_series[~null_date_mask].iloc[max_idx]
-                    max_value_obj = tmp_max_value_obj
-
-            df_series = df_series[null_date_mask]
-
-            # Get a list of all datetime format identified in column
-            new_len = len(df_series)
-            if new_len < len_df:
-                activated_date_formats.append(date_format)
-                len_df = new_len
-                if "y" in date_format:
-                    warnings.warn(
-                        "Years provided were in two digit format. As a result, "
-                        "datetime assumes dates < 69 are for 2000s and above "
-                        "are for the 1990s. "
-                        "https://stackoverflow.com/questions/37766353/"
-                        "pandas-to-datetime-parsing-wrong-year",
-                        RuntimeWarning,
-                    )
-
-        profile["date_formats"] = activated_date_formats
-        profile["min"] = min_value
-        profile["max"] = max_value
-        profile["min_obj"] = (
-            min_value_obj.to_datetime()  # type: ignore
-            if hasattr(min_value_obj, "to_datetime")
-            else min_value_obj
+            df_dates = df_dates.drop(valid_dates.index)
+
+            # Keep reference of the min and max, ties go to the first format
+            rank = cls._date_formats.index(date_format)
+            min_idx = valid_dates.index[np.argmin(valid_dates.values)]
+            max_idx = valid_dates.index[np.argmax(valid_dates.values)]
+            min_values.append((valid_dates[min_idx], rank, df_series[min_idx]))
+            max_values.append((valid_dates[max_idx], -rank, df_series[max_idx]))
+
+            activated_date_formats.append((rank, date_format))
+            date_format_counts[date_format] = len(valid_dates)
+
+        # Get a list of all datetime format identified in column
+        profile["date_formats"] = []
+        for _, date_format in sorted(activated_date_formats):
+            profile["date_formats"].append(date_format)
+            if "y" in date_format:
+                warnings.warn(
+                    "Years provided were in two digit format. As a result, "
+                    "datetime assumes dates < 69 are for 2000s and above "
+                    "are for the 1990s. "
+                    "https://stackoverflow.com/questions/37766353/"
+                    "pandas-to-datetime-parsing-wrong-year",
+                    RuntimeWarning,
+                )
+
+        profile["min_obj"], _, profile["min"] = min(
+            min_values, default=(datetime.datetime.max, None, None)
         )
-        profile["max_obj"] = (
-            max_value_obj.to_datetime()  # type: ignore
-            if hasattr(max_value_obj, "to_datetime")
-            else max_value_obj
+        profile["max_obj"], _, profile["max"] = max(
+            max_values, default=(datetime.datetime.min, None, None)
         )
-        profile["match_count"] = is_row_datetime.sum()
+        profile["date_format_counts"] = date_format_counts
+        profile["match_count"] = sum(date_format_counts.values())
         return profile
 
+    @staticmethod
+    def _get_date_format_group(date_format: str) -> str:
+        """
+        Return the group of date formats which can match the same dates.
+
+        `strptime` matches the literals of a format regardless of case and the
+        months of `%B` also match `%b` for "May".
+
+        :param date_format: a date format
+        :type date_format: str
+        :return: the date format with lowercase literals and `%B` as `%b`
+        :rtype: str
+        """
+        return re.sub(
+            r"%.|[^%]+",
+            lambda x: x.group().replace("%B", "%b")
+            if x.group().startswith("%")
+            else x.group().lower(),
+            date_format,
+        )
+
+    def _get_date_formats_by_hit_rate(self) -> list[str]:
+        """
+        Return the date formats ordered by their matches in previous updates.
+
+        Formats of a group share their counts to keep their relative order,
+        such that each date is attributed to the same format of the group.
+
+        :return: the date formats in the order to check them
+        :rtype: list[str]
+        """
+        counts: dict[str, int] = defaultdict(int)
+        for date_format, count in self._date_format_counts.items():
+            counts[self._get_date_format_group(date_format)] += count
+        return sorted(
+            self._date_formats,
+            key=lambda x: -counts[self._get_date_format_group(x)],
+        )
+
+    def _count_matches(self, column_view: ColumnView) -> int:
+        """
+        Count the values of a column which are datetimes.
+
+        :param column_view: view of the column
+        :type column_view: ColumnView
+        :return: number of datetime values
+        :rtype: int
+        """
+        profile = self._get_datetime_profile(
+            column_view.str_series, self._get_date_formats_by_hit_rate()
+        )
+        return int(profile["match_count"])
+
     def _is_subset_datetime_column(self, df_series: pd.Series) -> bool:
         """
         Check whether a subset of the data could be considered datetime.
@@ -333,7 +418,13 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler["DateTimeColumn"]):
         num_samples_to_check = 50
         thresh = 0.10
         sample_size = min(num_samples_to_check, len(df_series))
-        profile = self._get_datetime_profile(df_series.sample(sample_size))
+        profile = self._get_datetime_profile(
+            df_series.sample(sample_size), self._get_date_formats_by_hit_rate()
+        )
+        # The formats matching the sample are likely to match the column too
+        self._date_format_counts = utils.add_nested_dictionaries(
+            self._date_format_counts, profile["date_format_counts"]
+        )
 
         if profile["match_count"] / sample_size < thresh:
             return False
@@ -360,7 +451,12 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler["DateTimeColumn"]):
         :return:
         """
         # date_formats
-        profile = self._get_datetime_profile(df_series)
+        profile = self._get_datetime_profile(
+            df_series, self._get_date_formats_by_hit_rate()
+        )
+        self._date_format_counts = utils.add_nested_dictionaries(
+            self._date_format_counts, profile.pop("date_format_counts")
+        )
         date_formats = profile.pop("date_formats", [])
         if date_formats:
             self.date_formats = self._combine_unique_sets(
@@ -400,17 +496,19 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler["DateTimeColumn"]):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series: pd.Series) -> DateTimeColumn:
+    def update(self, df_series: pd.Series | ColumnView) -> DateTimeColumn:
         """
         Update the column profile.
 
-        :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :param df_series: df series or view of the column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
         if len(df_series) == 0:
             return self
 
+        if isinstance(df_series, ColumnView):
+            df_series = df_series.str_series
         df_series = df_series.reset_index(drop=True)
         profile = {"sample_size": len(df_series), "match_count": 0}
         if self._is_subset_datetime_column(df_series):
@@ -8,7 +8,11 @@ import numpy as np
 import pandas as pd
 
 from . import utils
-from .base_column_profilers import BaseColumnPrimitiveTypeProfiler, BaseColumnProfiler
+from .base_column_profilers import (
+    BaseColumnPrimitiveTypeProfiler,
+    BaseColumnProfiler,
+    ColumnView,
+)
 from .numerical_column_stats import NumericStatsMixin
 from .profiler_options import FloatOptions
 
@@ -258,10 +262,6 @@ class FloatColumn(
         if not len_df:
             return None
 
-        # Lead zeros: ^[+-.0\s]+ End zeros: \.?0+(\s|$)
-        # Scientific Notation: (?<=[e])(.*) Any non-digits: \D
-        r = re.compile(r"^[+-.0\s]+|\.?0+(\s|$)|(?<=[e])(.*)|\D")
-
         # DEFAULT: Sample the dataset. If small use full dataset,
         # OR 20k samples or 5% of the dataset which ever is larger.
         # If user sets sample ratio, utilize their request
@@ -269,10 +269,18 @@ class FloatColumn(
         if sample_ratio is not None and sample_ratio > 0:
             sample_size = int(len_df * sample_ratio)
 
+        # precision is determined from the string representation of the data,
+        # which numpy gives for native numeric values without a loop in python
+        df_series_sample = df_series_clean.sample(sample_size)
+        if ColumnView.is_native_numeric(df_series_sample):
+            values = df_series_sample.to_numpy().astype(str)
+        else:
+            if df_series_sample.dtype != object:
+                df_series_sample = df_series_sample.apply(str).astype(object)
+            values = df_series_sample.to_numpy()
+
         # length of sampled cells after all punctuation removed
-        len_per_float = (
-            df_series_clean.sample(sample_size).replace(to_replace=r, value="").map(len)
-        )
+        len_per_float = cls._count_significant_digits(values)
 
         # Determine statistics precision
         precision_sum = len_per_float.sum()
@@ -288,7 +296,66 @@ class FloatColumn(
         return subset_precision
 
     @classmethod
-    def _is_each_row_float(cls, df_series: pd.Series) -> list[bool] | pd.Series[bool]:
+    def _count_significant_digits(cls, values: np.ndarray) -> np.ndarray:
+        """
+        Count the digits of each string after removing the insignificant ones.
+
+        The leading zeros, trailing zeros, exponent of the scientific notation
+        and any non-digit are removed. Strings of ascii characters without any
+        whitespace are counted from a matrix of their character codes, the
+        others with a regular expression substitution.
+
+        :param values: strings to count the significant digits of
+        :type values: numpy.ndarray
+        :return: number of significant digits of each string
+        :rtype: numpy.ndarray
+        """
+        # Lead zeros: ^[+-.0\s]+ End zeros: \.?0+(\s|$)
+        # Scientific Notation: (?<=[e])(.*) Any non-digits: \D
+        r = re.compile(r"^[+-.0\s]+|\.?0+(\s|$)|(?<=[e])(.*)|\D")
+
+        # classes of the ascii characters, any other character being looked up
+        # as the last one, a whitespace
+        ascii_chars = [chr(code) for code in range(128)] + [" "]
+        is_space_char = np.array([char.isspace() for char in ascii_chars])
+        is_digit_char = np.array([char.isdigit() for char in ascii_chars])
+        is_lead_char = np.array([char in "+,-.0" for char in ascii_chars])
+        # the end of the strings is padded with null characters
+        is_end_char = np.array([char in "\x000" for char in ascii_chars])
+
+        # long strings are left to the regular expression to bound the matrix
+        if values.dtype.kind == "U" and values.itemsize <= 4 * 64:
+            is_vectorized = np.ones(len(values), dtype=bool)
+        else:
+            lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+            is_vectorized = lengths <= 64
+            values = values.astype(object)
+        codes = values[is_vectorized].astype(str)
+        width = codes.dtype.itemsize // 4
+        codes = np.minimum(codes.view(np.uint32).reshape(len(codes), width), 128)
+
+        # as are strings with whitespace or characters which are not ascii
+        is_ascii_word = ~is_space_char[codes].any(axis=1)
+        is_vectorized[is_vectorized] = is_ascii_word
+        codes = codes[is_ascii_word]
+
+        is_digit = is_digit_char[codes]
+        is_lead = np.logical_and.accumulate(is_lead_char[codes], axis=1)
+        is_end_zero = np.logical_and.accumulate(is_end_char[codes[:, ::-1]], axis=1)[
+            :, ::-1
+        ]
+        is_exponent = np.logical_or.accumulate(codes == ord("e"), axis=1)
+
+        digit_counts = np.empty(len(values), dtype=np.int64)
+        digit_counts[is_vectorized] = np.count_nonzero(
+            is_digit & ~is_lead & ~is_end_zero & ~is_exponent, axis=1
+        )
+        for i in np.flatnonzero(~is_vectorized):
+            digit_counts[i] = len(r.sub("", str(values[i])))
+        return digit_counts
+
+    @classmethod
+    def _is_each_row_float(cls, df_series: pd.Series) -> list[bool] | np.ndarray:
         """
         Determine if each value in a dataframe is a float.
 
@@ -300,11 +367,22 @@ class FloatColumn(
         :param df_series: series of values to evaluate
         :type df_series: pandas.core.series.Series
         :return: is_float_col
-        :rtype: Union[List[bool], pandas.Series[bool]]
+        :rtype: Union[List[bool], numpy.ndarray]
         """
         if len(df_series) == 0:
             return list()
-        return df_series.map(NumericStatsMixin.is_float)
+        return utils.get_numeric_type_masks(df_series)[1]
+
+    def _count_matches(self, column_view: ColumnView) -> int:
+        """
+        Count the values of a column which are floats.
+
+        :param column_view: view of the column
+        :type column_view: ColumnView
+        :return: number of float values
+        :rtype: int
+        """
+        return int(np.sum(column_view.numeric_type_masks[1]))
 
     @BaseColumnProfiler._timeit(name="precision")
     def _update_precision(
@@ -396,19 +474,21 @@ class FloatColumn(
         """
         super()._update_helper(df_series, subset_properties)
 
-    def update(self, df_series: pd.Series) -> FloatColumn:
+    def update(self, df_series: pd.Series | ColumnView) -> FloatColumn:
         """
         Update the column profile.
 
-        :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :param df_series: df series or view of the column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: updated FloatColumn
         :rtype: FloatColumn
         """
         if len(df_series) == 0:
             return self
 
-        is_each_row_float = self._is_each_row_float(df_series)
+        column_view = ColumnView.from_series(df_series)
+        df_series = column_view.series
+        is_each_row_float = column_view.numeric_type_masks[1]
         sample_size = len(is_each_row_float)
         float_count = np.sum(is_each_row_float)
         profile = dict(match_count=float_count, sample_size=sample_size)
@@ -421,8 +501,10 @@ class FloatColumn(
             subset_properties=profile,
         )
 
+        # the numeric stats reuse the floats parsed for the type inference
         self._update_helper(
-            df_series_clean=df_series[is_each_row_float], profile=profile
+            df_series_clean=pd.Series(column_view.float_values[is_each_row_float]),
+            profile=profile,
         )
 
         return self
@@ -348,3 +348,72 @@ def _calculate_bins_from_profile(profile, bin_method):
             # the IQR of the data is zero.
             n_equal_bins = 1
     return n_equal_bins
+
+
+def _calculate_bins_from_histogram(bin_counts, bin_edges, bin_methods):
+    """
+    Compute the bins of each method using the statistics of a fine histogram.
+
+    The widths follow the numpy estimators, the standard deviation, skewness
+    and interquartile range being estimated from the bins rather than from
+    the data such that all the methods are derived from a single pass.
+
+    :param bin_counts: counts of the bins of the histogram
+    :type bin_counts: np.ndarray
+    :param bin_edges: edges of the bins of the histogram
+    :type bin_edges: np.ndarray
+    :param bin_methods: names of the methods used to calculate bins
+    :type bin_methods: list(str)
+
+    :return: ideal number of bins for each of the bin methods
+    :rtype: dict
+    """
+    for bin_method in bin_methods:
+        if bin_method not in _hist_bin_width_selectors_for_profile:
+            raise ValueError(f"{bin_method!r} is not a valid estimator for `bins`")
+
+    bin_counts = np.asarray(bin_counts, dtype=float)
+    dataset_size = bin_counts.sum()
+    if not dataset_size:
+        return {bin_method: 1 for bin_method in bin_methods}
+    ptp = _ptp(bin_edges[-1], bin_edges[0])
+
+    mids = 0.5 * (bin_edges[1:] + bin_edges[:-1])
+    mean = np.average(mids, weights=bin_counts)
+    std = np.sqrt(np.average((mids - mean) ** 2, weights=bin_counts))
+    cumulative_counts = np.concatenate([[0], np.cumsum(bin_counts)])
+    q25, q75 = np.interp(
+        [0.25 * dataset_size, 0.75 * dataset_size], cumulative_counts, bin_edges
+    )
+
+    sturges_width = ptp / (np.log2(dataset_size) + 1.0)
+    fd_width = 2.0 * (q75 - q25) * dataset_size ** (-1.0 / 3.0)
+    doane_width = 0.0
+    if dataset_size > 2 and std > 0.0:
+        sg1 = np.sqrt(
+            6.0 * (dataset_size - 2) / ((dataset_size + 1.0) * (dataset_size + 3))
+        )
+        g1 = np.average(((mids - mean) / std) ** 3, weights=bin_counts)
+        doane_width = ptp / (
+            1.0 + np.log2(dataset_size) + np.log2(1.0 + np.absolute(g1) / sg1)
+        )
+    widths = {
+        "auto": min(fd_width, sturges_width) if fd_width else sturges_width,
+        "doane": doane_width,
+        "fd": fd_width,
+        "rice": ptp / (2.0 * dataset_size ** (1.0 / 3)),
+        "scott": (24.0 * np.pi**0.5 / dataset_size) ** (1.0 / 3.0) * std,
+        "sqrt": ptp / np.sqrt(dataset_size),
+        "sturges": sturges_width,
+    }
+
+    n_equal_bins = {}
+    for bin_method in bin_methods:
+        width = widths[bin_method]
+        if width and not np.isnan(width):
+            n_equal_bins[bin_method] = int(np.ceil(ptp / width))
+        else:
+            # Width can be zero for some estimators, e.g. FD when
+            # the IQR of the data is zero.
+            n_equal_bins[bin_method] = 1
+    return n_equal_bins
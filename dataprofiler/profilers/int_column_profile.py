@@ -4,7 +4,12 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from .base_column_profilers import BaseColumnPrimitiveTypeProfiler, BaseColumnProfiler
+from . import utils
+from .base_column_profilers import (
+    BaseColumnPrimitiveTypeProfiler,
+    BaseColumnProfiler,
+    ColumnView,
+)
 from .numerical_column_stats import NumericStatsMixin
 from .profiler_options import IntOptions
 
@@ -94,7 +99,7 @@ class IntColumn(
         return None
 
     @classmethod
-    def _is_each_row_int(cls, df_series: pd.Series) -> list[bool]:
+    def _is_each_row_int(cls, df_series: pd.Series) -> list[bool] | np.ndarray:
         """
         Return true if given is numerical and int values.
 
@@ -107,13 +112,24 @@ class IntColumn(
         :param df_series: series of values to evaluate
         :type df_series: pandas.core.series.Series
         :return: is_int_col
-        :rtype: list
+        :rtype: Union[list, numpy.ndarray]
         """
         len_df = len(df_series)
         if len_df == 0:
             return list()
 
-        return [NumericStatsMixin.is_int(x) for x in df_series]
+        return utils.get_numeric_type_masks(df_series)[0]
+
+    def _count_matches(self, column_view: ColumnView) -> int:
+        """
+        Count the values of a column which are ints.
+
+        :param column_view: view of the column
+        :type column_view: ColumnView
+        :return: number of int values
+        :rtype: int
+        """
+        return int(np.sum(column_view.numeric_type_masks[0]))
 
     def _update_helper(self, df_series_clean: pd.Series, profile: dict) -> None:
         """
@@ -129,20 +145,21 @@ class IntColumn(
             NumericStatsMixin._update_helper(self, df_series_clean, profile)
         self._update_column_base_properties(profile)
 
-    def update(self, df_series: pd.Series) -> IntColumn:
+    def update(self, df_series: pd.Series | ColumnView) -> IntColumn:
         """
         Update the column profile.
 
-        :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :param df_series: df series or view of the column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: updated IntColumn
         :rtype: IntColumn
         """
         if len(df_series) == 0:
             return self
 
-        df_series = df_series.reset_index(drop=True)
-        is_each_row_int = self._is_each_row_int(df_series)
+        column_view = ColumnView.from_series(df_series)
+        df_series = column_view.series.reset_index(drop=True)
+        is_each_row_int = column_view.numeric_type_masks[0]
         sample_size = len(is_each_row_int)
         match_int_count = np.sum(is_each_row_int)
         profile = dict(match_count=match_int_count, sample_size=sample_size)
@@ -155,6 +172,10 @@ class IntColumn(
             subset_properties=profile,
         )
 
-        self._update_helper(df_series_clean=df_series[is_each_row_int], profile=profile)
+        # the numeric stats reuse the floats parsed for the type inference
+        self._update_helper(
+            df_series_clean=pd.Series(column_view.float_values[is_each_row_int]),
+            profile=profile,
+        )
 
         return self
@@ -16,6 +16,7 @@ import scipy.stats
 from . import histogram_utils, utils
 from .base_column_profilers import BaseColumnProfiler
 from .profiler_options import NumericalOptions
+from .sketches import KLLSketch
 
 
 class abstractstaticmethod(staticmethod):
@@ -82,6 +83,10 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         self._mode_is_enabled: bool = True
         self.num_zeros: int = 0
         self.num_negatives: int = 0
+        # Sketch of the values estimating the quantiles instead of the histogram
+        self._quantile_sketch: KLLSketch | None = None
+        # State of the selection of the bin method from a single histogram
+        self._histogram_expert_selection: dict | None = None
         if options:
             self.bias_correction = options.bias_correction.is_enabled
             self._top_k_modes = options.mode.top_k_modes
@@ -96,6 +101,19 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
             elif isinstance(bin_count_or_method, int):
                 self.user_set_histogram_bin = bin_count_or_method
                 self.histogram_bin_method_names = ["custom"]
+            quantile_sketch = options.histogram_and_quantiles.quantile_sketch
+            if quantile_sketch.is_enabled:
+                self._quantile_sketch = KLLSketch(
+                    compactor_size=quantile_sketch.compactor_size,
+                    seed=quantile_sketch.seed,
+                )
+            selection = options.histogram_and_quantiles.selection
+            if selection.is_enabled:
+                self._histogram_expert_selection = {
+                    "freeze_after": selection.freeze_after,
+                    "lead_count": 0,
+                    "is_frozen": False,
+                }
         self.histogram_methods: dict = {}
         self._stored_histogram: dict = {
             "total_loss": 0,
@@ -343,6 +361,29 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
             self.num_negatives = other1.num_negatives + other2.num_negatives
 
         if "histogram_and_quantiles" in self.__calculations.keys():
+            self._quantile_sketch = None
+            if (
+                other1._quantile_sketch is not None
+                and other2._quantile_sketch is not None
+            ):
+                self._quantile_sketch = copy.deepcopy(other1._quantile_sketch)
+                self._quantile_sketch.merge(other2._quantile_sketch)
+            self._histogram_expert_selection = None
+            if (
+                other1._histogram_expert_selection is not None
+                and other2._histogram_expert_selection is not None
+            ):
+                freeze_afters = [
+                    other1._histogram_expert_selection["freeze_after"],
+                    other2._histogram_expert_selection["freeze_after"],
+                ]
+                self._histogram_expert_selection = {
+                    "freeze_after": None
+                    if None in freeze_afters
+                    else max(freeze_afters),
+                    "lead_count": 0,
+                    "is_frozen": False,
+                }
             if other1._has_histogram and other2._has_histogram:
                 self._add_helper_merge_profile_histograms(other1, other2)
             elif not other2._has_histogram:
@@ -1093,7 +1134,7 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         # reset the edge
         bin_edges[-1] = temp_last_edge
 
-        sum_error: float = sum(
+        sum_error: float = np.sum(
             (input_array - (bin_edges[inds] + bin_edges[inds - 1]) / 2) ** 2
         )
 
@@ -1169,20 +1210,14 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         # Extend histogram to array format
         bin_counts = self._stored_histogram["histogram"]["bin_counts"]
         bin_edges = self._stored_histogram["histogram"]["bin_edges"]
-        is_bin_non_zero = bin_counts[:-1] > 0
-        bin_left_edge = bin_edges[:-2][is_bin_non_zero]
-        hist_to_array = [
-            [left_edge] * count
-            for left_edge, count in zip(bin_left_edge, bin_counts[:-1][is_bin_non_zero])
-        ]
-        if not hist_to_array:
-            hist_to_array = [[]]
-
+        last_bin_count = int(bin_counts[-1])
         array_flatten: np.ndarray = np.concatenate(
-            hist_to_array
-            + [[bin_edges[-2]] * int(bin_counts[-1] / 2)]
-            + [[bin_edges[-1]] * (bin_counts[-1] - int(bin_counts[-1] / 2))]
-        )
+            [
+                np.repeat(bin_edges[:-2], np.asarray(bin_counts[:-1], dtype=np.int64)),
+                np.full(last_bin_count // 2, bin_edges[-2]),
+                np.full(last_bin_count - last_bin_count // 2, bin_edges[-1]),
+            ]
+        ).astype(float)
 
         # If we know they are integers, we can limit the data to be as such
         # during conversion
@@ -1203,7 +1238,16 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         :type values: Union[np.array, pd.Series]
         :return: bin edges and bin counts
         """
-        if len(np.unique(values)) == 1:
+        derive_from_base = (
+            self._histogram_expert_selection is not None
+            and self.user_set_histogram_bin is None
+        )
+        if derive_from_base:
+            is_single_value = np.min(values) == np.max(values)
+        else:
+            is_single_value = len(np.unique(values)) == 1
+
+        if is_single_value:
             bin_counts = np.array([len(values)])
             if isinstance(values, (np.ndarray, list)):
                 unique_value = values[0]
@@ -1216,6 +1260,8 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
                 ] = bin_counts
                 self.histogram_methods[bin_method]["histogram"]["bin_edges"] = bin_edges
                 self.histogram_methods[bin_method]["suggested_bin_count"] = 1
+        elif derive_from_base:
+            bin_counts, bin_edges = self._get_base_histogram(np.asarray(values))
         else:
             # if user set the bin count, then use the user set count to
             n_equal_bins = suggested_bin_count = self.min_histogram_bin
@@ -1246,6 +1292,87 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
             bin_counts, bin_edges = np.histogram(values, bins=n_equal_bins)
         return bin_counts, bin_edges
 
+    def _get_base_histogram(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate stored histogram and derive the suggested bin counts from it.
+
+        A histogram with the bin count of the stored histogram is calculated
+        first and the suggested bin count of each method is estimated from its
+        bins, the histogram only being calculated again if a method suggests
+        more bins.
+
+        :param values: input data values
+        :type values: np.array
+        :return: bin edges and bin counts
+        """
+        base_bin_count = self.min_histogram_bin
+        if self._has_histogram:
+            base_bin_count = max(
+                base_bin_count, len(self._stored_histogram["histogram"]["bin_counts"])
+            )
+        bin_counts, bin_edges = np.histogram(values, bins=base_bin_count)
+
+        bin_methods = self.histogram_bin_method_names
+        if cast(Dict, self._histogram_expert_selection)["is_frozen"]:
+            bin_methods = [cast(str, self.histogram_selection)]
+        suggested_bin_counts = histogram_utils._calculate_bins_from_histogram(
+            bin_counts, bin_edges, bin_methods
+        )
+
+        n_equal_bins = base_bin_count
+        for bin_method, suggested_bin_count in suggested_bin_counts.items():
+            suggested_bin_count = min(suggested_bin_count, self.max_histogram_bin)
+            n_equal_bins = max(n_equal_bins, suggested_bin_count)
+            self.histogram_methods[bin_method][
+                "suggested_bin_count"
+            ] = suggested_bin_count
+
+        if n_equal_bins > base_bin_count:
+            bin_counts, bin_edges = np.histogram(values, bins=n_equal_bins)
+        return bin_counts, bin_edges
+
+    def _update_histogram_selection(self) -> None:
+        """
+        Select the bin method with the least loss accumulated over the batches.
+
+        The histogram of each method is regenerated from the stored histogram
+        and its loss added to the accumulated loss of the method. Once the same
+        method led for `freeze_after` consecutive batches, it is kept without
+        evaluating the other methods.
+
+        :return: None
+        """
+        selection = cast(Dict, self._histogram_expert_selection)
+        bin_methods = self.histogram_bin_method_names
+        if selection["is_frozen"]:
+            bin_methods = [cast(str, self.histogram_selection)]
+
+        for method in bin_methods:
+            self.histogram_methods[method]["histogram"] = {
+                "bin_counts": None,
+                "bin_edges": None,
+            }
+            histogram, hist_loss = self._histogram_for_profile(method)
+            self.histogram_methods[method]["histogram"] = histogram
+            self.histogram_methods[method]["current_loss"] = hist_loss
+            self.histogram_methods[method]["total_loss"] += hist_loss
+
+        total_losses: Dict[str, float] = {
+            method: self.histogram_methods[method]["total_loss"]
+            for method in bin_methods
+        }
+        leader = min(total_losses, key=total_losses.__getitem__)
+        if leader == self.histogram_selection:
+            selection["lead_count"] += 1
+        else:
+            selection["lead_count"] = 1
+        self.histogram_selection = leader
+        if (
+            selection["freeze_after"] is not None
+            and selection["lead_count"] >= selection["freeze_after"]
+        ):
+            selection["is_frozen"] = True
+
     def _merge_histogram(self, values: np.ndarray | pd.Series) -> None:
         # values is the current array of values,
         # that needs to be updated to the accumulated histogram
@@ -1269,29 +1396,35 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         pp. 425–436.
         The idea is to select the current best method based on accumulated
         losses up to the current time: all methods are compared using the
-        accumulated losses, and the best method with minimal loss is picked
+        accumulated losses, and the best method with minimal loss is picked.
+        When the selection option is enabled, the bin counts and losses of all
+        the methods are derived from the stored histogram of each batch.
 
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
         :return:
         """
-        df_series = df_series.replace([np.inf, -np.inf], np.nan).dropna()
-        if df_series.empty:
+        values = np.asarray(df_series, dtype=float)
+        values = values[np.isfinite(values)]
+        if not len(values):
             return
 
         if self._has_histogram:
-            self._merge_histogram(df_series.tolist())
+            self._merge_histogram(values)
         else:
-            bin_counts, bin_edges = self._get_histogram(df_series)
+            bin_counts, bin_edges = self._get_histogram(values)
             self._stored_histogram["histogram"]["bin_counts"] = bin_counts
             self._stored_histogram["histogram"]["bin_edges"] = bin_edges
 
         # update loss for the stored bins
-        histogram_loss = self._histogram_bin_error(df_series)
+        histogram_loss = self._histogram_bin_error(values)
 
         self._stored_histogram["current_loss"] = histogram_loss
         self._stored_histogram["total_loss"] += histogram_loss
 
+        if self._histogram_expert_selection is not None:
+            self._update_histogram_selection()
+
     def _regenerate_histogram(
         self, entity_count_per_bin, bin_edges, suggested_bin_count, options=None
     ) -> tuple[dict[str, np.ndarray], float]:
@@ -1341,62 +1474,63 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         :type dest_hist_num_bin: int
         :return: Tuple containing dictionary of histogram info and histogram loss
         """
-        # allocate bin_counts
-        new_bin_id = 0
-        hist_loss = 0
-        for bin_id, bin_count in enumerate(from_hist_entity_count_per_bin):
-            if not bin_count:  # if nothing in bin, nothing to add
-                continue
+        from_counts = np.asarray(from_hist_entity_count_per_bin)
+        is_bin_non_zero = from_counts != 0  # if nothing in bin, nothing to add
+        bin_counts = from_counts[is_bin_non_zero]
+        left_edges = from_hist_bin_edges[:-1][is_bin_non_zero]
+        right_edges = from_hist_bin_edges[1:][is_bin_non_zero]
 
-            bin_edge = from_hist_bin_edges[bin_id : bin_id + 3]
+        # if we know not float, we can assume values in bins are integers.
+        if not self.__class__.__name__ == "FloatColumn":
+            left_edges = np.round(left_edges)
+            right_edges = np.round(right_edges)
 
-            # if we know not float, we can assume values in bins are integers.
-            is_float_profile = self.__class__.__name__ == "FloatColumn"
-            if not is_float_profile:
-                bin_edge = np.round(bin_edge)
+        # find the new bin which contains the left edge of each current bin
+        new_bin_ids = np.minimum(
+            np.searchsorted(dest_hist_bin_edges[1:], left_edges, side="right"),
+            dest_hist_num_bin - 1,
+        )
+        new_left_edges = dest_hist_bin_edges[new_bin_ids]
+        new_right_edges = dest_hist_bin_edges[new_bin_ids + 1]
+        bin_centers = (right_edges + left_edges) / 2
+
+        # current bins within their new bin are fully added to it, the ones
+        # straddling two of the new bins are split by the percentage of the
+        # bin falling to the left
+        is_last_bin = new_bin_ids == dest_hist_num_bin - 1
+        is_straddling = ~((right_edges < new_right_edges) | is_last_bin)
+        counts_in_left_bin = bin_counts.astype(float)
+        straddle_right_edges = right_edges[is_straddling]
+        straddle_left_edges = left_edges[is_straddling]
+        counts_in_left_bin[is_straddling] = np.round(
+            bin_counts[is_straddling]
+            * (new_right_edges[is_straddling] - straddle_left_edges)
+            / (straddle_right_edges - straddle_left_edges)
+        )
+        np.add.at(dest_hist_entity_count_per_bin, new_bin_ids, counts_in_left_bin)
+        hist_loss = np.sum(
+            ((new_right_edges + new_left_edges) / 2 - bin_centers) ** 2
+            * counts_in_left_bin
+        )
 
-            # loop until we have a new bin which contains the current bin.
-            while (
-                bin_edge[0] >= dest_hist_bin_edges[new_bin_id + 1]
-                and new_bin_id < dest_hist_num_bin - 1
-            ):
-                new_bin_id += 1
-
-            new_bin_edge = dest_hist_bin_edges[new_bin_id : new_bin_id + 3]
-
-            # find where the current bin falls within the new bins
-            is_last_bin = new_bin_id == dest_hist_num_bin - 1
-            if bin_edge[1] < new_bin_edge[1] or is_last_bin:
-                # current bin is within the new bin
-                dest_hist_entity_count_per_bin[new_bin_id] += bin_count
-                hist_loss += (
-                    ((new_bin_edge[1] + new_bin_edge[0]) - (bin_edge[1] + bin_edge[0]))
-                    / 2
-                ) ** 2 * bin_count
-            elif bin_edge[0] < new_bin_edge[1]:
-                # current bin straddles two of the new bins
-                # get the percentage of bin that falls to the left
-                percentage_in_left_bin = (new_bin_edge[1] - bin_edge[0]) / (
-                    bin_edge[1] - bin_edge[0]
-                )
-                count_in_left_bin = round(bin_count * percentage_in_left_bin)
-                dest_hist_entity_count_per_bin[new_bin_id] += count_in_left_bin
-                hist_loss += (
-                    ((new_bin_edge[1] + new_bin_edge[0]) - (bin_edge[1] + bin_edge[0]))
-                    / 2
-                ) ** 2 * count_in_left_bin
-
-                # allocate leftovers to the right bin
-                dest_hist_entity_count_per_bin[new_bin_id + 1] += (
-                    bin_count - count_in_left_bin
+        # allocate leftovers to the right bin
+        right_bin_ids = new_bin_ids[is_straddling] + 1
+        counts_in_right_bin = (
+            bin_counts[is_straddling] - counts_in_left_bin[is_straddling]
+        )
+        np.add.at(dest_hist_entity_count_per_bin, right_bin_ids, counts_in_right_bin)
+        hist_loss += np.sum(
+            (
+                (
+                    dest_hist_bin_edges[right_bin_ids + 1]
+                    + new_right_edges[is_straddling]
                 )
-                hist_loss += (
-                    ((new_bin_edge[2] + new_bin_edge[1]) - (bin_edge[1] + bin_edge[0]))
-                    / 2
-                ) ** 2 * (bin_count - count_in_left_bin)
-
-                # increment bin id to the right bin
-                new_bin_id += 1
+                / 2
+                - bin_centers[is_straddling]
+            )
+            ** 2
+            * counts_in_right_bin
+        )
         return (
             {
                 "bin_edges": dest_hist_bin_edges,
@@ -1482,6 +1616,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
             in the distribution fall before each percentage
         """
         percentiles = np.array(percentiles)
+        if self._quantile_sketch is not None and self._quantile_sketch.count:
+            return self._quantile_sketch.quantiles(percentiles / 100)
+
         bin_counts = self._stored_histogram["histogram"]["bin_counts"]
         bin_edges = self._stored_histogram["histogram"]["bin_edges"]
 
@@ -1579,6 +1716,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
             Superimpose the counts from the two histograms
             Interpolate the median absolute deviation from the superimposed counts
 
+        If a quantile sketch is kept, the median absolute deviation is instead
+        estimated from the deviations of the values of the sketch.
+
         :return: median absolute deviation
         """
         if not self._has_histogram or not self._median_abs_dev_is_enabled:
@@ -1592,6 +1732,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         else:
             median = self._get_percentile([50])[0]
 
+        if self._quantile_sketch is not None and self._quantile_sketch.count:
+            return self._quantile_sketch.median_abs_deviation(median)
+
         # generate two folds of deviation
         histogram_pos, histogram_neg = self._fold_histogram(
             bin_counts, bin_edges, median
@@ -1671,16 +1814,45 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         }
         subset_properties = copy.deepcopy(profile)
         df_series_clean = df_series_clean.astype(float)
+
+        # The moments and counts are all computed at once for the batch
+        order = 1
+        for moment_order, prop in enumerate(["variance", "skewness", "kurtosis"], 2):
+            if prop in self.__calculations:
+                order = moment_order
+        subset_properties["batch_moments"] = utils.BatchMoments(
+            df_series_clean.to_numpy(), order=order
+        )
         super()._perform_property_calcs(  # type: ignore
             self.__calculations,
             df_series=df_series_clean,
             prev_dependent_properties=prev_dependent_properties,
             subset_properties=subset_properties,
         )
+        subset_properties.pop("batch_moments")
         if len(self._batch_history) == 5:
             self._batch_history.pop(0)
         self._batch_history.append(subset_properties)
 
+    @staticmethod
+    def _get_batch_moments(
+        df_series: pd.Series, subset_properties: dict
+    ) -> utils.BatchMoments:
+        """
+        Return the moments of the batch, computing them if not yet computed.
+
+        :param df_series: df series
+        :type df_series: pandas.core.series.Series
+        :param subset_properties: subset of properties
+        :type subset_properties: dict
+        :return: moments and counts of the batch
+        :rtype: utils.BatchMoments
+        """
+        batch_moments = subset_properties.get("batch_moments")
+        if batch_moments is None:
+            batch_moments = utils.BatchMoments(df_series)
+        return cast(utils.BatchMoments, batch_moments)
+
     @BaseColumnProfiler._timeit(name="min")
     def _get_min(
         self,
@@ -1688,7 +1860,7 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         prev_dependent_properties: dict,
         subset_properties: dict,
     ) -> None:
-        min_value = df_series.min()
+        min_value = self._get_batch_moments(df_series, subset_properties).min
         self.min = min_value if not self.min else min(self.min, min_value)
         subset_properties["min"] = min_value
 
@@ -1699,7 +1871,7 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         prev_dependent_properties: dict,
         subset_properties: dict,
     ) -> None:
-        max_value = df_series.max()
+        max_value = self._get_batch_moments(df_series, subset_properties).max
         self.max = max_value if not self.max else max(self.max, max_value)
         subset_properties["max"] = max_value
 
@@ -1713,8 +1885,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         if np.isinf(self.sum) or (np.isnan(self.sum) and self.match_count > 0):
             return
 
-        sum_value = df_series.sum()
-        if np.isinf(sum_value) or (len(df_series) > 0 and np.isnan(sum_value)):
+        batch_moments = self._get_batch_moments(df_series, subset_properties)
+        sum_value = batch_moments.sum
+        if np.isinf(sum_value) or (batch_moments.count > 0 and np.isnan(sum_value)):
             warnings.warn(
                 "Infinite or invalid values found in data. "
                 "Future statistics (mean, variance, skewness, kurtosis) "
@@ -1737,10 +1910,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         ):
             return
 
-        # Suppress any numpy warnings as we have a custom warning for invalid
-        # or infinite data already
-        with np.errstate(all="ignore"):
-            batch_biased_variance = np.var(df_series)  # Obtains biased variance
+        batch_biased_variance = self._get_batch_moments(
+            df_series, subset_properties
+        ).biased_variance
         subset_properties["biased_variance"] = batch_biased_variance
         sum_value = subset_properties["sum"]
         batch_count = subset_properties["match_count"]
@@ -1782,7 +1954,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         ):
             return
 
-        batch_biased_skewness = utils.biased_skew(df_series)
+        batch_biased_skewness = self._get_batch_moments(
+            df_series, subset_properties
+        ).biased_skewness
         subset_properties["biased_skewness"] = batch_biased_skewness
         batch_count = subset_properties["match_count"]
         batch_biased_var = subset_properties["biased_variance"]
@@ -1826,7 +2000,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         ):
             return
 
-        batch_biased_kurtosis = utils.biased_kurt(df_series)
+        batch_biased_kurtosis = self._get_batch_moments(
+            df_series, subset_properties
+        ).biased_kurtosis
         subset_properties["biased_kurtosis"] = batch_biased_kurtosis
         batch_count = subset_properties["match_count"]
         batch_biased_var = subset_properties["biased_variance"]
@@ -1854,8 +2030,11 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         subset_properties: dict,
     ) -> None:
         try:
+            if self._quantile_sketch is not None:
+                self._quantile_sketch.update(df_series.to_numpy())
             self._update_histogram(df_series)
-            self.histogram_selection = None
+            if self._histogram_expert_selection is None:
+                self.histogram_selection = None
             if self._has_histogram:
                 self._get_quantiles()
         except BaseException:
@@ -1882,7 +2061,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         :type subset_properties: dict
         :return: None
         """
-        num_zeros_value = (df_series == 0).sum()
+        num_zeros_value = self._get_batch_moments(
+            df_series, subset_properties
+        ).num_zeros
         subset_properties["num_zeros"] = num_zeros_value
         self.num_zeros = self.num_zeros + num_zeros_value
 
@@ -1904,7 +2085,9 @@ class NumericStatsMixin(BaseColumnProfiler[NumericStatsMixinT], metaclass=abc.AB
         :type subset_properties: dict
         :return: None
         """
-        num_negatives_value = (df_series < 0).sum()
+        num_negatives_value = self._get_batch_moments(
+            df_series, subset_properties
+        ).num_negatives
         subset_properties["num_negatives"] = num_negatives_value
         self.num_negatives = self.num_negatives + num_negatives_value
 
@@ -6,6 +6,7 @@ from typing import cast
 from pandas import DataFrame, Series
 
 from . import BaseColumnProfiler, utils
+from .base_column_profilers import ColumnView
 from .profiler_options import OrderOptions
 
 
@@ -393,18 +394,25 @@ class OrderColumn(BaseColumnProfiler["OrderColumn"]):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series: Series) -> OrderColumn:
+    def update(self, df_series: Series | ColumnView) -> OrderColumn:
         """
         Update the column profile.
 
-        :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :param df_series: df series or view of the column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: updated OrderColumn
         :rtype: OrderColumn
         """
         if len(df_series) == 0:
             return self
 
+        if isinstance(df_series, ColumnView):
+            # the order of numbers is determined on their parsed floats
+            if df_series.numeric_type_masks[1].all():
+                df_series = Series(df_series.float_values)
+            else:
+                df_series = df_series.str_series
+
         profile = dict(sample_size=len(df_series))
         OrderColumn._update_order(self, df_series=df_series)
         BaseColumnProfiler._perform_property_calcs(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import copy
+import functools
 import logging
 import pickle
 import random
@@ -23,6 +24,10 @@ from ..data_readers.data import Data
 from ..labelers.base_data_labeler import BaseDataLabeler
 from ..labelers.data_labelers import DataLabeler
 from . import utils
+from .base_column_profilers import ColumnView
+from .chi2_homogeneity import Chi2HomogeneityMatrix
+from .co_moments import CoMoments
+from .column_executor import ColumnExecutor
 from .column_profile_compilers import (
     BaseCompiler,
     ColumnDataLabelerCompiler,
@@ -38,10 +43,86 @@ from .profiler_options import (
     StructuredOptions,
     UnstructuredOptions,
 )
+from .row_index_set import RowIndexSet
+from .row_reservoir import RowReservoir
+from .sketches import HyperLogLogSketch, SortedHashSet
 
 logger = dp_logging.get_child_logger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _get_null_value_matcher(
+    null_values: tuple[str, ...]
+) -> tuple[re.Pattern, frozenset[str], bool]:
+    """
+    Compile the matcher for a null value configuration.
+
+    Cached such that the regex is only compiled once per configuration.
+
+    :param null_values: null value regexes to match an entire cell against
+    :type null_values: tuple(str)
+    :return: the compiled regex, the set of lowercase literal null values
+        which can be matched without the regex and whether any null value
+        could match a string containing a digit
+    :rtype: tuple(re.Pattern, frozenset(str), bool)
+    """
+    query = "|".join(null_values)
+    regex = re.compile(f"^(?:{query})$", flags=re.IGNORECASE)
+    literals = frozenset(
+        value.lower()
+        for value in null_values
+        if value.isascii() and re.escape(value) == value
+    )
+    # a null value made of only plain characters and quantifiers can only
+    # match strings made of those characters
+    can_match_digits = not all(
+        re.fullmatch(r"[^\\\[\]().|^$0-9]*", value) for value in null_values
+    )
+    return regex, literals, can_match_digits
+
+
+def _match_null_values(df_series: pd.Series, null_values: tuple[str, ...]) -> pd.Series:
+    """
+    Determine which cells of a series are null values.
+
+    The null values are only matched against the unique values of the
+    series, literal null values are found via set membership and the regex
+    is only applied to the remaining unique values. Numeric series whose null
+    values cannot match a number only check their nan and inf values.
+
+    :param df_series: series of strings or of a numeric dtype
+    :type df_series: pandas.Series
+    :param null_values: null value regexes to match an entire cell against
+    :type null_values: tuple(str)
+    :return: boolean mask of the null cells
+    :rtype: pandas.Series
+    """
+    regex, literals, can_match_digits = _get_null_value_matcher(null_values)
+
+    if not can_match_digits and df_series.dtype.kind in "iuf":
+        # the string of any finite number contains a digit
+        matches = pd.Series(False, index=df_series.index)
+        if df_series.dtype.kind == "f":
+            if regex.match(str(np.nan)):
+                matches |= df_series.isna()
+            for special_value in [np.inf, -np.inf]:
+                if regex.match(str(special_value)):
+                    matches |= df_series == special_value
+        return matches
+
+    uniques = pd.Series(pd.unique(df_series.values))
+    str_uniques = uniques if df_series.dtype == object else uniques.apply(str)
+
+    is_null = str_uniques.str.lower().isin(literals)
+    not_literal = ~is_null
+    if not_literal.any():
+        is_null[not_literal] = (
+            str_uniques[not_literal].str.match(regex, na=False).astype(bool)
+        )
+
+    return df_series.isin(uniques[is_null].values)
+
+
 class StructuredColProfiler:
     """For profiling structured data columns."""
 
@@ -53,7 +134,7 @@ class StructuredColProfiler:
         sampling_ratio: float = 0.2,
         min_true_samples: int = 0,
         sample_ids: np.ndarray = None,
-        pool: Pool = None,
+        pool: Pool | ColumnExecutor | None = None,
         column_index: int = None,
         options: StructuredOptions = None,
     ) -> None:
@@ -70,7 +151,7 @@ class StructuredColProfiler:
         :param sample_ids: Randomized list of sample indices
         :type sample_ids: list(list)
         :param pool: pool utilized for multiprocessing
-        :type pool: multiprocessing.Pool
+        :type pool: Union[multiprocessing.Pool, ColumnExecutor]
         :param column_index: index of the given column
         :type column_index: int
         :param options: Options for the structured profiler.
@@ -85,13 +166,23 @@ class StructuredColProfiler:
         self.sample: list[str] = list()
         self.null_count: int = 0
         self.null_types: list[str] = list()
-        self.null_types_index: dict = {}
+        self.null_types_index: dict[str, RowIndexSet] = {}
         self._min_id: int | None = None
         self._max_id: int | None = None
         self._index_shift: int | None = None
         self._last_batch_size: int | None = None
+        self._last_batch_null_mask: np.ndarray | None = None
         self.profiles: dict[str, BaseCompiler] = {}
 
+        # Sketch of the distinct values of the column and their number
+        self._distinct_sketch: HyperLogLogSketch | None = None
+        self._distinct_sample_size: int = 0
+        if isinstance(options, StructuredOptions) and options.distinct_count.is_enabled:
+            self._distinct_sketch = HyperLogLogSketch(
+                register_count=options.distinct_count.hll.register_count,
+                seed=options.distinct_count.hll.seed,
+            )
+
         NO_FLAG = 0
         self._null_values: dict[str, re.RegexFlag | int] = {
             "": NO_FLAG,
@@ -126,20 +217,28 @@ class StructuredColProfiler:
                 null_values=self._null_values,
                 min_true_samples=self._min_true_samples,
                 sample_ids=sample_ids,
+                keep_native_dtype=True,
             )
             self.update_column_profilers(clean_sampled_df, pool)
             self._update_base_stats(base_stats)
 
     def update_column_profilers(
-        self, clean_sampled_df: pd.Series, pool: Pool = None
+        self,
+        clean_sampled_df: pd.Series | ColumnView,
+        pool: Pool | ColumnExecutor | None = None,
+        profile_types: list[str] = None,
     ) -> None:
         """
         Calculate type statistics and label dataset.
 
-        :param clean_sampled_df: sampled series with none types dropped
-        :type clean_sampled_df: Pandas.Series
+        :param clean_sampled_df: sampled series with none types dropped, either
+            as strings or with a native numeric dtype
+        :type clean_sampled_df: Union[Pandas.Series, ColumnView]
         :param pool: pool utilized for multiprocessing
-        :type pool: multiprocessing.pool
+        :type pool: Union[multiprocessing.Pool, ColumnExecutor]
+        :param profile_types: names of the profile compilers to update, all of
+            them if None
+        :type profile_types: list[str]
         """
         if self.name is None:
             self.name = clean_sampled_df.name
@@ -150,34 +249,49 @@ class StructuredColProfiler:
                 self.name,
             )
 
-        # First run, create the compilers
-        if self.profiles is None or len(self.profiles) == 0:
-            self.profiles = {
-                "data_type_profile": ColumnPrimitiveTypeProfileCompiler(
-                    clean_sampled_df, self.options, pool
-                ),
-                "data_stats_profile": ColumnStatsProfileCompiler(
-                    clean_sampled_df, self.options, pool
-                ),
-            }
+        # Share the native numeric data, if any, with the profilers accepting it
+        column_view = ColumnView.from_series(clean_sampled_df)
 
-            use_data_labeler = True
-            if self.options and isinstance(self.options, StructuredOptions):
-                use_data_labeler = self.options.data_labeler.is_enabled
+        if self._distinct_sketch is not None and (
+            profile_types is None or "data_stats_profile" in profile_types
+        ):
+            # Only the unique values, also counted by the categories, are hashed
+            self._distinct_sketch.update(
+                pd.Series(column_view.value_counts.index, dtype=object)
+            )
+            self._distinct_sample_size += len(column_view)
 
-            if use_data_labeler:
-                self.profiles.update(
-                    {
-                        "data_label_profile": ColumnDataLabelerCompiler(
-                            clean_sampled_df, self.options, pool
-                        )
-                    }
-                )
+        compiler_classes: dict[str, type[BaseCompiler]] = {
+            "data_type_profile": ColumnPrimitiveTypeProfileCompiler,
+            "data_stats_profile": ColumnStatsProfileCompiler,
+        }
+        use_data_labeler = True
+        if self.options and isinstance(self.options, StructuredOptions):
+            use_data_labeler = self.options.data_labeler.is_enabled
+        if use_data_labeler:
+            compiler_classes["data_label_profile"] = ColumnDataLabelerCompiler
+
+        # First run, create the compilers, else update the existing ones
+        if self.profiles is None or len(self.profiles) == 0:
+            self.profiles = {}
+            compiler_names = list(compiler_classes)
+        elif profile_types is None:
+            compiler_names = list(self.profiles)
         else:
+            # The compilers may be split across calls, some not created yet
+            compiler_names = list(self.profiles) + [
+                name for name in compiler_classes if name not in self.profiles
+            ]
 
-            # Profile compilers being updated
-            for profile in self.profiles.values():
-                profile.update_profile(clean_sampled_df, pool)
+        for name in compiler_names:
+            if profile_types is not None and name not in profile_types:
+                continue
+            if name in self.profiles:
+                self.profiles[name].update_profile(column_view, pool)
+            else:
+                self.profiles[name] = compiler_classes[name](
+                    column_view, self.options, pool
+                )
 
     def __add__(self, other: StructuredColProfiler) -> StructuredColProfiler:
         """
@@ -236,6 +350,14 @@ class StructuredColProfiler:
         )
         samples = list(dict.fromkeys(self.sample + other.sample))
         merged_profile.sample = random.sample(samples, min(len(samples), 5))
+        if self._distinct_sketch is not None and other._distinct_sketch is not None:
+            merged_profile._distinct_sketch = copy.deepcopy(self._distinct_sketch)
+            merged_profile._distinct_sketch.merge(other._distinct_sketch)
+            merged_profile._distinct_sample_size = (
+                self._distinct_sample_size + other._distinct_sample_size
+            )
+        else:
+            merged_profile._distinct_sketch = None
         for profile_name in self.profiles:
             merged_profile.profiles[profile_name] = (
                 self.profiles[profile_name] + other.profiles[profile_name]
@@ -286,10 +408,25 @@ class StructuredColProfiler:
                     self.null_types, other_profile.null_types
                 ),
                 "null_types_index": utils.find_diff_of_dicts_with_diff_keys(
-                    self.null_types_index, other_profile.null_types_index
+                    self._get_null_types_index_sets(),
+                    other_profile._get_null_types_index_sets(),
                 ),
             }
         )
+        if (
+            self._distinct_sketch is not None
+            and other_profile._distinct_sketch is not None
+        ):
+            distinct_stats = self._get_distinct_stats()
+            other_distinct_stats = other_profile._get_distinct_stats()
+            unordered_profile["statistics"].update(
+                {
+                    key: utils.find_diff_of_numbers(
+                        distinct_stats[key], other_distinct_stats[key]
+                    )
+                    for key in distinct_stats
+                }
+            )
 
         if unordered_profile.get("data_type", None) is not None:
             unordered_profile["statistics"].update(
@@ -346,9 +483,11 @@ class StructuredColProfiler:
                 "sample_size": self.sample_size,
                 "null_count": self.null_count,
                 "null_types": self.null_types,
-                "null_types_index": self.null_types_index,
+                "null_types_index": self._get_null_types_index_sets(),
             }
         )
+        if self._distinct_sketch is not None:
+            unordered_profile["statistics"].update(self._get_distinct_stats())
 
         if unordered_profile.get("data_type", None) is not None:
             unordered_profile["statistics"].update(
@@ -384,9 +523,51 @@ class StructuredColProfiler:
         """Return a report."""
         return self.report(remove_disabled_flag=False)
 
+    def _get_distinct_stats(self) -> dict[str, int | float]:
+        """
+        Return the unique count and ratio of the column.
+
+        The exact counts of the categories are used while they are all kept,
+        else the count is estimated by the sketch of the distinct values.
+
+        :return: unique count and unique ratio
+        :rtype: dict
+        """
+        # The estimate cannot exceed the number of values seen
+        unique_count = min(
+            cast(HyperLogLogSketch, self._distinct_sketch).cardinality(),
+            self._distinct_sample_size,
+        )
+        stats_compiler = self.profiles.get("data_stats_profile")
+        category_profile = None
+        if stats_compiler is not None:
+            category_profile = stats_compiler._profiles.get("category")
+        if (
+            category_profile is not None
+            and not category_profile._stop_condition_is_met
+            and (
+                category_profile._heavy_hitters is None
+                or category_profile._heavy_hitters.is_exact
+            )
+        ):
+            unique_count = len(category_profile.categories)
+
+        unique_ratio = 0.0
+        if self._distinct_sample_size:
+            unique_ratio = unique_count / self._distinct_sample_size
+        return {"unique_count": unique_count, "unique_ratio": unique_ratio}
+
+    def _get_null_types_index_sets(self) -> dict[str, set]:
+        """Return the row indices of each null type as sets for reporting."""
+        return {
+            null_type: set(null_rows)
+            for null_type, null_rows in self.null_types_index.items()
+        }
+
     def _update_base_stats(self, base_stats: dict) -> None:
         self.sample_size += base_stats["sample_size"]
         self._last_batch_size = base_stats["sample_size"]
+        self._last_batch_null_mask = base_stats.get("null_mask")
         self.sample = base_stats["sample"]
         self.null_count += base_stats["null_count"]
         self.null_types = utils._combine_unique_sets(
@@ -411,7 +592,7 @@ class StructuredColProfiler:
             base_max = base_max + self._index_shift
 
             base_nti = {
-                k: {x + self._index_shift for x in v}
+                k: RowIndexSet(v).shift(self._index_shift)
                 for k, v in base_stats["null_types"].items()
             }
 
@@ -427,9 +608,9 @@ class StructuredColProfiler:
 
         # Update null row indices
         for null_type, null_rows in base_nti.items():
-            if type(null_rows) is list:
-                null_rows.sort()
-            self.null_types_index.setdefault(null_type, set()).update(null_rows)
+            self.null_types_index[null_type] = RowIndexSet(
+                self.null_types_index.get(null_type)
+            ).union(null_rows)
 
     def update_profile(
         self,
@@ -437,7 +618,7 @@ class StructuredColProfiler:
         sample_size: int = None,
         min_true_samples: int = None,
         sample_ids: np.ndarray = None,
-        pool: Pool = None,
+        pool: Pool | ColumnExecutor | None = None,
     ) -> None:
         """
         Update the column profiler.
@@ -452,7 +633,7 @@ class StructuredColProfiler:
         :param sample_ids: Randomized list of sample indices
         :type sample_ids: list(list)
         :param pool: pool utilized for multiprocessing
-        :type pool: multiprocessing.Pool
+        :type pool: Union[multiprocessing.Pool, ColumnExecutor]
         """
         if not sample_size:
             sample_size = len(df_series)
@@ -467,6 +648,7 @@ class StructuredColProfiler:
             null_values=self._null_values,
             min_true_samples=min_true_samples,
             sample_ids=sample_ids,
+            keep_native_dtype=True,
         )
 
         self._update_base_stats(base_stats)
@@ -495,6 +677,7 @@ class StructuredColProfiler:
         null_values: dict[str, re.RegexFlag | int] = None,
         min_true_samples: int = None,
         sample_ids: np.ndarray | list[list[int]] | None = None,
+        keep_native_dtype: bool = False,
     ) -> tuple[pd.Series, dict]:
         """
         Identify null characters and return them in a dictionary.
@@ -514,6 +697,9 @@ class StructuredColProfiler:
         :type min_true_samples: int
         :param sample_ids: Randomized list of sample indices
         :type sample_ids: list(list)
+        :param keep_native_dtype: if True, columns with a native int or float64
+            dtype are returned with their dtype instead of as strings
+        :type keep_native_dtype: bool
         :return: updated column with null removed and dictionary of null
             parameters
         :rtype: pd.Series, dict
@@ -532,14 +718,24 @@ class StructuredColProfiler:
                     "sample_size": 0,
                     "null_count": 0,
                     "null_types": dict(),
+                    "null_mask": np.empty(0, dtype=np.uint8),
                     "sample": [],
                     "min_id": None,
                     "max_id": None,
                 },
             )
 
-        # Pandas reads empty values in the csv files as nan
-        df_series = df_series.apply(str)
+        # Pandas reads empty values in the csv files as nan, hence values are
+        # matched as strings. Numeric columns are only converted to strings
+        # once their null values are removed.
+        is_numeric = isinstance(df_series.dtype, np.dtype) and (
+            df_series.dtype.kind in "biuf"
+        )
+        if not is_numeric and not (
+            df_series.dtype == object
+            and pd.api.types.infer_dtype(df_series, skipna=False) == "string"
+        ):
+            df_series = df_series.apply(str)
 
         # Record min and max index values if index is int
         is_index_all_ints = True
@@ -561,6 +757,7 @@ class StructuredColProfiler:
             )
 
         # Select generator depending if sample_ids availability
+        sample_ind_generator: Generator[np.ndarray | list, None, Any]
         if sample_ids is None:
             sample_ind_generator = utils.shuffle_in_chunks(
                 len_df, chunk_size=sample_size
@@ -571,10 +768,10 @@ class StructuredColProfiler:
             )
 
         na_columns: dict = dict()
+        null_masks = []
         true_sample_set = set()
         total_sample_size = 0
-        query = "|".join(null_values.keys())
-        regex = f"^(?:{(query)})$"
+        null_value_keys = tuple(null_values.keys())
         for chunked_sample_ids in sample_ind_generator:
             total_sample_size += len(chunked_sample_ids)
 
@@ -582,14 +779,22 @@ class StructuredColProfiler:
             df_subset = df_series.iloc[chunked_sample_ids]
 
             # Query should search entire cell for all elements at once
-            matches = df_subset.str.match(regex, flags=re.IGNORECASE)
+            matches = _match_null_values(df_subset, null_value_keys)
+            null_masks.append(matches.to_numpy(dtype=bool))
 
             # Split series into None samples and true samples
             true_sample_set.update(df_subset[~matches].index)
 
-            # Iterate over all the Nones
-            for index, cell in df_subset[matches].items():
-                na_columns.setdefault(cell, list()).append(index)
+            # Group the indices of the Nones by their null value
+            null_subset = df_subset[matches]
+            if is_numeric:
+                null_subset = null_subset.apply(str)
+            for cell, indices in null_subset.groupby(
+                null_subset.values, sort=False
+            ).indices.items():
+                na_columns.setdefault(cell, list()).extend(
+                    null_subset.index[indices].tolist()
+                )
 
             # Ensure minimum number of true samples met
             # and if total_sample_size >= sample size, exit
@@ -612,13 +817,23 @@ class StructuredColProfiler:
 
         # Split out true values for later utilization
         df_series = df_series.loc[true_sample_list]
+        keep_native_dtype = keep_native_dtype and ColumnView.is_native_numeric(
+            df_series
+        )
+        if is_numeric and not keep_native_dtype:
+            df_series = df_series.apply(str).astype(object)
         total_na = total_sample_size - len(true_sample_list)
 
+        sample = random.sample(list(df_series.values), min(len(df_series), 5))
+        if keep_native_dtype:
+            sample = [str(value) for value in sample]
+
         base_stats = {
             "sample_size": total_sample_size,
             "null_count": total_na,
             "null_types": na_columns,
-            "sample": random.sample(list(df_series.values), min(len(df_series), 5)),
+            "null_mask": np.packbits(np.concatenate(null_masks or [[]]).astype(bool)),
+            "sample": sample,
             "min_id": min_id,
             "max_id": max_id,
         }
@@ -1520,20 +1735,37 @@ class StructuredProfiler(BaseProfiler):
         # Structured specific properties
         self.row_has_null_count = 0
         self.row_is_null_count = 0
-        self.hashed_row_object: HyperLogLog | dict = dict()
+        full_options = self.options.row_statistics.unique_count.full
+        self.hashed_row_object: (
+            SortedHashSet | HyperLogLogSketch | HyperLogLog | dict
+        ) = SortedHashSet(
+            spill_threshold=full_options.spill_threshold,
+            spill_dirpath=full_options.spill_dirpath,
+        )
         self._profile: list[StructuredColProfiler] = []  # type: ignore[assignment]
         self._col_name_to_idx: dict[str | int, list[int]] = defaultdict(list)
         self.correlation_matrix: np.ndarray = None  # type: ignore[assignment]
-        self.chi2_matrix: np.ndarray = None  # type: ignore[assignment]
+        self._correlation_moments: CoMoments | None = None
+        self._chi2_matrix: np.ndarray | None = None
+        self._chi2_homogeneity: Chi2HomogeneityMatrix | None = None
+        self._chi2_is_stale = False
 
         # capitalone/synthetic-data specific metrics
         self._null_replication_metrics: dict = None  # type: ignore[assignment]
 
+        # Pools reused by every batch, started when first needed
+        self._column_executors: dict[str, ColumnExecutor] = {}
+
+        # Rows sampled across batches, labeled once needed by a report
+        self._reservoir: RowReservoir | None = None
+        self._reservoir_changed: bool = False
+        if self.options.reservoir_sampling.is_enabled:
+            self._reservoir = RowReservoir(self.options.reservoir_sampling.size)
+
         if self.options.row_statistics.unique_count.hashing_method == "hll":
-            self.hashed_row_object = HyperLogLog(
-                p=options.row_statistics.unique_count.hll.register_count,
+            self.hashed_row_object = HyperLogLogSketch(
+                register_count=options.row_statistics.unique_count.hll.register_count,
                 seed=options.row_statistics.unique_count.hll.seed,
-                sparse=False,
             )
         if data is not None:
             self.update_profile(data)
@@ -1564,6 +1796,12 @@ class StructuredProfiler(BaseProfiler):
                 "profiles and cannot be added together."
             )
 
+        # Check reservoir sampling options
+        if (self._reservoir is None) != (other._reservoir is None):
+            raise ValueError(
+                "Attempting to merge two profiles with reservoir sampling "
+                "option enabled on one profile but not the other."
+            )
         # Check row statistics options
         if (
             self.options.row_statistics.is_enabled
@@ -1622,6 +1860,10 @@ class StructuredProfiler(BaseProfiler):
         :return: merger of the two profiles
         :rtype: StructuredProfiler
         """
+        # Both profiles need the same column profilers to be merged
+        self._label_reservoir()
+        if isinstance(other, StructuredProfiler):
+            other._label_reservoir()
         merged_profile = cast(StructuredProfiler, super().__add__(other))
 
         # struct specific property merging
@@ -1640,16 +1882,11 @@ class StructuredProfiler(BaseProfiler):
                 self.options.row_statistics.unique_count.is_enabled
                 and other.options.row_statistics.unique_count.is_enabled
             ):
-                if isinstance(self.hashed_row_object, dict) and isinstance(
-                    other.hashed_row_object, dict
-                ):
-                    merged_profile.hashed_row_object.update(self.hashed_row_object)
-                    merged_profile.hashed_row_object.update(other.hashed_row_object)
-                elif isinstance(self.hashed_row_object, HyperLogLog) and isinstance(
-                    other.hashed_row_object, HyperLogLog
-                ):
-                    self.hashed_row_object.merge(other.hashed_row_object),
-                    merged_profile.hashed_row_object = self.hashed_row_object
+                merged_profile.hashed_row_object = self._merge_hashed_rows(
+                    merged_profile.hashed_row_object,
+                    self.hashed_row_object,
+                    other.hashed_row_object,
+                )
 
         self_to_other_idx = self._get_and_validate_schema_mapping(
             self._col_name_to_idx, other._col_name_to_idx
@@ -1665,9 +1902,18 @@ class StructuredProfiler(BaseProfiler):
         # schemas are asserted to be identical
         merged_profile._col_name_to_idx = copy.deepcopy(self._col_name_to_idx)
 
+        # the merged reservoir is labeled once needed
+        if self._reservoir is not None and other._reservoir is not None:
+            merged_profile._reservoir = self._reservoir + other._reservoir
+            merged_profile._reservoir_changed = True
+
         # merge correlation
         if self.options.correlation.is_enabled and other.options.correlation.is_enabled:
-            merged_profile.correlation_matrix = self._merge_correlation(other)
+            merged_profile._correlation_moments = self._merge_correlation(other)
+            if merged_profile._correlation_moments is not None:
+                merged_profile.correlation_matrix = (
+                    merged_profile._correlation_moments.correlation()
+                )
 
         # recompute chi2 if needed
         if (
@@ -1686,7 +1932,7 @@ class StructuredProfiler(BaseProfiler):
             elif chi2_mat1 is None or chi2_mat2 is None:
                 merged_profile.chi2_matrix = None
             else:
-                merged_profile.chi2_matrix = merged_profile._update_chi2()
+                merged_profile._chi2_is_stale = True
 
         if (
             self.options.null_replication_metrics.is_enabled
@@ -1715,6 +1961,8 @@ class StructuredProfiler(BaseProfiler):
             options = {}
 
         report = super().diff(other_profile, options)
+        self._label_reservoir()
+        other_profile._label_reservoir()
         report["global_stats"].update(
             {
                 "samples_used": utils.find_diff_of_numbers(
@@ -1892,10 +2140,12 @@ class StructuredProfiler(BaseProfiler):
 
         :return: list[StructuredColProfiler]
         """
+        self._label_reservoir()
         return cast(List[StructuredColProfiler], super().profile)
 
     def report(self, report_options: dict = None) -> dict:
         """Return a report."""
+        self._label_reservoir()
         if not report_options:
             report_options = {
                 "output_format": None,
@@ -1959,9 +2209,9 @@ class StructuredProfiler(BaseProfiler):
             return None
 
         if self.total_samples:
-            if isinstance(self.hashed_row_object, dict):
+            if isinstance(self.hashed_row_object, (SortedHashSet, dict)):
                 return len(self.hashed_row_object) / self.total_samples
-            elif isinstance(self.hashed_row_object, HyperLogLog):
+            elif isinstance(self.hashed_row_object, (HyperLogLogSketch, HyperLogLog)):
                 return int(self.hashed_row_object.cardinality()) / self.total_samples
         return 0
 
@@ -1991,29 +2241,147 @@ class StructuredProfiler(BaseProfiler):
         ):
             return None
 
-        if isinstance(self.hashed_row_object, dict):
+        if isinstance(self.hashed_row_object, (SortedHashSet, dict)):
             return self.total_samples - len(self.hashed_row_object)
-        elif isinstance(self.hashed_row_object, HyperLogLog):
+        elif isinstance(self.hashed_row_object, (HyperLogLogSketch, HyperLogLog)):
             return max(
                 0, self.total_samples - int(self.hashed_row_object.cardinality())
             )
         return 0
 
+    @staticmethod
+    def _get_row_sketch(
+        hashed_row_object: SortedHashSet | HyperLogLogSketch | HyperLogLog | dict,
+    ) -> SortedHashSet | HyperLogLogSketch:
+        """
+        Return the sketch of the hashed rows, converted if saved as an HLL or dict.
+
+        Profiles saved by prior versions hashed the rows into an HLL object,
+        whose registers are carried over to a sketch, or into a dict, whose
+        hashes are carried over to a sorted set. Their rows were hashed
+        differently than by the sketches, hence a row hashed under both
+        schemes is counted twice.
+
+        :param hashed_row_object: sketch or set of the hashed rows
+        :type hashed_row_object: Union[SortedHashSet, HyperLogLogSketch,
+            HyperLogLog, dict]
+        :return: sketch or set of the hashed rows
+        :rtype: Union[SortedHashSet, HyperLogLogSketch]
+        """
+        if isinstance(hashed_row_object, HyperLogLog):
+            return HyperLogLogSketch.from_registers(
+                hashed_row_object.registers(), seed=hashed_row_object.seed()
+            )
+        if isinstance(hashed_row_object, dict):
+            return SortedHashSet.from_hashes(
+                np.fromiter(
+                    hashed_row_object, dtype=np.uint64, count=len(hashed_row_object)
+                )
+            )
+        return hashed_row_object
+
+    @classmethod
+    def _merge_hashed_rows(
+        cls,
+        merged_row_object: SortedHashSet | HyperLogLogSketch | HyperLogLog | dict,
+        hashed_row_object: SortedHashSet | HyperLogLogSketch | HyperLogLog | dict,
+        other_row_object: SortedHashSet | HyperLogLogSketch | HyperLogLog | dict,
+    ) -> SortedHashSet | HyperLogLogSketch | HyperLogLog | dict:
+        """
+        Return the merge of the hashed rows of two profiles.
+
+        The HLL objects and dicts of profiles saved by prior versions are
+        merged together as such, keeping their hashing of the rows. Only if
+        merged with a sketch are they converted, the rows hashed under both
+        schemes being counted twice.
+
+        :param merged_row_object: empty sketch or set of the merged profile
+        :type merged_row_object: Union[SortedHashSet, HyperLogLogSketch,
+            HyperLogLog, dict]
+        :param hashed_row_object: hashed rows of the first profile
+        :type hashed_row_object: Union[SortedHashSet, HyperLogLogSketch,
+            HyperLogLog, dict]
+        :param other_row_object: hashed rows of the second profile
+        :type other_row_object: Union[SortedHashSet, HyperLogLogSketch,
+            HyperLogLog, dict]
+        :return: hashed rows of the merged profile
+        :rtype: Union[SortedHashSet, HyperLogLogSketch, HyperLogLog, dict]
+        """
+        if isinstance(hashed_row_object, dict) and isinstance(other_row_object, dict):
+            return {**hashed_row_object, **other_row_object}
+        elif isinstance(hashed_row_object, HyperLogLog) and isinstance(
+            other_row_object, HyperLogLog
+        ):
+            merged_hll = copy.deepcopy(hashed_row_object)
+            merged_hll.merge(other_row_object)
+            return merged_hll
+
+        if isinstance(hashed_row_object, (HyperLogLog, dict)) or isinstance(
+            other_row_object, (HyperLogLog, dict)
+        ):
+            warnings.warn(
+                "The rows of a profile saved by a prior version were hashed "
+                "differently, hence the merged unique row count may count the "
+                "same rows twice."
+            )
+        for row_object in [hashed_row_object, other_row_object]:
+            row_sketch = cls._get_row_sketch(row_object)
+            if isinstance(merged_row_object, SortedHashSet) and isinstance(
+                row_sketch, SortedHashSet
+            ):
+                merged_row_object.merge(row_sketch)
+            elif isinstance(merged_row_object, HyperLogLogSketch) and isinstance(
+                row_sketch, HyperLogLogSketch
+            ):
+                merged_row_object.merge(row_sketch)
+            else:
+                raise ValueError(
+                    "Unable to merge the hashed rows of profiles which were not "
+                    "hashed with the same hashing method."
+                )
+        return merged_row_object
+
+    def _update_legacy_hashed_rows(self, data: pd.DataFrame) -> None:
+        """
+        Hash the rows into the HLL object or dict of a profile of a prior version.
+
+        The rows are hashed as by the prior versions, such that the same rows
+        keep hashing the same across the batches.
+
+        :param data: a dataset
+        :type data: pandas.DataFrame
+        """
+        if isinstance(self.hashed_row_object, dict):
+            try:
+                row_hashes = pd.util.hash_pandas_object(data, index=False)
+            except TypeError:
+                row_hashes = pd.util.hash_pandas_object(data.astype(str), index=False)
+            self.hashed_row_object.update(dict.fromkeys(row_hashes, True))
+        elif isinstance(self.hashed_row_object, HyperLogLog):
+            batch_size = 2048
+            for start_ind in range(0, len(data), batch_size):
+                for record in (
+                    data[start_ind : start_ind + batch_size]
+                    .to_json(orient="records", lines=True)
+                    .splitlines()
+                ):
+                    self.hashed_row_object.add(record)
+
     @utils.method_timeit(name="row_stats")
-    def _update_row_statistics(
-        self, data: pd.DataFrame, sample_ids: list[int] = None
-    ) -> None:
+    def _update_row_statistics(self, data: pd.DataFrame) -> None:
         """
-        Iterate over the provided dataset row by row and calculate row stats.
+        Calculate the row stats of the provided dataset.
 
         Specifically, number of unique rows,
         rows containing null values, and total rows reviewed. This
         function is safe to use in batches.
 
+        The null masks of the rows sampled by every column are stacked into a
+        matrix of packed bits, whose any and all reductions over the columns
+        give the rows with a null and the rows of only nulls.
+
         :param data: a dataset
         :type data: pandas.DataFrame
-        :param sample_ids: list of indices in order they were sampled in data
-        :type sample_ids: list(int)
         """
         if not isinstance(data, pd.DataFrame):
             raise ValueError(
@@ -2021,92 +2389,49 @@ class StructuredProfiler(BaseProfiler):
             )
 
         if self.options.row_statistics.unique_count.is_enabled:
-            if isinstance(self.hashed_row_object, dict):
-                try:
-                    self.hashed_row_object.update(
-                        dict.fromkeys(
-                            pd.util.hash_pandas_object(data, index=False), True
-                        )
-                    )
-                except TypeError:
-                    self.hashed_row_object.update(
-                        dict.fromkeys(
-                            pd.util.hash_pandas_object(data.astype(str), index=False),
-                            True,
-                        )
-                    )
-            elif isinstance(self.hashed_row_object, HyperLogLog):
-                batch_size = 2048
-
-                for batch_ind in range(len(data) // batch_size + 1):
-                    start_ind = batch_ind * batch_size
-                    if start_ind >= len(data):
-                        break
-                    end_ind = (batch_ind + 1) * batch_size
-                    for record in (
-                        data[start_ind : min(end_ind, len(data))]
-                        .to_json(orient="records", lines=True)
-                        .splitlines()
-                    ):
-                        self.hashed_row_object.add(record)
-
-        # Calculate Null Column Count
-        null_rows = set()
-        null_in_row_count = set()
-        first_col_flag = True
-        for column in self._profile:
-            null_type_dict = column.null_types_index
-            null_row_indices = set()
-            if null_type_dict:
-                null_row_indices = set.union(*null_type_dict.values())
-
-            # If sample ids provided, only consider nulls in rows that
-            # were fully sampled
-            if sample_ids is not None:
-                # This is the amount (integer) indices were shifted by in the
-                # event of overlap
-                shift = column._index_shift
-                if shift is None:
-                    # Shift is None if index is str or if no overlap detected
-                    null_row_indices = null_row_indices.intersection(
-                        data.index[sample_ids[: self._min_sampled_from_batch]]
-                    )
-                else:
-                    # Only shift if index shift detected (must be ints)
-                    null_row_indices = null_row_indices.intersection(
-                        data.index[sample_ids[: self._min_sampled_from_batch]] + shift
-                    )
-
-            # Find the common null indices between the columns
-            if first_col_flag:
-                null_rows = null_row_indices
-                null_in_row_count = null_row_indices
-                first_col_flag = False
+            if isinstance(self.hashed_row_object, (HyperLogLog, dict)):
+                self._update_legacy_hashed_rows(data)
             else:
-                null_rows = null_rows.intersection(null_row_indices)
-                null_in_row_count = null_in_row_count.union(null_row_indices)
+                self.hashed_row_object.update(data)
 
-        # If sample_ids provided, increment since that means only new data read
-        if sample_ids is not None:
-            self.row_has_null_count += len(null_in_row_count)
-            self.row_is_null_count += len(null_rows)
-        else:
-            self.row_has_null_count = len(null_in_row_count)
-            self.row_is_null_count = len(null_rows)
+        # Only the rows sampled by every column are considered, which come
+        # first in the shared order of the sample ids
+        sample_count = self._min_sampled_from_batch
+        null_masks = []
+        for column in self._profile:
+            if column._last_batch_null_mask is not None:
+                null_masks.append(column._last_batch_null_mask[: -(-sample_count // 8)])
+            column._last_batch_null_mask = None
+        if not null_masks or not sample_count:
+            return
+
+        null_matrix = np.stack(null_masks)
+        self.row_has_null_count += int(
+            np.unpackbits(
+                np.bitwise_or.reduce(null_matrix, axis=0), count=sample_count
+            ).sum()
+        )
+        self.row_is_null_count += int(
+            np.unpackbits(
+                np.bitwise_and.reduce(null_matrix, axis=0), count=sample_count
+            ).sum()
+        )
 
-    def _get_correlation(
-        self, clean_samples: dict, batch_properties: dict
-    ) -> pd.DataFrame:
+    def _get_correlation_values(
+        self, clean_samples: dict[int, pd.Series | ColumnView]
+    ) -> tuple[np.ndarray, list[int]]:
         """
-        Calculate correlation matrix on the cleaned data.
+        Return the numeric values of the cleaned data used for correlation.
+
+        The values of the numeric columns are aligned by their row index, such
+        that rows null in every numeric column are left out and values null
+        in only some columns are NaN. The floats parsed by the column
+        profilers are reused.
 
         :param clean_samples: the input cleaned dataset
         :type clean_samples: dict()
-        :param batch_properties: mean/std/counts of each batch column necessary
-        for correlation computation
-        :type batch_properties: dict()
-        :return: correlation matrix
-        :rtype: pd.DataFrame
+        :return: rows of the numeric columns and index of these columns
+        :rtype: tuple(numpy.ndarray, list(int))
         """
         columns = self.options.correlation.columns
         column_ids = list(range(len(self._profile)))
@@ -2120,269 +2445,148 @@ class StructuredProfiler(BaseProfiler):
                 ColumnPrimitiveTypeProfileCompiler,
                 self._profile[idx].profiles["data_type_profile"],
             ).selected_data_type
-            if data_type not in ["int", "float"]:
-                clean_samples.pop(idx)
-            else:
+            if data_type in ["int", "float"] and idx in clean_samples:
                 clean_column_ids.append(idx)
-        data = pd.DataFrame(clean_samples).apply(pd.to_numeric, errors="coerce")
-        means = {index: mean for index, mean in enumerate(batch_properties["mean"])}
-        data = data.fillna(value=means)
-        data = data[clean_column_ids]
-
-        # Update the counts/std if needed (i.e. if null rows or exist)
-        if (len(data) != batch_properties["count"]).any():
-            adjusted_stds = np.sqrt(
-                batch_properties["std"] ** 2
-                * (batch_properties["count"] - 1)
-                / (len(data) - 1)
+        if not clean_column_ids:
+            return np.empty((0, 0)), clean_column_ids
+
+        views = [ColumnView.from_series(clean_samples[idx]) for idx in clean_column_ids]
+        indexes = [view.series.index for view in views]
+        if all(index.equals(indexes[0]) for index in indexes[1:]):
+            return np.column_stack([view.float_values for view in views]), (
+                clean_column_ids
             )
-            batch_properties["std"] = adjusted_stds
-        # Set count key to a single number now that everything's been adjusted
-        batch_properties["count"] = len(data)
-
-        # fill correlation matrix with nan initially
-        n_cols = len(self._profile)
-        corr_mat = np.full((n_cols, n_cols), np.nan)
 
-        # then, fill in the correlations for valid columns
-        rows = [[id] for id in clean_column_ids]
-        corr_mat[rows, clean_column_ids] = np.corrcoef(data, rowvar=False)
+        row_index = functools.reduce(pd.Index.union, indexes)
+        if not row_index.is_unique:
+            # Duplicated row labels are aligned as by a DataFrame
+            values = pd.DataFrame(
+                {
+                    idx: pd.Series(view.float_values, index=view.series.index)
+                    for idx, view in zip(clean_column_ids, views)
+                }
+            )
+            return values.to_numpy(dtype=float), clean_column_ids
 
-        return corr_mat
+        values = np.full((len(row_index), len(views)), np.nan)
+        for i, (view, index) in enumerate(zip(views, indexes)):
+            values[row_index.get_indexer(index), i] = view.float_values
+        return values, clean_column_ids
 
     @utils.method_timeit(name="correlation")
-    def _update_correlation(
-        self, clean_samples: dict, prev_dependent_properties: dict
-    ) -> None:
+    def _update_correlation(self, clean_samples: dict) -> None:
         """
         Update correlation matrix for cleaned data.
 
         :param clean_samples: the input cleaned dataset
         :type clean_samples: dict()
         """
-        batch_properties = self._get_correlation_dependent_properties(clean_samples)
-        batch_corr = self._get_correlation(clean_samples, batch_properties)
-
-        self.correlation_matrix = self._merge_correlation_helper(
-            self.correlation_matrix,
-            prev_dependent_properties["mean"],
-            prev_dependent_properties["std"],
-            self.total_samples - self.row_is_null_count,
-            batch_corr,
-            batch_properties["mean"],
-            batch_properties["std"],
-            batch_properties["count"],
-        )
+        values, column_ids = self._get_correlation_values(clean_samples)
+        if self._correlation_moments is None:
+            self._correlation_moments = CoMoments(len(self._profile))
+        self._correlation_moments.update(values, column_ids)
+        self.correlation_matrix = self._correlation_moments.correlation()
 
     @utils.method_timeit(name="correlation")
-    def _merge_correlation(self, other: StructuredProfiler) -> pd.DataFrame:
+    def _merge_correlation(self, other: StructuredProfiler) -> CoMoments | None:
         """
-        Merge correlation matrix from two profiles.
+        Merge the correlation moments of two profiles.
 
         :param other: the other profile that needs to be merged
-        :return:
-        """
-        corr_mat1 = self.correlation_matrix
-        corr_mat2 = other.correlation_matrix
-        n1 = self.total_samples - self.row_is_null_count
-        n2 = other.total_samples - other.row_is_null_count
-        if n1 == 0:
-            return corr_mat2
-        if n2 == 0:
-            return corr_mat1
-
-        if corr_mat1 is None or corr_mat2 is None:
-            return None
-
-        # get column indices without nan
-        col_ids1 = np.where(~np.isnan(corr_mat1).all(axis=0))[0]
-        col_ids2 = np.where(~np.isnan(corr_mat2).all(axis=0))[0]
-
-        if len(col_ids1) != len(col_ids2) or len(col_ids1) <= 1:
-            return None
-        if (col_ids1 != col_ids2).any():
-            return None
-
-        mean1 = np.array(
-            [
-                self._profile[idx].profile["statistics"]["mean"]
-                for idx in range(len(self._profile))
-                if idx in col_ids1
-            ]
-        )
-        std1 = np.array(
-            [
-                self._profile[idx].profile["statistics"]["stddev"]
-                for idx in range(len(self._profile))
-                if idx in col_ids1
-            ]
-        )
+        :type other: StructuredProfiler
+        :return: moments of the rows of both profiles, None if neither has any
+        :rtype: Union[CoMoments, None]
+        """
+        self_moments = self._get_correlation_moments()
+        other_moments = other._get_correlation_moments()
+        if self_moments is None:
+            return copy.deepcopy(other_moments)
+        if other_moments is None:
+            return copy.deepcopy(self_moments)
 
-        mean2 = np.array(
-            [
-                other._profile[idx].profile["statistics"]["mean"]
-                for idx in range(len(self._profile))
-                if idx in col_ids2
-            ]
+        # Columns of the other profile are ordered as those of this one
+        self_to_other_idx = self._get_and_validate_schema_mapping(
+            self._col_name_to_idx, other._col_name_to_idx
         )
-        std2 = np.array(
-            [
-                other._profile[idx].profile["statistics"]["stddev"]
-                for idx in range(len(self._profile))
-                if idx in col_ids2
-            ]
+        other_moments = other_moments.reorder(
+            [self_to_other_idx[idx] for idx in range(len(self._profile))]
         )
-        return self._merge_correlation_helper(
-            corr_mat1, mean1, std1, n1, corr_mat2, mean2, std2, n2
+        return self_moments + other_moments
+
+    def _get_correlation_moments(self) -> CoMoments | None:
+        """
+        Return the correlation moments, rebuilt if saved by a prior version.
+
+        Profiles saved by prior versions only kept the correlation matrix, of
+        which the co-moments are rebuilt with the count of non-null rows and
+        the mean and stddev of each column, as prior versions merged them.
+
+        :return: moments of the rows profiled, None if not any
+        :rtype: Union[CoMoments, None]
+        """
+        if self._correlation_moments is not None or self.correlation_matrix is None:
+            return self._correlation_moments
+
+        column_count = len(self._profile)
+        moments = CoMoments(column_count)
+        moments.count = self.total_samples - self.row_is_null_count
+        if moments.count <= 0:
+            return moments
+        moments.mean = np.full(column_count, np.nan)
+        std = np.full(column_count, np.nan)
+        for idx in np.flatnonzero(~np.isnan(self.correlation_matrix).all(axis=0)):
+            statistics = self._profile[idx].profile["statistics"]
+            moments.mean[idx] = statistics.get("mean", np.nan)
+            std[idx] = statistics.get("stddev", np.nan)
+        moments.co_moments = (
+            self.correlation_matrix * np.outer(std, std) * (moments.count - 1)
         )
+        return moments
 
-    def _get_correlation_dependent_properties(self, batch: dict = None) -> dict:
+    @property
+    def chi2_matrix(self) -> np.ndarray | None:
         """
-        Obtain mean/stddev for calculating correlation.
+        Return the p-values of the chi2 tests between categorical columns.
 
-        By default, it will compute it on all columns in the profiler,
-        but if a batch is given, it will compute it only for the columns
-        in the batch.
+        The matrix is only computed when requested after the profile changed.
 
-        :param batch: Batch data
-        :type batch: dict
-        :return: dependent properties
-        :rtype: dict
+        :return: A matrix of p-values corresponding to the results
+        of the chi2 test between the columns
+        :rtype: np.array(np.array(float))
         """
-        dependent_properties = {
-            "mean": np.full(len(self._profile), np.nan),
-            "std": np.full(len(self._profile), np.nan),
-            "count": np.full(len(self._profile), np.nan),
-        }
-        for id in range(len(self._profile)):
-            compiler = self._profile[id]
-            data_type_compiler = compiler.profiles["data_type_profile"]
-            data_type = cast(
-                ColumnPrimitiveTypeProfileCompiler, data_type_compiler
-            ).selected_data_type
-            if data_type in ["int", "float"]:
-                data_type_profiler = data_type_compiler._profiles[data_type]
-                # Finding dependent values of previous, existing data
-                if batch is None:
-                    n = data_type_profiler.match_count
-                    dependent_properties["mean"][id] = data_type_profiler.mean
-                    # Subtract null row count as those aren't included in corr. calc
-                    dependent_properties["std"][id] = np.sqrt(
-                        data_type_profiler._biased_variance
-                        * n
-                        / (self.total_samples - self.row_is_null_count - 1)
-                    )
-                    dependent_properties["count"][id] = n
-                # Finding the properties of the batch data if given
-                elif id in batch.keys():
-                    history = data_type_profiler._batch_history[-1]
-                    n = history["match_count"]
-                    # Since we impute values, we want the total rows (including nulls)
-                    dependent_properties["mean"][id] = history["mean"]
-                    dependent_properties["std"][id] = np.sqrt(
-                        history["biased_variance"] * n / (n - 1)
-                    )
-                    dependent_properties["count"][id] = n
+        if self._chi2_is_stale:
+            self._chi2_matrix = self._update_chi2()
+            self._chi2_is_stale = False
+        return self._chi2_matrix
 
-        return dependent_properties
-
-    @staticmethod
-    def _merge_correlation_helper(
-        corr_mat1: pd.DataFrame,
-        mean1: np.ndarray,
-        std1: np.ndarray,
-        n1: int,
-        corr_mat2: pd.DataFrame,
-        mean2: np.ndarray,
-        std2: np.ndarray,
-        n2: int,
-    ) -> pd.DataFrame:
-        """
-        Help merge correlation matrix from two profiles.
-
-        :param corr_mat1: correlation matrix of profile1
-        :type corr_mat1: pd.DataFrame
-        :param mean1: mean of columns of profile1
-        :type mean1: np.array
-        :param std1: standard deviation of columns of profile1
-        :type std1: np.array
-        :param corr_mat2: correlation matrix of profile2
-        :type corr_mat2: pd.DataFrame
-        :param mean2: mean of columns of profile2
-        :type mean2: np.array
-        :param std2: standard deviation of columns of profile2
-        :type std2: np.array
-        :return: merged correlation matrix
-        """
-        if corr_mat1 is None:
-            return corr_mat2
-        elif corr_mat2 is None:
-            return corr_mat1
-        elif len(mean1) == 0:
-            return corr_mat2
-        elif len(mean2) == 0:
-            return corr_mat1
-
-        std_mat1 = np.outer(std1, std1)
-        std_mat2 = np.outer(std2, std2)
-        mean_diff_vector = mean1 - mean2
-        mean_diff_mat = np.outer(mean_diff_vector, mean_diff_vector)
-
-        cov1 = corr_mat1 * std_mat1
-        cov2 = corr_mat2 * std_mat2
-
-        n = n1 + n2
-
-        cov = cov1 * (n1 - 1) + cov2 * (n2 - 1) + mean_diff_mat * (n1 * n2) / n
-        cov = cov / (n - 1)
-
-        delta = mean2 - mean1
-        M2_1 = (n1 - 1) * (std1**2)
-        M2_2 = (n2 - 1) * (std2**2)
-        M2 = M2_1 + M2_2 + delta**2 * n1 * n2 / n
-        std = np.sqrt(M2 / (n - 1))
-
-        std_mat = np.outer(std, std)
-        corr_mat = cov / std_mat
-
-        return corr_mat
+    @chi2_matrix.setter
+    def chi2_matrix(self, chi2_matrix: np.ndarray | None) -> None:
+        """Set the p-values of the chi2 tests between categorical columns."""
+        self._chi2_matrix = chi2_matrix
+        self._chi2_is_stale = False
 
     def _update_chi2(self) -> np.ndarray:
         """
         Calculate p-val from chi-squared test for homogeneity between categorical cols.
 
+        Only the pairs of columns whose categories changed since the last
+        calculation are tested again.
+
         :return: A matrix of p-values corresponding to the results
         of the chi2 test between the columns
         :rtype: np.array(np.array(float))
         """
-        n_cols = len(self._profile)
-        # Fill matrix with nan initially
-        chi2_mat = np.full((n_cols, n_cols), np.nan)
-        # Compute chi_sq for each
-        for i in range(n_cols):
-            data_stats_compiler1 = self._profile[i].profiles["data_stats_profile"]
-            profiler1 = data_stats_compiler1._profiles["category"]
-            if not profiler1.is_match:
-                continue
-            for j in range(i, n_cols):
-                if i == j:
-                    chi2_mat[i][j] = 1
-                    continue
-                data_stats_compiler2 = self._profile[j].profiles["data_stats_profile"]
-                profiler2 = data_stats_compiler2._profiles["category"]
-                if not profiler2.is_match:
-                    continue
-
-                results = utils.perform_chi_squared_test_for_homogeneity(
-                    profiler1.categorical_counts,
-                    profiler1.sample_size,
-                    profiler2.categorical_counts,
-                    profiler2.sample_size,
-                )
-                chi2_mat[i][j] = results["p-value"]
-                chi2_mat[j][i] = results["p-value"]
-
-        return chi2_mat
+        if self._chi2_homogeneity is None:
+            self._chi2_homogeneity = Chi2HomogeneityMatrix(len(self._profile))
+        columns: list[tuple[dict, int] | None] = []
+        for profile in self._profile:
+            profiler = profile.profiles["data_stats_profile"]._profiles["category"]
+            columns.append(
+                (profiler.categorical_counts, profiler.sample_size)
+                if profiler.is_match
+                else None
+            )
+        return self._chi2_homogeneity.update(columns)
 
     def _update_null_replication_metrics(self, clean_samples: dict) -> None:
         """
@@ -2434,21 +2638,19 @@ class StructuredProfiler(BaseProfiler):
 
             # Gets list of null indices of the entire dataset
             null_type_dict = getattr(profile, "null_types_index")
-            null_indices = list(set.union(*null_type_dict.values()))
+            null_indices = RowIndexSet().union(*null_type_dict.values())
 
             # Keep only the null indices inside the chunk (reverse index shift)
+            is_null = null_indices.isin(data.index)
             if profile._index_shift is not None:
-                null_indices = [index - profile._index_shift for index in null_indices]
-                null_indices = [index for index in null_indices if index >= 0]
+                is_null = (data.index >= 0) & null_indices.isin(
+                    data.index + profile._index_shift
+                )
 
             # Partition data based on whether target column value is null or not
             # Calculate sum, mean of each partition without including current column
             # in calculation
-            sum_null = (
-                data.loc[data.index.intersection(null_indices), data.columns != col_id]
-                .sum()
-                .to_numpy()
-            )
+            sum_null = data.loc[is_null, data.columns != col_id].sum().to_numpy()
 
             # Add old sum_null if exists
             if col_id in self._null_replication_metrics:
@@ -2584,6 +2786,117 @@ class StructuredProfiler(BaseProfiler):
 
         return merged_properties
 
+    def update_profile(
+        self,
+        data: data_readers.base_data.BaseData | pd.DataFrame | pd.Series,
+        sample_size: int = None,
+        min_true_samples: int = None,
+    ) -> None:
+        """
+        Update the profile for data provided.
+
+        If the data is a CSVData object with a `chunk_size` specified or a
+        ParquetData object with `chunk_by_row_group` enabled, the file is
+        streamed and profiled one chunk at a time such that the full dataset
+        is never held in memory.
+
+        :param data: data to be profiled
+        :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame,
+            pandas.Series]
+        :param sample_size: number of samples to profile from each chunk
+        :type sample_size: int
+        :param min_true_samples: minimum number of non-null samples to profile
+        :type min_true_samples: int
+        :return: None
+        """
+        is_chunked = (
+            isinstance(data, data_readers.csv_data.CSVData) and data.chunk_size
+        ) or (
+            isinstance(data, data_readers.parquet_data.ParquetData)
+            and data.chunk_by_row_group
+        )
+        if not (is_chunked and data.is_structured):
+            super().update_profile(data, sample_size, min_true_samples)
+            return
+
+        for chunk in data.get_chunk_generator():
+            super().update_profile(chunk, sample_size, min_true_samples)
+
+        # set file properties from the data reader instead of the chunks
+        self.encoding = data.file_encoding
+        self.file_type = data.data_type
+
+    def _get_sample_size(self, data: pd.Series | pd.DataFrame | list) -> int:
+        """
+        Determine the minimum sampling size for profiling the dataset.
+
+        With reservoir sampling, the whole batch is profiled by default while
+        its rows are sampled into the reservoir.
+
+        :param data: a dataset
+        :type data: Union[pd.Series, pd.DataFrame, list]
+        :return: integer sampling size
+        :rtype: int
+        """
+        if self._reservoir is not None and not self._samples_per_update:
+            return len(data)
+        return super()._get_sample_size(data)
+
+    def _label_reservoir(self) -> None:
+        """Relabel the columns from the reservoir if updated since labeled."""
+        if self._reservoir is None or not self._reservoir_changed:
+            return
+        self._reservoir_changed = False
+        if not self.options.data_labeler.is_enabled:
+            return
+
+        rows = self._reservoir.sample
+        for prof_idx, col_profile in enumerate(self._profile):
+            clean_sampled_df, _ = col_profile.clean_data_and_get_base_stats(
+                df_series=rows.iloc[:, prof_idx].rename(col_profile.name),
+                sample_size=len(rows),
+                null_values=col_profile._null_values,
+                keep_native_dtype=True,
+            )
+            col_profile.profiles.pop("data_label_profile", None)
+            col_profile.update_column_profilers(
+                clean_sampled_df, profile_types=["data_label_profile"]
+            )
+
+    def _get_column_executor(
+        self, phase: str, data_size: int = None, cols: int = None
+    ) -> ColumnExecutor | None:
+        """
+        Return the started executor of the backend chosen for a profiling phase.
+
+        :param phase: profiling phase ("null_cleaning" | "stats" | "labeling")
+        :type phase: str
+        :param data_size: estimated size of the dataset
+        :type data_size: int
+        :param cols: columns of the dataset
+        :type cols: int
+        :return: the executor, None if the phase runs serially
+        :rtype: Union[ColumnExecutor, None]
+        """
+        backend = "serial"
+        if self.options.parallelism.is_enabled:
+            backend = getattr(self.options.parallelism, phase)
+        elif self.options.multiprocess.is_enabled and phase != "labeling":
+            backend = "process"
+        if backend == "serial":
+            return None
+
+        # The labeler is not thread safe, hence labels in a single thread
+        executor_key = "labeling" if phase == "labeling" else backend
+        if executor_key not in self._column_executors:
+            self._column_executors[executor_key] = ColumnExecutor(
+                backend, max_pool_size=1 if phase == "labeling" else None
+            )
+        executor = self._column_executors[executor_key]
+        if not executor.start(data_size=data_size, cols=cols):
+            return None
+        return executor
+
     def _update_profile_from_chunk(
         self,
         data: list | pd.Series | pd.DataFrame,
@@ -2606,6 +2919,11 @@ class StructuredProfiler(BaseProfiler):
         elif isinstance(data, list):
             data = pd.DataFrame(data, dtype=object)
 
+        # The correlation moments of a profile saved by a prior version are
+        # rebuilt from the statistics of the rows profiled so far
+        if self.options.correlation.is_enabled:
+            self._correlation_moments = self._get_correlation_moments()
+
         # Calculate schema of incoming data
         mapping_given = defaultdict(list)
         for col_idx in range(len(data.columns)):
@@ -2637,23 +2955,25 @@ class StructuredProfiler(BaseProfiler):
                         yield e
 
         # Shuffle indices once and share with columns
-        sample_ids = [*utils.shuffle_in_chunks(len(data), len(data))]
-
-        # If there are no minimum true samples, you can sort to save time
+        # If there are no minimum true samples, only sample_size indices are
+        # needed and you can sort to save time
         if min_true_samples in [None, 0]:
-            sample_ids[0] = sample_ids[0][:sample_size]
-            # Sort the sample_ids and replace prior
-            sample_ids[0] = sorted(sample_ids[0])
+            sample_id_chunks = [
+                np.sort(
+                    next(
+                        utils.shuffle_in_chunks(len(data), sample_size),
+                        np.empty(0, dtype=int),
+                    )
+                )
+            ]
+        else:
+            sample_id_chunks = [*utils.shuffle_in_chunks(len(data), len(data))]
 
         # Numpy arrays allocate to heap and can be shared between processes
         # Non-locking multiprocessing fails on machines without POSIX (windows)
         # The function handles that situation, but will be single process
         # Newly introduced features (python3.8) improves the situation
-        sample_ids: np.ndarray = np.array(sample_ids)  # type: ignore
-
-        # Record the previous mean/std values of columns that need to
-        # have correlation updated.
-        corr_prev_dependent_properties = self._get_correlation_dependent_properties()
+        sample_ids: np.ndarray = np.array(sample_id_chunks)
 
         # Create StructuredColProfilers upon initialization
         # Record correlation between columns in data and index in _profile
@@ -2672,19 +2992,19 @@ class StructuredProfiler(BaseProfiler):
                     )
                 )
 
-        # Generate pool and estimate datasize
-        pool = None
-        if self.options.multiprocess.is_enabled:
+        # Estimate datasize and start the pools reused across batches if needed
+        est_data_size = None
+        if self.options.multiprocess.is_enabled or self.options.parallelism.is_enabled:
             est_data_size = data[:50000].memory_usage(index=False, deep=True).sum()
             est_data_size = (est_data_size / min(50000, len(data))) * len(data)
-            pool, pool_size = utils.generate_pool(
-                max_pool_size=None, data_size=est_data_size, cols=len(data.columns)
-            )
+        pool = self._get_column_executor(
+            "null_cleaning", data_size=est_data_size, cols=len(data.columns)
+        )
 
         # Format the data
         notification_str = "Finding the Null values in the columns... "
-        if pool:
-            notification_str += " (with " + str(pool_size) + " processes)"
+        if pool is not None:
+            notification_str += " (with {} {}s)".format(pool.pool_size, pool.backend)
 
         # Keys are _profile indices
         clean_sampled_dict = {}
@@ -2700,74 +3020,80 @@ class StructuredProfiler(BaseProfiler):
             )
 
         if pool is not None:
-            # Create a bunch of simultaneous column conversions
-            for col_idx in range(data.shape[1]):
-                col_ser = data.iloc[:, col_idx]
-                prof_idx = col_idx_to_prof_idx[col_idx]
-                if min_true_samples is None:
-                    min_true_samples = self._profile[prof_idx]._min_true_samples
-                try:
-                    null_values: dict = self._profile[prof_idx]._null_values.copy()
-                    if self.options.column_null_values:
-                        null_values.update(
-                            self.options.column_null_values.get(col_idx, {})
+            try:
+                # Create a bunch of simultaneous column conversions
+                for col_idx in range(data.shape[1]):
+                    col_ser = data.iloc[:, col_idx]
+                    prof_idx = col_idx_to_prof_idx[col_idx]
+                    if min_true_samples is None:
+                        min_true_samples = self._profile[prof_idx]._min_true_samples
+                    try:
+                        null_values: dict = self._profile[prof_idx]._null_values.copy()
+                        if self.options.column_null_values:
+                            null_values.update(
+                                self.options.column_null_values.get(col_idx, {})
+                            )
+
+                        multi_process_dict[col_idx] = pool.apply_async(
+                            self._profile[prof_idx].clean_data_and_get_base_stats,
+                            (
+                                col_ser,
+                                sample_size,
+                                null_values,
+                                min_true_samples,
+                                sample_ids,
+                                True,
+                            ),
                         )
-
-                    multi_process_dict[col_idx] = pool.apply_async(
-                        self._profile[prof_idx].clean_data_and_get_base_stats,
-                        (
+                    except Exception as e:
+                        logger.info(e)
+                        single_process_list.add(col_idx)
+
+                # Iterate through multiprocessed columns collecting results
+                logger.info(notification_str)
+                for col_idx in tqdm(multi_process_dict.keys()):
+                    try:
+                        prof_idx = col_idx_to_prof_idx[col_idx]
+                        clean_sampled_dict[prof_idx], base_stats = multi_process_dict[
+                            col_idx
+                        ].get()
+                        self._profile[prof_idx]._update_base_stats(base_stats)
+                    except Exception as e:
+                        logger.info(e)
+                        single_process_list.add(col_idx)
+
+                # Clean up any columns which errored
+                if len(single_process_list) > 0:
+                    logger.info(
+                        "Errors in multiprocessing occured:",
+                        len(single_process_list),
+                        "errors, reprocessing...",
+                    )
+                    for col_idx in tqdm(single_process_list):
+                        col_ser = data.iloc[:, col_idx]
+                        prof_idx = col_idx_to_prof_idx[col_idx]
+                        if min_true_samples is None:
+                            min_true_samples = self._profile[prof_idx]._min_true_samples
+
+                        null_values = self._profile[prof_idx]._null_values.copy()
+                        if self.options.column_null_values:
+                            null_values.update(
+                                self.options.column_null_values.get(col_idx, {})
+                            )
+
+                        clean_sampled_dict[prof_idx], base_stats = self._profile[
+                            prof_idx
+                        ].clean_data_and_get_base_stats(
                             col_ser,
                             sample_size,
                             null_values,
                             min_true_samples,
                             sample_ids,
-                        ),
-                    )
-                except Exception as e:
-                    logger.info(e)
-                    single_process_list.add(col_idx)
-
-            # Iterate through multiprocessed columns collecting results
-            logger.info(notification_str)
-            for col_idx in tqdm(multi_process_dict.keys()):
-                try:
-                    prof_idx = col_idx_to_prof_idx[col_idx]
-                    clean_sampled_dict[prof_idx], base_stats = multi_process_dict[
-                        col_idx
-                    ].get()
-                    self._profile[prof_idx]._update_base_stats(base_stats)
-                except Exception as e:
-                    logger.info(e)
-                    single_process_list.add(col_idx)
-
-            # Clean up any columns which errored
-            if len(single_process_list) > 0:
-                logger.info(
-                    "Errors in multiprocessing occured:",
-                    len(single_process_list),
-                    "errors, reprocessing...",
-                )
-                for col_idx in tqdm(single_process_list):
-                    col_ser = data.iloc[:, col_idx]
-                    prof_idx = col_idx_to_prof_idx[col_idx]
-                    if min_true_samples is None:
-                        min_true_samples = self._profile[prof_idx]._min_true_samples
-
-                    null_values = self._profile[prof_idx]._null_values.copy()
-                    if self.options.column_null_values:
-                        null_values.update(
-                            self.options.column_null_values.get(col_idx, {})
+                            keep_native_dtype=True,
                         )
-
-                    clean_sampled_dict[prof_idx], base_stats = self._profile[
-                        prof_idx
-                    ].clean_data_and_get_base_stats(
-                        col_ser, sample_size, null_values, min_true_samples, sample_ids
-                    )
-                    self._profile[prof_idx]._update_base_stats(base_stats)
-
-            pool.close()  # Close pool for new tasks
-            pool.join()  # Wait for all workers to complete
+                        self._profile[prof_idx]._update_base_stats(base_stats)
+            finally:
+                pool.release()  # Free the columns shared with the workers
 
         else:  # No pool
             logger.info(notification_str)
@@ -2789,43 +3115,108 @@ class StructuredProfiler(BaseProfiler):
                     null_values=null_values,
                     min_true_samples=min_true_samples,
                     sample_ids=sample_ids,
+                    keep_native_dtype=True,
                 )
                 self._profile[prof_idx]._update_base_stats(base_stats)
 
         # Process and label the data
         notification_str = "Calculating the statistics... "
-        pool = None
-        if self.options.multiprocess.is_enabled:
-            pool, pool_size = utils.generate_pool(4, est_data_size)
-            if pool:
-                notification_str += " (with " + str(pool_size) + " processes)"
+        pool = self._get_column_executor(
+            "stats", data_size=est_data_size, cols=len(data.columns)
+        )
+        if pool is not None:
+            notification_str += " (with {} {}s)".format(pool.pool_size, pool.backend)
+
+        # When labeled in the background or from the reservoir, the labeler is
+        # split from the stats
+        labeling_pool = None
+        if self._reservoir is None:
+            labeling_pool = self._get_column_executor(
+                "labeling", data_size=est_data_size, cols=len(data.columns)
+            )
+        # The labeler is not thread safe, hence threaded stats leave the
+        # labeling to this thread
+        stats_on_threads = pool is not None and pool.backend == "thread"
+        label_after_stats = (
+            stats_on_threads and labeling_pool is None and self._reservoir is None
+        )
+        stats_profile_types = None
+        if labeling_pool is not None or self._reservoir is not None or stats_on_threads:
+            stats_profile_types = ["data_type_profile", "data_stats_profile"]
 
         logger.info(notification_str)
 
-        for prof_idx in tqdm(clean_sampled_dict.keys()):
-            self._profile[prof_idx].update_column_profilers(
-                clean_sampled_dict[prof_idx], pool
-            )
+        # Share the conversions of each column between the stats, labeling
+        # and correlation
+        column_data: dict = clean_sampled_dict
+        if (
+            labeling_pool is not None
+            or label_after_stats
+            or self.options.correlation.is_enabled
+        ):
+            column_data = {
+                prof_idx: ColumnView.from_series(clean_sampled_df)
+                for prof_idx, clean_sampled_df in clean_sampled_dict.items()
+            }
 
-        if pool is not None:
-            pool.close()  # Close pool for new tasks
-            pool.join()  # Wait for all workers to complete
+        try:
+            stats_results = {}
+            if stats_on_threads:
+                assert pool is not None
+                # Threads share the profiles, hence each updates a whole column
+                for prof_idx, clean_sampled_df in column_data.items():
+                    stats_results[prof_idx] = pool.apply_async(
+                        self._profile[prof_idx].update_column_profilers,
+                        (clean_sampled_df, None, stats_profile_types),
+                    )
+
+            labeling_results = []
+            for prof_idx in tqdm(column_data.keys()):
+                if prof_idx in stats_results:
+                    stats_results[prof_idx].get()
+                else:
+                    self._profile[prof_idx].update_column_profilers(
+                        column_data[prof_idx], pool, stats_profile_types
+                    )
+                if labeling_pool is not None:
+                    labeling_results.append(
+                        labeling_pool.apply_async(
+                            self._profile[prof_idx].update_column_profilers,
+                            (column_data[prof_idx], None, ["data_label_profile"]),
+                        )
+                    )
+                elif label_after_stats:
+                    self._profile[prof_idx].update_column_profilers(
+                        column_data[prof_idx], None, ["data_label_profile"]
+                    )
+
+            for labeling_result in labeling_results:
+                labeling_result.get()
+        finally:
+            # Free the columns shared with the workers
+            if pool is not None:
+                pool.release()
+            if labeling_pool is not None:
+                labeling_pool.release()
+
+        if self._reservoir is not None:
+            prof_idx_to_col_idx = np.argsort(
+                [col_idx_to_prof_idx[col_idx] for col_idx in range(data.shape[1])]
+            )
+            self._reservoir.update(data.iloc[:, prof_idx_to_col_idx])
+            self._reservoir_changed = True
 
         if self.options.correlation.is_enabled:
-            self._update_correlation(clean_sampled_dict, corr_prev_dependent_properties)
+            self._update_correlation(column_data)
 
         if self.options.chi2_homogeneity.is_enabled:
-            self.chi2_matrix = self._update_chi2()
+            self._chi2_is_stale = True
 
         # Update total samples between correlation and row stats functionality
         self.total_samples += len(data)
 
         if self.options.row_statistics.is_enabled:
-            # Only pass along sample ids if necessary
-            samples_for_row_stats = None
-            if min_true_samples not in [None, 0]:
-                samples_for_row_stats = np.concatenate(sample_ids)
-            self._update_row_statistics(data, samples_for_row_stats)
+            self._update_row_statistics(data)
 
         # Calculate metrics specific to capitalone/synthetic-data
         if self.options.null_replication_metrics.is_enabled:
@@ -2850,10 +3241,14 @@ class StructuredProfiler(BaseProfiler):
             "_samples_per_update": self._samples_per_update,
             "_min_true_samples": self._min_true_samples,
             "options": self.options,
+            "correlation_matrix": self.correlation_matrix,
+            "_correlation_moments": self._correlation_moments,
             "chi2_matrix": self.chi2_matrix,
             "_profile": self.profile,
             "_col_name_to_idx": self._col_name_to_idx,
             "times": self.times,
+            "_reservoir": self._reservoir,
+            "_reservoir_changed": self._reservoir_changed,
         }
 
         self._save_helper(filepath, data_dict)
@@ -180,6 +180,97 @@ class BooleanOption(BaseOption):
         return errors
 
 
+class QuantileSketchOptions(BooleanOption):
+    """For configuring the sketch of the quantiles of numeric columns."""
+
+    def __init__(
+        self, is_enabled: bool = False, compactor_size: int = 200, seed: int = 0
+    ) -> None:
+        """
+        Initialize options for the sketch of the quantiles.
+
+        :ivar is_enabled: boolean option to estimate the quantiles, median and
+            median absolute deviation from a mergeable sketch of the values
+            rather than from the histogram
+        :vartype is_enabled: bool
+        :ivar compactor_size: size of the largest compactor of the sketch, the
+            rank error decreasing as it increases
+        :vartype compactor_size: int
+        :ivar seed: seed of the random compactions
+        :vartype seed: int
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.compactor_size = compactor_size
+        self.seed = seed
+
+    def _validate_helper(
+        self, variable_path: str = "QuantileSketchOptions"
+    ) -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if (
+            not isinstance(self.compactor_size, int)
+            or isinstance(self.compactor_size, bool)
+            or self.compactor_size < 2
+        ):
+            errors.append(
+                f"{variable_path}.compactor_size must be an integer greater than 1."
+            )
+        if not isinstance(self.seed, int):
+            errors.append(f"{variable_path}.seed must be an integer.")
+        return errors
+
+
+class HistogramSelectionOptions(BooleanOption):
+    """For configuring the per batch selection of the histogram bin method."""
+
+    def __init__(self, is_enabled: bool = False, freeze_after: int = None) -> None:
+        """
+        Initialize options for the selection of the histogram bin method.
+
+        :ivar is_enabled: boolean option to derive the bin count and loss of
+            every bin method from a single fine histogram of each batch and
+            to select the method with the least accumulated loss
+        :vartype is_enabled: bool
+        :ivar freeze_after: number of consecutive batches a method must lead
+            before it is kept without evaluating the others, None to never
+            freeze the selection
+        :vartype freeze_after: Union[int, None]
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.freeze_after = freeze_after
+
+    def _validate_helper(
+        self, variable_path: str = "HistogramSelectionOptions"
+    ) -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if self.freeze_after is not None and (
+            not isinstance(self.freeze_after, int)
+            or isinstance(self.freeze_after, bool)
+            or self.freeze_after < 1
+        ):
+            errors.append(
+                f"{variable_path}.freeze_after must be either None or a "
+                "positive integer."
+            )
+        return errors
+
+
 class HistogramOption(BooleanOption):
     """For setting histogram options."""
 
@@ -196,8 +287,16 @@ class HistogramOption(BooleanOption):
         :ivar bin_count_or_method: bin count or the method with which to
             calculate histograms
         :vartype bin_count_or_method: Union[str, int, list(str)]
+        :ivar quantile_sketch: option to estimate the quantiles from a
+            mergeable sketch rather than from the histogram
+        :vartype quantile_sketch: QuantileSketchOptions
+        :ivar selection: option to select the bin method from a single fine
+            histogram of each batch
+        :vartype selection: HistogramSelectionOptions
         """
         self.bin_count_or_method = bin_count_or_method
+        self.quantile_sketch = QuantileSketchOptions()
+        self.selection = HistogramSelectionOptions()
         super().__init__(is_enabled=is_enabled)
 
     def _validate_helper(self, variable_path: str = "HistogramOption") -> list[str]:
@@ -230,6 +329,22 @@ class HistogramOption(BooleanOption):
                     "than 1, a string, or list of strings from the "
                     "following: {}.".format(variable_path, valid_methods)
                 )
+
+        if not isinstance(self.quantile_sketch, QuantileSketchOptions):
+            errors.append(
+                f"{variable_path}.quantile_sketch must be a QuantileSketchOptions."
+            )
+        else:
+            errors += self.quantile_sketch._validate_helper(
+                variable_path + ".quantile_sketch"
+            )
+
+        if not isinstance(self.selection, HistogramSelectionOptions):
+            errors.append(
+                f"{variable_path}.selection must be a HistogramSelectionOptions."
+            )
+        else:
+            errors += self.selection._validate_helper(variable_path + ".selection")
         return errors
 
 
@@ -863,6 +978,59 @@ class OrderOptions(BaseInspectorOptions):
         return super()._validate_helper(variable_path)
 
 
+class HeavyHitterOptions(BooleanOption):
+    """For configuring the sketch of the most frequent categories."""
+
+    def __init__(
+        self,
+        is_enabled: bool = False,
+        capacity: int = 1000,
+        width: int = 2048,
+        depth: int = 4,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize options for the sketch of the most frequent categories.
+
+        :ivar is_enabled: boolean option to keep approximate counts of the most
+            frequent categories in bounded memory rather than exact counts
+        :vartype is_enabled: bool
+        :ivar capacity: maximum number of categories whose counts are kept
+        :vartype capacity: int
+        :ivar width: number of counters of each row of the Count-Min sketch
+        :vartype width: int
+        :ivar depth: number of rows of the Count-Min sketch
+        :vartype depth: int
+        :ivar seed: seed of the hash functions
+        :vartype seed: int
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.capacity = capacity
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+
+    def _validate_helper(self, variable_path: str = "HeavyHitterOptions") -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        for option_name in ["capacity", "width", "depth"]:
+            value = getattr(self, option_name)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                errors.append(
+                    f"{variable_path}.{option_name} must be a positive integer."
+                )
+        if not isinstance(self.seed, int):
+            errors.append(f"{variable_path}.seed must be an integer.")
+        return errors
+
+
 class CategoricalOptions(BaseInspectorOptions):
     """For configuring options Categorical Column."""
 
@@ -886,6 +1054,9 @@ class CategoricalOptions(BaseInspectorOptions):
         :ivar stop_condition_unique_value_ratio: The highest ratio of unique
             values to dataset size that is to be considered a categorical type
         :vartype stop_condition_unique_value_ratio: [None, float]
+        :ivar heavy_hitters: options of the sketch of the most frequent
+            categories, used instead of exact counts if enabled
+        :vartype heavy_hitters: HeavyHitterOptions
         """
         BaseInspectorOptions.__init__(self, is_enabled=is_enabled)
         self.top_k_categories = top_k_categories
@@ -893,6 +1064,7 @@ class CategoricalOptions(BaseInspectorOptions):
             max_sample_size_to_check_stop_condition
         )
         self.stop_condition_unique_value_ratio = stop_condition_unique_value_ratio
+        self.heavy_hitters = HeavyHitterOptions()
 
     def _validate_helper(self, variable_path: str = "CategoricalOptions") -> list[str]:
         """
@@ -940,6 +1112,15 @@ class CategoricalOptions(BaseInspectorOptions):
                 "set or not set.".format(variable_path, variable_path)
             )
 
+        if not isinstance(self.heavy_hitters, HeavyHitterOptions):
+            errors.append(
+                f"{variable_path}.heavy_hitters must be a HeavyHitterOptions."
+            )
+        else:
+            errors += self.heavy_hitters._validate_helper(
+                variable_path + ".heavy_hitters"
+            )
+
         return errors
 
 
@@ -1026,6 +1207,52 @@ class HyperLogLogOptions(BaseOption):
         return errors
 
 
+class FullHashingOptions(BaseOption):
+    """Options for the exact method of gathering unique row count."""
+
+    def __init__(
+        self, spill_threshold: int | None = None, spill_dirpath: str | None = None
+    ) -> None:
+        """
+        Initialize options for the full method of gathering unique row count.
+
+        :ivar spill_threshold: bytes of row hashes kept in memory before
+            spilling them to disk, never spilled if None
+        :vartype spill_threshold: Union[int, None]
+        :ivar spill_dirpath: directory of the spilled row hashes, the default
+            temporary directory if None
+        :vartype spill_dirpath: Union[str, None]
+        """
+        self.spill_threshold = spill_threshold
+        self.spill_dirpath = spill_dirpath
+
+    def _validate_helper(self, variable_path: str = "FullHashingOptions") -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = []
+
+        if self.spill_threshold is not None and (
+            not isinstance(self.spill_threshold, int)
+            or isinstance(self.spill_threshold, bool)
+            or self.spill_threshold <= 0
+        ):
+            errors.append(
+                f"{variable_path}.spill_threshold must be either None or a "
+                "positive integer."
+            )
+        if self.spill_dirpath is not None and not isinstance(self.spill_dirpath, str):
+            errors.append(
+                f"{variable_path}.spill_dirpath must be either None or a string."
+            )
+        return errors
+
+
 class UniqueCountOptions(BooleanOption):
     """For configuring options for unique row count."""
 
@@ -1037,9 +1264,14 @@ class UniqueCountOptions(BooleanOption):
         :vartype is_enabled: bool
         :ivar hashing_method: property to specify row hashing method ("full" | "hll")
         :vartype hashing_method: str
+        :ivar full: options of the full hashing method
+        :vartype full: FullHashingOptions
+        :ivar hll: options of the hll hashing method
+        :vartype hll: HyperLogLogOptions
         """
         BooleanOption.__init__(self, is_enabled=is_enabled)
         self.hashing_method = hashing_method
+        self.full = FullHashingOptions()
         self.hll = HyperLogLogOptions()
 
     def _validate_helper(self, variable_path: str = "UniqueCountOptions") -> list[str]:
@@ -1060,6 +1292,10 @@ class UniqueCountOptions(BooleanOption):
             "hll",
         ]:
             errors.append(f"{variable_path}.hashing_method must be 'full' or 'hll'.")
+        if not isinstance(self.full, FullHashingOptions):
+            errors.append(f"{variable_path}.full must be a FullHashingOptions.")
+        else:
+            errors += self.full._validate_helper(variable_path + ".full")
         if not isinstance(self.hll, HyperLogLogOptions):
             errors.append(f"{variable_path}.hll_hashing must be a HyperLogLogOptions.")
 
@@ -1096,8 +1332,206 @@ class RowStatisticsOptions(BooleanOption):
             errors.append(
                 f"{variable_path}.full_hashing must be an UniqueCountOptions."
             )
-        errors += self.unique_count._validate_helper(variable_path + ".unique_counts")
-        return super()._validate_helper(variable_path)
+        else:
+            errors += self.unique_count._validate_helper(
+                variable_path + ".unique_count"
+            )
+        return errors
+
+
+class TypeProbingOptions(BooleanOption):
+    """For configuring options for probing the data types of a column."""
+
+    def __init__(
+        self, is_enabled: bool = False, probe_size: int = 50, sample_size: int = 1000
+    ) -> None:
+        """
+        Initialize options for probing the data types of a column.
+
+        When enabled, the datetime, int and float profilers of a column are
+        first checked against a random probe of each batch. A profiler with
+        any value in the probe not matching its data type cannot be the
+        data type of the column and is only updated with a random sample of
+        the batch, which includes the probe.
+
+        :ivar is_enabled: boolean option to enable/disable.
+        :vartype is_enabled: bool
+        :ivar probe_size: number of values checked for each batch
+        :vartype probe_size: int
+        :ivar sample_size: number of values profiled for each batch by the
+            profilers not matching the probe
+        :vartype sample_size: int
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.probe_size = probe_size
+        self.sample_size = sample_size
+
+    def _validate_helper(self, variable_path: str = "TypeProbingOptions") -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        if not isinstance(self.probe_size, int):
+            errors.append(f"{variable_path}.probe_size must be an integer.")
+        elif self.probe_size <= 0:
+            errors.append(f"{variable_path}.probe_size must be greater than 0.")
+        if not isinstance(self.sample_size, int):
+            errors.append(f"{variable_path}.sample_size must be an integer.")
+        elif isinstance(self.probe_size, int) and self.sample_size < self.probe_size:
+            errors.append(
+                f"{variable_path}.sample_size must be greater than or equal to "
+                "the probe_size."
+            )
+        return errors
+
+
+class ParallelismOptions(BooleanOption):
+    """For configuring the parallel execution of the structured profiler."""
+
+    _backends = ["serial", "thread", "process"]
+
+    def __init__(
+        self,
+        is_enabled: bool = False,
+        null_cleaning: str = "process",
+        stats: str = "process",
+        labeling: str = "serial",
+    ) -> None:
+        """
+        Initialize options for the parallel execution of each profiling phase.
+
+        When disabled, the null cleaning and statistics phases use a pool of
+        processes if multiprocess is enabled. When enabled, each phase instead
+        runs serially, in a pool of threads or in a pool of processes as
+        specified, regardless of the multiprocess option. Threads avoid
+        copying the data into other processes and speed up the work releasing
+        the GIL. The data labeler cannot be sent to other processes, hence its
+        labeling either runs serially or in a background thread alongside the
+        statistics.
+
+        :ivar is_enabled: boolean option to enable/disable.
+        :vartype is_enabled: bool
+        :ivar null_cleaning: backend cleaning the null values of the columns
+            ("serial" | "thread" | "process")
+        :vartype null_cleaning: str
+        :ivar stats: backend calculating the statistics of the columns
+            ("serial" | "thread" | "process")
+        :vartype stats: str
+        :ivar labeling: backend labeling the columns ("serial" | "thread")
+        :vartype labeling: str
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.null_cleaning = null_cleaning
+        self.stats = stats
+        self.labeling = labeling
+
+    def _validate_helper(self, variable_path: str = "ParallelismOptions") -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        for phase in ["null_cleaning", "stats"]:
+            if getattr(self, phase) not in self._backends:
+                errors.append(
+                    f"{variable_path}.{phase} must be one of 'serial', "
+                    "'thread' or 'process'."
+                )
+        if self.labeling not in self._backends[:2]:
+            errors.append(f"{variable_path}.labeling must be 'serial' or 'thread'.")
+        return errors
+
+
+class ReservoirSamplingOptions(BooleanOption):
+    """For configuring the reservoir sampled across the profiled batches."""
+
+    def __init__(self, is_enabled: bool = False, size: int = 5000) -> None:
+        """
+        Initialize options for the reservoir sampled across the batches.
+
+        When enabled, the statistics of each batch are calculated from all of
+        its rows instead of a sample whose size depends on the batch, while a
+        uniform random sample of bounded size is kept across every batch
+        profiled. The data labeler only labels this reservoir, once needed by
+        a report, such that the cost per row does not depend on how the data
+        is batched.
+
+        :ivar is_enabled: boolean option to enable/disable.
+        :vartype is_enabled: bool
+        :ivar size: max number of rows kept in the reservoir
+        :vartype size: int
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.size = size
+
+    def _validate_helper(
+        self, variable_path: str = "ReservoirSamplingOptions"
+    ) -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        if not isinstance(self.size, int):
+            errors.append(f"{variable_path}.size must be an integer.")
+        elif self.size <= 0:
+            errors.append(f"{variable_path}.size must be greater than 0.")
+        return errors
+
+
+class DistinctCountOptions(BooleanOption):
+    """For configuring the sketch of the distinct values of each column."""
+
+    def __init__(self, is_enabled: bool = False) -> None:
+        """
+        Initialize options for the distinct count of each column.
+
+        When enabled, each column keeps a HyperLogLog sketch of its values,
+        such that its unique count is reported in constant memory, including
+        once the categories are no longer counted.
+
+        :ivar is_enabled: boolean option to enable/disable.
+        :vartype is_enabled: bool
+        :ivar hll: options of the HyperLogLog sketch of each column
+        :vartype hll: HyperLogLogOptions
+        """
+        BooleanOption.__init__(self, is_enabled=is_enabled)
+        self.hll = HyperLogLogOptions(register_count=12)
+
+    def _validate_helper(
+        self, variable_path: str = "DistinctCountOptions"
+    ) -> list[str]:
+        """
+        Validate the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        if not isinstance(self.hll, HyperLogLogOptions):
+            errors.append(f"{variable_path}.hll must be a HyperLogLogOptions.")
+        else:
+            errors += self.hll._validate_helper(variable_path + ".hll")
+        return errors
 
 
 class DataLabelerOptions(BaseInspectorOptions):
@@ -1328,6 +1762,15 @@ class StructuredOptions(BaseOption):
         :ivar null_replication_metrics: option set for metrics
             calculation for replicating nan vals
         :vartype null_replication_metrics: BooleanOptions
+        :ivar type_probing: option set for probing the data types of columns
+        :vartype type_probing: TypeProbingOptions
+        :ivar parallelism: option set for the parallel execution of each phase
+        :vartype parallelism: ParallelismOptions
+        :ivar reservoir_sampling: option set for the reservoir sampled across
+            the profiled batches
+        :vartype reservoir_sampling: ReservoirSamplingOptions
+        :ivar distinct_count: option set for the distinct count of each column
+        :vartype distinct_count: DistinctCountOptions
         :ivar null_values: option set for defined null values
         :vartype null_values: Union[None, dict]
         :ivar sampling_ratio: What ratio of the input data to sample.
@@ -1347,6 +1790,10 @@ class StructuredOptions(BaseOption):
         self.chi2_homogeneity = BooleanOption(is_enabled=True)
         self.null_replication_metrics = BooleanOption(is_enabled=False)
         self.row_statistics = RowStatisticsOptions()
+        self.type_probing = TypeProbingOptions()
+        self.parallelism = ParallelismOptions()
+        self.reservoir_sampling = ReservoirSamplingOptions()
+        self.distinct_count = DistinctCountOptions()
         # Non-Option variables
         self.null_values = null_values
         self.column_null_values = column_null_values
@@ -1394,6 +1841,10 @@ class StructuredOptions(BaseOption):
                 ("chi2_homogeneity", BooleanOption),
                 ("row_statistics", RowStatisticsOptions),
                 ("null_replication_metrics", BooleanOption),
+                ("type_probing", TypeProbingOptions),
+                ("parallelism", ParallelismOptions),
+                ("reservoir_sampling", ReservoirSamplingOptions),
+                ("distinct_count", DistinctCountOptions),
             ]
         )
         properties = self.properties
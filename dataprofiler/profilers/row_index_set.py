@@ -0,0 +1,268 @@
+"""Contains the compressed set of row indices of null values."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+
+class RowIndexSet:
+    """
+    Set of row indices kept as sorted runs of consecutive integers.
+
+    Integer indices are stored as the starts and exclusive ends of their
+    runs, such that contiguous or sparse indices only take 16 bytes per run
+    rather than a Python int per index. Unions, intersections and shifts are
+    vectorized over the runs. Indices which are not integers, e.g. from a
+    string index, are kept as is in a set alongside the runs.
+    """
+
+    def __init__(self, indices: Iterable[Hashable] | None = None) -> None:
+        """
+        Initialize the set of indices.
+
+        :param indices: row indices, possibly unsorted and duplicated
+        :type indices: Union[Iterable, None]
+        """
+        self._starts = np.empty(0, dtype=np.int64)
+        self._ends = np.empty(0, dtype=np.int64)
+        self._labels: set = set()
+        if indices is not None:
+            self.update(indices)
+
+    @classmethod
+    def _from_runs(
+        cls, starts: np.ndarray, ends: np.ndarray, labels: set | None = None
+    ) -> RowIndexSet:
+        """Create a set from sorted, disjoint and non-adjacent runs."""
+        index_set = cls()
+        index_set._starts = starts.astype(np.int64, copy=False)
+        index_set._ends = ends.astype(np.int64, copy=False)
+        index_set._labels = set() if labels is None else labels
+        return index_set
+
+    @staticmethod
+    def _to_array(indices: Iterable[Hashable]) -> np.ndarray:
+        """Return the indices as an array, of objects unless all integers."""
+        if isinstance(indices, (np.ndarray, pd.Index)) and indices.ndim == 1:
+            return np.asarray(indices)
+        indices = list(indices)
+        try:
+            values = np.asarray(indices) if indices else np.empty(0, dtype=np.int64)
+        except ValueError:
+            values = np.empty(0, dtype=object)
+        if values.dtype.kind not in "iu" or values.ndim != 1:
+            values = np.empty(len(indices), dtype=object)
+            values[:] = indices
+        return values
+
+    @classmethod
+    def _split(cls, indices: Iterable[Hashable]) -> RowIndexSet:
+        """Split indices into runs of integers and the other labels."""
+        if isinstance(indices, RowIndexSet):
+            return indices
+        values = cls._to_array(indices)
+        labels = set()
+        if values.dtype.kind not in "iu":
+            is_int = np.fromiter(
+                (isinstance(value, (int, np.integer)) for value in values.flat),
+                dtype=bool,
+                count=values.size,
+            )
+            labels = set(values[~is_int].tolist())
+            values = values[is_int]
+        values = np.unique(values.astype(np.int64))
+        if not len(values):
+            return cls._from_runs(values, values, labels)
+
+        breaks = np.flatnonzero(np.diff(values) != 1) + 1
+        starts = values[np.concatenate([[0], breaks])]
+        ends = values[np.concatenate([breaks - 1, [len(values) - 1]])] + 1
+        return cls._from_runs(starts, ends, labels)
+
+    @property
+    def runs(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the runs of consecutive integer indices.
+
+        :return: starts and exclusive ends of the runs, sorted
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        return self._starts, self._ends
+
+    def __len__(self) -> int:
+        """Return the number of indices."""
+        return int((self._ends - self._starts).sum()) + len(self._labels)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the integer indices in order, then the other labels."""
+        for start, end in zip(self._starts.tolist(), self._ends.tolist()):
+            yield from range(start, end)
+        yield from self._labels
+
+    def __contains__(self, index: object) -> bool:
+        """Return True if the index is in the set."""
+        if isinstance(index, (int, np.integer)):
+            return bool(self.isin([index])[0])
+        return index in self._labels
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both sets have the same indices."""
+        if isinstance(other, RowIndexSet):
+            return (
+                np.array_equal(self._starts, other._starts)
+                and np.array_equal(self._ends, other._ends)
+                and self._labels == other._labels
+            )
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and set(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the runs and labels of the set."""
+        runs = ", ".join(
+            f"{start}-{end - 1}" if end - start > 1 else f"{start}"
+            for start, end in zip(self._starts.tolist(), self._ends.tolist())
+        )
+        labels = f", labels={self._labels}" if self._labels else ""
+        return f"RowIndexSet([{runs}]{labels})"
+
+    def isin(self, values: Iterable[Hashable]) -> np.ndarray:
+        """
+        Return whether each value is in the set.
+
+        :param values: row indices to look up
+        :type values: Iterable
+        :return: boolean mask of the values in the set
+        :rtype: numpy.ndarray
+        """
+        values = self._to_array(values)
+        if values.dtype.kind not in "iu":
+            return np.fromiter(
+                (value in self for value in values.flat),
+                dtype=bool,
+                count=values.size,
+            )
+        values = values.astype(np.int64)
+        positions = np.searchsorted(self._starts, values, side="right") - 1
+        is_in = positions >= 0
+        is_in[is_in] = values[is_in] < self._ends[positions[is_in]]
+        return is_in
+
+    def union(self, *others: Iterable[Hashable]) -> RowIndexSet:
+        """
+        Return the union of this set and the others.
+
+        :param others: sets or iterables of row indices
+        :type others: Iterable
+        :return: set of the indices in any of the sets
+        :rtype: RowIndexSet
+        """
+        index_sets = [self] + [self._split(other) for other in others]
+        starts = np.concatenate([index_set._starts for index_set in index_sets])
+        ends = np.concatenate([index_set._ends for index_set in index_sets])
+        labels = set().union(*(index_set._labels for index_set in index_sets))
+        if len(index_sets) == 1 or not len(starts):
+            return self._from_runs(starts, ends, labels)
+
+        # Runs overlapping or adjacent to the furthest end so far are joined
+        order = np.argsort(starts, kind="stable")
+        starts = starts[order]
+        ends = np.maximum.accumulate(ends[order])
+        is_new_run = np.concatenate([[True], starts[1:] > ends[:-1]])
+        last_of_run = np.concatenate([np.flatnonzero(is_new_run)[1:] - 1, [-1]])
+        return self._from_runs(starts[is_new_run], ends[last_of_run], labels)
+
+    def update(self, *others: Iterable[Hashable]) -> None:
+        """
+        Add the indices of the others to this set.
+
+        :param others: sets or iterables of row indices
+        :type others: Iterable
+        """
+        merged = self.union(*others)
+        self._starts, self._ends, self._labels = (
+            merged._starts,
+            merged._ends,
+            merged._labels,
+        )
+
+    def intersection(self, *others: Iterable[Hashable]) -> RowIndexSet:
+        """
+        Return the intersection of this set and the others.
+
+        :param others: sets or iterables of row indices
+        :type others: Iterable
+        :return: set of the indices in all of the sets
+        :rtype: RowIndexSet
+        """
+        result = self
+        for other in others:
+            other_set = self._split(other)
+            starts, ends = self._intersect_runs(
+                result._starts, result._ends, other_set._starts, other_set._ends
+            )
+            result = self._from_runs(starts, ends, result._labels & other_set._labels)
+        if result is self:
+            result = self._from_runs(self._starts, self._ends, set(self._labels))
+        return result
+
+    def difference(self, *others: Iterable[Hashable]) -> RowIndexSet:
+        """
+        Return the indices of this set which are in none of the others.
+
+        :param others: sets or iterables of row indices
+        :type others: Iterable
+        :return: set of the indices only in this set
+        :rtype: RowIndexSet
+        """
+        removed = RowIndexSet().union(*others)
+        if not len(self._starts):
+            return self._from_runs(
+                self._starts, self._ends, self._labels - removed._labels
+            )
+
+        # Intersect with the gaps between the removed runs
+        gap_starts = np.concatenate([[self._starts[0]], removed._ends])
+        gap_ends = np.concatenate([removed._starts, [self._ends[-1]]])
+        is_gap = gap_starts < gap_ends
+        starts, ends = self._intersect_runs(
+            self._starts, self._ends, gap_starts[is_gap], gap_ends[is_gap]
+        )
+        return self._from_runs(starts, ends, self._labels - removed._labels)
+
+    def shift(self, offset: int) -> RowIndexSet:
+        """
+        Return the set with its integer indices shifted by an offset.
+
+        :param offset: value added to each integer index
+        :type offset: int
+        :return: set of the shifted indices
+        :rtype: RowIndexSet
+        """
+        return self._from_runs(
+            self._starts + offset, self._ends + offset, set(self._labels)
+        )
+
+    @staticmethod
+    def _intersect_runs(
+        starts1: np.ndarray, ends1: np.ndarray, starts2: np.ndarray, ends2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the runs of the intersection of two lists of runs."""
+        # Each run of the first overlaps a contiguous range of runs of the second
+        first = np.searchsorted(ends2, starts1, side="right")
+        last = np.searchsorted(starts2, ends1, side="left")
+        counts = np.maximum(last - first, 0)
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        idx1 = np.repeat(np.arange(len(starts1)), counts)
+        offsets = np.cumsum(counts) - counts
+        idx2 = np.arange(total) - np.repeat(offsets - first, counts)
+        starts = np.maximum(starts1[idx1], starts2[idx2])
+        ends = np.minimum(ends1[idx1], ends2[idx2])
+        return starts, ends
@@ -0,0 +1,111 @@
+"""Contains the reservoir of rows sampled across profiled batches."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .. import settings
+
+
+class RowReservoir:
+    """
+    Bounded uniform random sample of the rows of every batch it is updated with.
+
+    Each row is given a uniform random key and the reservoir keeps the rows
+    with the smallest keys, which are a uniform sample of all rows seen no
+    matter how they were batched. Two reservoirs are merged by keeping the
+    smallest keys of both, which is a uniform sample of their union.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialize an empty reservoir.
+
+        :param size: max number of rows kept in the reservoir
+        :type size: int
+        """
+        self.size = size
+        self.rows_seen = 0
+        self._keys = np.empty(0)
+        self._rows: pd.DataFrame | None = None
+        self._rng = np.random.default_rng(settings._seed)
+
+    def __len__(self) -> int:
+        """Return the number of rows in the reservoir."""
+        return len(self._keys)
+
+    @property
+    def sample(self) -> pd.DataFrame:
+        """
+        Return the rows in the reservoir.
+
+        :return: rows of the reservoir indexed from 0, with columns by position
+        :rtype: pandas.DataFrame
+        """
+        if self._rows is None:
+            return pd.DataFrame()
+        return self._rows
+
+    def _merge(self, keys: np.ndarray, rows: pd.DataFrame, size: int) -> None:
+        """Keep the rows with the smallest keys of the reservoir and new rows."""
+        if self._rows is not None:
+            # Columns of different dtypes keep their values as is if objects
+            differing = [
+                col for col in rows.columns if self._rows[col].dtype != rows[col].dtype
+            ]
+            if differing:
+                self._rows = self._rows.astype({col: object for col in differing})
+                rows = rows.astype({col: object for col in differing})
+            keys = np.concatenate([self._keys, keys])
+            rows = pd.concat([self._rows, rows], ignore_index=True)
+
+        if len(keys) > size:
+            kept = np.argpartition(keys, size - 1)[:size]
+            keys = keys[kept]
+            rows = rows.iloc[kept]
+        self._keys = keys
+        self._rows = rows.reset_index(drop=True)
+
+    def update(self, data: pd.DataFrame) -> None:
+        """
+        Sample the rows of a batch into the reservoir.
+
+        :param data: batch of rows with the columns of any prior batch, in
+            the same order
+        :type data: pandas.DataFrame
+        """
+        if not len(data):
+            return
+        self.rows_seen += len(data)
+        keys = self._rng.random(len(data))
+
+        # Only rows whose keys are below the largest key kept can enter
+        candidates = np.arange(len(data))
+        if len(self) >= self.size:
+            candidates = np.flatnonzero(keys < self._keys.max())
+        if len(candidates) > self.size:
+            candidates = candidates[
+                np.argpartition(keys[candidates], self.size - 1)[: self.size]
+            ]
+        if not len(candidates):
+            return
+
+        rows = data.iloc[candidates].set_axis(range(data.shape[1]), axis=1)
+        self._merge(keys[candidates], rows, self.size)
+
+    def __add__(self, other: RowReservoir) -> RowReservoir:
+        """
+        Merge two reservoirs together overriding the `+` operator.
+
+        :param other: reservoir being added to this one
+        :type other: RowReservoir
+        :return: reservoir sampled from the rows of both
+        :rtype: RowReservoir
+        """
+        size = min(self.size, other.size)
+        merged_reservoir = RowReservoir(size)
+        merged_reservoir.rows_seen = self.rows_seen + other.rows_seen
+        for reservoir in [self, other]:
+            if reservoir._rows is not None:
+                merged_reservoir._merge(reservoir._keys, reservoir._rows, size)
+        return merged_reservoir
@@ -0,0 +1,727 @@
+"""Contains mergeable sketches and sets summarizing data in bounded memory."""
+from __future__ import annotations
+
+import os
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# Hash of null values whichever their type or the dtype of their column
+_NULL_HASH = np.uint64(0x5BD1E9955BD1E995)
+
+
+def hash_rows(data: pd.DataFrame | pd.Series) -> np.ndarray:
+    """
+    Return the 64-bit hashes of the rows of a dataset or values of a column.
+
+    The columns are hashed in bulk and combined, null values all hashing the
+    same such that rows only differing by their representation of nulls,
+    e.g. None and NaN, hash the same.
+
+    :param data: rows or values to hash
+    :type data: Union[pandas.DataFrame, pandas.Series]
+    :return: hash of each row
+    :rtype: numpy.ndarray
+    """
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    row_hashes = np.zeros(len(data), dtype=np.uint64)
+    for _, column in data.items():
+        try:
+            hashes = pd.util.hash_pandas_object(column, index=False).to_numpy()
+        except TypeError:
+            hashes = pd.util.hash_pandas_object(
+                column.astype(str), index=False
+            ).to_numpy()
+        # the hashes may be a read-only view of the frame under copy-on-write
+        hashes = np.where(column.isna().to_numpy(), _NULL_HASH, hashes)
+        row_hashes = row_hashes * np.uint64(0x100000001B3) + hashes
+    return row_hashes
+
+
+def _mix_hashes(hashes: np.ndarray, seed: int) -> np.ndarray:
+    """Mix a seed into 64-bit hashes with the splitmix64 finalizer."""
+    hashes = hashes.astype(np.uint64) + np.uint64((seed * 0x9E3779B97F4A7C15) % 2**64)
+    hashes ^= hashes >> np.uint64(30)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= np.uint64(0x94D049BB133111EB)
+    hashes ^= hashes >> np.uint64(31)
+    return hashes
+
+
+class HyperLogLogSketch:
+    """
+    HyperLogLog sketch estimating the number of distinct values or rows.
+
+    Values are hashed in bulk into 64-bit hashes, whose first bits select a
+    register and whose remaining bits update it with the position of their
+    first set bit, all as vectorized NumPy operations. Sketches of the same
+    register count and seed are merged by taking the max of their registers.
+    """
+
+    def __init__(self, register_count: int = 15, seed: int = 0) -> None:
+        """
+        Initialize an empty sketch.
+
+        :param register_count: number of registers is equal to
+            2^register_count
+        :type register_count: int
+        :param seed: seed of the hash function
+        :type seed: int
+        """
+        self.register_count = register_count
+        self.seed = seed
+        self.registers = np.zeros(2**register_count, dtype=np.uint8)
+
+    @classmethod
+    def from_registers(
+        cls, registers: bytes | np.ndarray, seed: int = 0
+    ) -> HyperLogLogSketch:
+        """
+        Create a sketch from the registers of another HyperLogLog.
+
+        :param registers: one register value per byte, 2^p registers
+        :type registers: Union[bytes, numpy.ndarray]
+        :param seed: seed of the hash function
+        :type seed: int
+        :return: sketch with the given registers
+        :rtype: HyperLogLogSketch
+        """
+        registers = np.frombuffer(bytes(registers), dtype=np.uint8).copy()
+        sketch = cls(int(np.log2(len(registers))), seed)
+        sketch.registers = registers
+        return sketch
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Update the registers with 64-bit hashes of the values.
+
+        :param hashes: 64-bit hashes of the values
+        :type hashes: numpy.ndarray
+        """
+        if not len(hashes):
+            return
+        hashes = _mix_hashes(np.asarray(hashes), self.seed)
+        q = 64 - self.register_count
+        indices = (hashes >> np.uint64(q)).astype(np.intp)
+        remainders = hashes & np.uint64(2**q - 1)
+
+        # Bit length of the remaining bits, from the exponents of its 32-bit
+        # halves which are exactly represented as floats
+        high = np.frexp((remainders >> np.uint64(32)).astype(np.float64))[1]
+        low = np.frexp((remainders & np.uint64(2**32 - 1)).astype(np.float64))[1]
+        bit_lengths = np.where(high > 0, high + 32, low)
+
+        np.maximum.at(self.registers, indices, (q + 1 - bit_lengths).astype(np.uint8))
+
+    def update(self, data: pd.DataFrame | pd.Series) -> None:
+        """
+        Add the rows of a dataset or the values of a column to the sketch.
+
+        :param data: rows or values to add
+        :type data: Union[pandas.DataFrame, pandas.Series]
+        """
+        self.add_hashes(hash_rows(data))
+
+    def merge(self, other: HyperLogLogSketch) -> None:
+        """
+        Merge another sketch into this one.
+
+        :param other: sketch of the same register count and seed
+        :type other: HyperLogLogSketch
+        """
+        if self.register_count != other.register_count or self.seed != other.seed:
+            raise ValueError(
+                "HyperLogLog sketches can only be merged if they have the same "
+                "register count and seed."
+            )
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def cardinality(self) -> int:
+        """
+        Estimate the number of distinct values added to the sketch.
+
+        Uses the improved raw estimator of Ertl, which is accurate from small
+        to large cardinalities without empirical bias correction.
+
+        :return: estimated number of distinct values
+        :rtype: int
+        """
+        m = len(self.registers)
+        q = 64 - self.register_count
+        counts = np.bincount(self.registers, minlength=q + 2)
+        if counts[0] == m:
+            return 0
+
+        estimate = m * self._tau(1 - counts[q + 1] / m)
+        for k in range(q, 0, -1):
+            estimate = 0.5 * (estimate + counts[k])
+        estimate += m * self._sigma(counts[0] / m)
+        return int(round(m * m / (2 * np.log(2) * estimate)))
+
+    @staticmethod
+    def _sigma(x: float) -> float:
+        """Return the sigma function of the improved estimator."""
+        if x == 1:
+            return np.inf
+        y = 1.0
+        z = x
+        while True:
+            x *= x
+            z_prev = z
+            z += x * y
+            y += y
+            if z == z_prev:
+                return z
+
+    @staticmethod
+    def _tau(x: float) -> float:
+        """Return the tau function of the improved estimator."""
+        if x == 0 or x == 1:
+            return 0.0
+        y = 1.0
+        z = 1 - x
+        while True:
+            x = np.sqrt(x)
+            z_prev = z
+            y *= 0.5
+            z -= (1 - x) ** 2 * y
+            if z == z_prev:
+                return z / 3
+
+
+class SortedHashSet:
+    """
+    Exact set of 64-bit hashes kept as a sorted array of unique hashes.
+
+    Hashes are buffered and periodically merged into the sorted array, which
+    takes 8 bytes per distinct hash. Past an optional threshold of bytes, the
+    sorted array is spilled to a memory-mapped file and merged chunk by chunk,
+    such that only the buffered hashes are held in memory.
+    """
+
+    # Hashes buffered before being merged, relative to the sorted hashes
+    _min_buffer_size = 2**16
+    _buffer_ratio = 0.25
+    # Hashes merged at once into a spilled file
+    _chunk_size = 2**20
+
+    def __init__(
+        self, spill_threshold: int | None = None, spill_dirpath: str | None = None
+    ) -> None:
+        """
+        Initialize an empty set.
+
+        :param spill_threshold: bytes of sorted hashes kept in memory before
+            spilling them to disk, never spilled if None
+        :type spill_threshold: Union[int, None]
+        :param spill_dirpath: directory of the spilled hashes, the default
+            temporary directory if None
+        :type spill_dirpath: Union[str, None]
+        """
+        self.spill_threshold = spill_threshold
+        self.spill_dirpath = spill_dirpath
+        self._hashes: np.ndarray = np.empty(0, dtype=np.uint64)
+        self._buffer: list[np.ndarray] = []
+        self._buffer_size = 0
+        self._finalizer: weakref.finalize | None = None
+
+    @classmethod
+    def from_hashes(
+        cls,
+        hashes: np.ndarray,
+        spill_threshold: int | None = None,
+        spill_dirpath: str | None = None,
+    ) -> SortedHashSet:
+        """
+        Create a set from existing hashes.
+
+        :param hashes: 64-bit hashes, possibly duplicated
+        :type hashes: numpy.ndarray
+        :param spill_threshold: bytes of sorted hashes kept in memory before
+            spilling them to disk, never spilled if None
+        :type spill_threshold: Union[int, None]
+        :param spill_dirpath: directory of the spilled hashes
+        :type spill_dirpath: Union[str, None]
+        :return: set of the hashes
+        :rtype: SortedHashSet
+        """
+        hash_set = cls(spill_threshold, spill_dirpath)
+        hash_set.add_hashes(hashes)
+        hash_set._compact()
+        return hash_set
+
+    def __getstate__(self) -> dict:
+        """Return the state of the set with its hashes in memory."""
+        self._compact()
+        state = self.__dict__.copy()
+        state["_hashes"] = np.array(self._hashes)
+        state["_finalizer"] = None
+        return state
+
+    def __len__(self) -> int:
+        """Return the number of distinct hashes."""
+        self._compact()
+        return len(self._hashes)
+
+    @property
+    def is_spilled(self) -> bool:
+        """Return True if the sorted hashes are kept on disk."""
+        return isinstance(self._hashes, np.memmap)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Add 64-bit hashes to the set.
+
+        :param hashes: 64-bit hashes, possibly duplicated
+        :type hashes: numpy.ndarray
+        """
+        hashes = np.unique(np.asarray(hashes, dtype=np.uint64))
+        if not len(hashes):
+            return
+        self._buffer.append(hashes)
+        self._buffer_size += len(hashes)
+        if self._buffer_size >= max(
+            self._min_buffer_size, self._buffer_ratio * len(self._hashes)
+        ):
+            self._compact()
+
+    def update(self, data: pd.DataFrame | pd.Series) -> None:
+        """
+        Add the rows of a dataset or the values of a column to the set.
+
+        :param data: rows or values to add
+        :type data: Union[pandas.DataFrame, pandas.Series]
+        """
+        self.add_hashes(hash_rows(data))
+
+    def merge(self, other: SortedHashSet) -> None:
+        """
+        Merge another set into this one.
+
+        :param other: set being merged into this one
+        :type other: SortedHashSet
+        """
+        other._compact()
+        self._buffer.append(np.array(other._hashes))
+        self._buffer_size += len(other._hashes)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Merge the buffered hashes into the sorted hashes."""
+        if not self._buffer:
+            return
+        new_hashes = np.unique(np.concatenate(self._buffer))
+        self._buffer = []
+        self._buffer_size = 0
+
+        # Only insert the hashes not already in the set
+        positions = np.searchsorted(self._hashes, new_hashes)
+        is_known = positions < len(self._hashes)
+        is_known[is_known] = self._hashes[positions[is_known]] == new_hashes[is_known]
+        new_hashes = new_hashes[~is_known]
+        positions = positions[~is_known]
+        if not len(new_hashes):
+            return
+
+        size = len(self._hashes) + len(new_hashes)
+        if self.spill_threshold is None or size * 8 <= self.spill_threshold:
+            hashes = np.insert(self._hashes, positions, new_hashes)
+            self._release_file()
+            self._hashes = hashes
+        else:
+            self._insert_into_file(new_hashes, positions, size)
+
+    def _insert_into_file(
+        self, new_hashes: np.ndarray, positions: np.ndarray, size: int
+    ) -> None:
+        """Write the sorted hashes with the new ones inserted into a new file."""
+        fd, filepath = tempfile.mkstemp(suffix=".npy", dir=self.spill_dirpath)
+        os.close(fd)
+        hashes = np.lib.format.open_memmap(
+            filepath, mode="w+", dtype=np.uint64, shape=(size,)
+        )
+        finalizer = weakref.finalize(self, os.remove, filepath)
+
+        # Each chunk of sorted hashes is written with the new hashes within it
+        old_size = len(self._hashes)
+        bounds = list(range(0, old_size, self._chunk_size)) + [old_size]
+        start_new = 0
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            end_new = len(new_hashes)
+            if end < old_size:
+                end_new = int(np.searchsorted(positions, end))
+            chunk = np.insert(
+                self._hashes[start:end],
+                positions[start_new:end_new] - start,
+                new_hashes[start_new:end_new],
+            )
+            hashes[start + start_new : start + start_new + len(chunk)] = chunk
+            start_new = end_new
+        if not old_size:
+            hashes[:] = new_hashes
+        hashes.flush()
+
+        self._release_file()
+        self._hashes = hashes
+        self._finalizer = finalizer
+
+    def _release_file(self) -> None:
+        """Remove the file of the spilled hashes, if any."""
+        if self._finalizer is not None:
+            self._hashes = np.empty(0, dtype=np.uint64)
+            self._finalizer()
+            self._finalizer = None
+
+
+class HeavyHitterSketch:
+    """
+    Mergeable sketch of the most frequent values of a column and their counts.
+
+    A SpaceSaving summary monitors at most `capacity` values with an upper
+    bound of their count and of its overestimation. Values which are not
+    monitored have a count of at most the floor of the summary. A Count-Min
+    sketch of `depth` rows of `width` counters bounds the count of any value,
+    tightening the counts of the summary, and a HyperLogLog sketch estimates
+    the number of distinct values once the summary no longer holds them all.
+    Memory is fixed by the parameters regardless of the number of values.
+    """
+
+    def __init__(
+        self, capacity: int = 1000, width: int = 2048, depth: int = 4, seed: int = 0
+    ) -> None:
+        """
+        Initialize an empty sketch.
+
+        :param capacity: maximum number of values monitored by the summary
+        :type capacity: int
+        :param width: number of counters of each row of the Count-Min sketch
+        :type width: int
+        :param depth: number of rows of the Count-Min sketch
+        :type depth: int
+        :param seed: seed of the hash functions
+        :type seed: int
+        """
+        self.capacity = capacity
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.total = 0
+        self.floor = 0
+        self.counts: dict = {}
+        self.errors: dict = {}
+        self.count_min = np.zeros((depth, width), dtype=np.int64)
+        self.distinct = HyperLogLogSketch(register_count=12, seed=seed)
+
+    @property
+    def is_exact(self) -> bool:
+        """Return True if the summary holds the exact count of every value."""
+        return self.floor == 0
+
+    def _get_cells(self, values: pd.Index) -> np.ndarray:
+        """Return the flat index of the counter of each value in each row."""
+        hashes = hash_rows(pd.Series(values, dtype=object))
+        cells = np.empty((self.depth, len(values)), dtype=np.int64)
+        for row in range(self.depth):
+            row_hashes = _mix_hashes(hashes, self.seed + row)
+            cells[row] = (row_hashes % np.uint64(self.width)).astype(np.int64)
+            cells[row] += row * self.width
+        return cells
+
+    def update(self, value_counts: pd.Series | dict) -> None:
+        """
+        Add the counts of values of a batch to the sketch.
+
+        :param value_counts: count of each distinct value of the batch
+        :type value_counts: Union[pandas.Series, dict]
+        """
+        value_counts = pd.Series(value_counts, dtype=object).astype(np.int64)
+        value_counts = value_counts[value_counts > 0]
+        if not len(value_counts):
+            return
+        counts = value_counts.to_numpy()
+        cells = self._get_cells(value_counts.index)
+        self.count_min += (
+            np.bincount(
+                cells.ravel(),
+                weights=np.tile(counts, self.depth),
+                minlength=self.depth * self.width,
+            )
+            .astype(np.int64)
+            .reshape(self.depth, self.width)
+        )
+        self.distinct.update(pd.Series(value_counts.index, dtype=object))
+        self.total += int(counts.sum())
+        self._merge_summary(value_counts, pd.Series(0, index=value_counts.index), 0)
+
+    def _merge_summary(self, counts: pd.Series, errors: pd.Series, floor: int) -> None:
+        """Merge another summary into this one, keeping the largest counts."""
+        own_counts = pd.Series(self.counts, dtype=object)
+        own_errors = pd.Series(self.errors, dtype=object)
+        index = own_counts.index.append(counts.index).drop_duplicates()
+        merged_counts = own_counts.reindex(index, fill_value=self.floor).to_numpy(
+            dtype=np.int64
+        ) + counts.reindex(index, fill_value=floor).to_numpy(dtype=np.int64)
+        merged_errors = own_errors.reindex(index, fill_value=self.floor).to_numpy(
+            dtype=np.int64
+        ) + errors.reindex(index, fill_value=floor).to_numpy(dtype=np.int64)
+
+        merged_floor = self.floor + floor
+        if len(index) > self.capacity:
+            # A dropped value is bounded by its count in the merged summary
+            order = np.argsort(-merged_counts, kind="stable")
+            merged_floor = max(merged_floor, int(merged_counts[order[self.capacity]]))
+            keep = order[: self.capacity]
+            index = index[keep]
+            merged_counts = merged_counts[keep]
+            merged_errors = merged_errors[keep]
+
+        self.floor = merged_floor
+        self.counts = dict(zip(index, merged_counts.tolist()))
+        self.errors = dict(zip(index, merged_errors.tolist()))
+
+    def merge(self, other: HeavyHitterSketch) -> None:
+        """
+        Merge another sketch into this one.
+
+        :param other: sketch of the same capacity, width, depth and seed
+        :type other: HeavyHitterSketch
+        """
+        if (self.capacity, self.width, self.depth, self.seed) != (
+            other.capacity,
+            other.width,
+            other.depth,
+            other.seed,
+        ):
+            raise ValueError(
+                "Heavy hitter sketches can only be merged if they have the same "
+                "capacity, width, depth and seed."
+            )
+        self.count_min += other.count_min
+        self.distinct.merge(other.distinct)
+        self.total += other.total
+        self._merge_summary(
+            pd.Series(other.counts, dtype=object),
+            pd.Series(other.errors, dtype=object),
+            other.floor,
+        )
+
+    def estimate(self, values: list | pd.Index) -> np.ndarray:
+        """
+        Return an upper bound of the count of each value.
+
+        :param values: values whose counts are estimated
+        :type values: Union[list, pandas.Index]
+        :return: upper bound of the count of each value
+        :rtype: numpy.ndarray
+        """
+        values = pd.Index(values, dtype=object)
+        if not len(values):
+            return np.empty(0, dtype=np.int64)
+        estimates = self.count_min.ravel()[self._get_cells(values)].min(axis=0)
+        counts = pd.Series(self.counts, dtype=object).reindex(
+            values, fill_value=self.floor
+        )
+        upper_bounds: np.ndarray = np.minimum(
+            estimates, counts.to_numpy(dtype=np.int64)
+        )
+        return upper_bounds
+
+    def top_counts(self, k: int | None = None) -> tuple[dict, dict]:
+        """
+        Return the most frequent values with their counts and error bounds.
+
+        The count of each value is an upper bound, exceeding the true count
+        by at most its error.
+
+        :param k: number of values returned, all the monitored values if None
+        :type k: Union[int, None]
+        :return: count and error of each value, by decreasing count
+        :rtype: tuple(dict, dict)
+        """
+        values = pd.Index(list(self.counts), dtype=object)
+        counts = self.estimate(values)
+        lower_bounds = np.maximum(
+            np.fromiter(self.counts.values(), dtype=np.int64, count=len(values))
+            - np.fromiter(self.errors.values(), dtype=np.int64, count=len(values)),
+            0,
+        )
+        order = np.argsort(-counts, kind="stable")[:k]
+        top_values = values[order]
+        return (
+            dict(zip(top_values, counts[order].tolist())),
+            dict(zip(top_values, (counts - lower_bounds)[order].tolist())),
+        )
+
+    def distinct_count(self) -> int:
+        """
+        Return the number of distinct values, estimated if not exact.
+
+        :return: number of distinct values
+        :rtype: int
+        """
+        if self.is_exact:
+            return len(self.counts)
+        return max(self.distinct.cardinality(), len(self.counts))
+
+
+class KLLSketch:
+    """
+    Mergeable KLL sketch of the quantiles of numeric values.
+
+    Values are kept in a hierarchy of compactors, the values of level h
+    each standing for 2**h values. A compactor exceeding its capacity sorts
+    its values and promotes every other one, starting at a random offset, to
+    the next level. The capacities decrease geometrically from the top level,
+    bounding the memory to about 3 * `compactor_size` values, and each
+    compaction shifts the rank of any value by at most the weight of its
+    level, such that the rank error of the quantiles is bounded with high
+    probability by a fraction of the number of values inversely
+    proportional to `compactor_size`, also after merging sketches.
+    """
+
+    def __init__(self, compactor_size: int = 200, seed: int = 0) -> None:
+        """
+        Initialize an empty sketch.
+
+        :param compactor_size: capacity of the top compactor
+        :type compactor_size: int
+        :param seed: seed of the random compactions
+        :type seed: int
+        """
+        self.compactor_size = compactor_size
+        self.seed = seed
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _get_capacity(self, level: int) -> int:
+        """Return the capacity of the compactor of a level."""
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.compactor_size * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        """Compact the levels exceeding their capacity, from the bottom up."""
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) >= self._get_capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                values = np.sort(self.levels[level])
+                # An odd value out, the smallest, stays at its level
+                is_odd = len(values) % 2
+                offset = int(self._rng.integers(2))
+                self.levels[level] = values[:is_odd]
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], values[is_odd + offset :: 2]]
+                )
+            level += 1
+
+    def update(self, values: np.ndarray | pd.Series) -> None:
+        """
+        Add a batch of values to the sketch, ignoring null values.
+
+        :param values: values to add
+        :type values: Union[numpy.ndarray, pandas.Series]
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        """
+        Merge another sketch into this one.
+
+        :param other: sketch of the same compactor size
+        :type other: KLLSketch
+        """
+        if self.compactor_size != other.compactor_size:
+            raise ValueError(
+                "KLL sketches can only be merged if they have the same "
+                "compactor size."
+            )
+        if not other.count:
+            return
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for level, values in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self._compress()
+
+    def _get_weighted_values(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the values of all the levels and the weight of each."""
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**idx) for idx, level in enumerate(self.levels)]
+        )
+        return values, weights
+
+    @staticmethod
+    def _interpolate(
+        values: np.ndarray, weights: np.ndarray, quantiles: np.ndarray
+    ) -> np.ndarray:
+        """
+        Interpolate quantiles of weighted values.
+
+        Each value is placed at the middle of the ranks it stands for, such
+        that unit weights give the linear interpolation of `numpy.quantile`.
+        """
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        weights = weights[order]
+        count = weights.sum()
+        if count <= 1:
+            return np.full(len(quantiles), values[0])
+        positions = (np.cumsum(weights) - weights / 2 - 0.5) / (count - 1)
+        return np.interp(quantiles, positions, values)
+
+    def quantiles(self, quantiles: np.ndarray | list[float]) -> list[float]:
+        """
+        Return the estimated values at the given quantiles.
+
+        :param quantiles: quantiles, between 0 and 1
+        :type quantiles: Union[numpy.ndarray, list(float)]
+        :return: value at each quantile, NaN if the sketch is empty
+        :rtype: list(float)
+        """
+        quantiles = np.asarray(quantiles, dtype=float)
+        if not self.count:
+            return [np.nan] * len(quantiles)
+        values, weights = self._get_weighted_values()
+        # The exact extremes bound the interpolation
+        values = np.concatenate([[self.min], values, [self.max]])
+        weights = np.concatenate([[0.0], weights, [0.0]])
+        result = self._interpolate(values, weights, quantiles)
+        result[quantiles <= 0] = self.min
+        result[quantiles >= 1] = self.max
+        return list(result.tolist())
+
+    def median_abs_deviation(self, median: float) -> float:
+        """
+        Return the estimated median of the absolute deviations from a value.
+
+        :param median: value from which the deviations are taken
+        :type median: float
+        :return: median absolute deviation, NaN if the sketch is empty
+        :rtype: float
+        """
+        if not self.count:
+            return np.nan
+        values, weights = self._get_weighted_values()
+        return float(
+            self._interpolate(np.abs(values - median), weights, np.array([0.5]))[0]
+        )
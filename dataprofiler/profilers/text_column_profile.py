@@ -7,7 +7,11 @@ import numpy as np
 import pandas as pd
 
 from . import utils
-from .base_column_profilers import BaseColumnPrimitiveTypeProfiler, BaseColumnProfiler
+from .base_column_profilers import (
+    BaseColumnPrimitiveTypeProfiler,
+    BaseColumnProfiler,
+    ColumnView,
+)
 from .numerical_column_stats import NumericStatsMixin
 from .profiler_options import TextOptions
 
@@ -151,29 +155,31 @@ class TextColumn(
         data_flat = set(itertools.chain(*data))
         self.vocab = utils._combine_unique_sets(self.vocab, data_flat)
 
-    def _update_helper(self, df_series_clean: pd.Series, profile: dict) -> None:
+    def _update_helper(
+        self, df_series_clean: pd.Series | ColumnView, profile: dict
+    ) -> None:
         """
         Update col profile properties with clean dataset and its known null parameters.
 
-        :param df_series_clean: df series with nulls removed
-        :type df_series_clean: pandas.core.series.Series
+        :param df_series_clean: df series with nulls removed or view of it
+        :type df_series_clean: Union[pandas.core.series.Series, ColumnView]
         :param profile: text profile dictionary
         :type profile: dict
         :return: None
         """
         if self._NumericStatsMixin__calculations:
-            text_lengths = df_series_clean.str.len()
+            text_lengths = ColumnView.from_series(df_series_clean).str_lengths
             NumericStatsMixin._update_helper(self, text_lengths, profile)
         self._update_column_base_properties(profile)
         if self.max:
             self.type = "string" if self.max <= 255 else "text"
 
-    def update(self, df_series: pd.Series) -> TextColumn:
+    def update(self, df_series: pd.Series | ColumnView) -> TextColumn:
         """
         Update the column profile.
 
-        :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :param df_series: df series or view of the column
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: updated TextColumn
         :rtype: TextColumn
         """
@@ -181,16 +187,17 @@ class TextColumn(
         if len_df == 0:
             return self
 
+        column_view = ColumnView.from_series(df_series)
         profile = dict(match_count=len_df, sample_size=len_df)
 
         BaseColumnProfiler._perform_property_calcs(
             self,
             self.__calculations,
-            df_series=df_series,
+            df_series=column_view.str_series,
             prev_dependent_properties={},
             subset_properties=profile,
         )
 
-        self._update_helper(df_series, profile)
+        self._update_helper(column_view, profile)
 
         return self
@@ -5,9 +5,9 @@ import collections
 import copy
 import datetime
 import functools
-import math
 import multiprocessing as mp
 import os
+import re
 import time
 import warnings
 from abc import abstractmethod
@@ -28,7 +28,7 @@ from typing import (
 import numpy as np
 import psutil
 import scipy
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, factorize
 
 from dataprofiler import profilers, settings
 
@@ -51,20 +51,6 @@ def recursive_dict_update(d: dict, update_d: dict) -> dict:
     return d
 
 
-class KeyDict(collections.defaultdict):
-    """
-    Helper class for sample_in_chunks.
-
-    Allows keys that are missing to become the values for that key.
-    From:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
-    """
-
-    def __missing__(self, key: str) -> str:
-        """Return key if key nonexistent."""
-        return key
-
-
 def _combine_unique_sets(a: list | set, b: list | set) -> list:
     """
     Unify two lists.
@@ -85,20 +71,74 @@ def _combine_unique_sets(a: list | set, b: list | set) -> list:
     return list(combined_list)
 
 
+def _sample_chunks_without_permutation(
+    rng: np.random.Generator, data_length: int, chunk_size: int
+) -> Generator[np.ndarray, None, Any]:
+    """
+    Sample shuffled indexes in chunks without permuting all indexes upfront.
+
+    Indexes are drawn uniformly and the first draw of each index not drawn
+    yet is kept, which samples without replacement. Once most indexes are
+    drawn, rejecting the redrawn ones gets expensive, hence the remaining
+    indexes are permuted instead.
+
+    :param rng: random generator drawing the indexes
+    :type rng: numpy.random.Generator
+    :param data_length: length of data to be shuffled
+    :type data_length: int
+    :param chunk_size: size of shuffled chunks
+    :type chunk_size: int
+    :return: arrays of shuffled indices of chunk size
+    """
+    drawn = np.empty(0, dtype=np.int64)  # sorted
+    while len(drawn) < data_length:
+        true_chunk_size = min(chunk_size, data_length - len(drawn))
+        if (len(drawn) + true_chunk_size) * 2 > data_length:
+            is_remaining = np.ones(data_length, dtype=bool)
+            is_remaining[drawn] = False
+            remaining = np.flatnonzero(is_remaining)
+            rng.shuffle(remaining)
+            for start in range(0, len(remaining), chunk_size):
+                yield remaining[start : start + chunk_size]
+            return
+
+        chunk = np.empty(0, dtype=np.int64)
+        while len(chunk) < true_chunk_size:
+            candidates = rng.integers(
+                0, data_length, size=2 * (true_chunk_size - len(chunk))
+            )
+            # Keep the first draw of each index not drawn yet, searching the
+            # sorted unique draws before restoring the order drawn
+            candidates, first_draws = np.unique(candidates, return_index=True)
+            is_new = ~np.isin(candidates, chunk)
+            if len(drawn):
+                drawn_ind = np.searchsorted(drawn, candidates)
+                drawn_ind = np.minimum(drawn_ind, len(drawn) - 1)
+                is_new &= drawn[drawn_ind] != candidates
+            candidates = candidates[is_new][np.argsort(first_draws[is_new])]
+            chunk = np.concatenate([chunk, candidates])
+        chunk = chunk[:true_chunk_size]
+        sorted_chunk = np.sort(chunk)
+        drawn = np.insert(drawn, np.searchsorted(drawn, sorted_chunk), sorted_chunk)
+        yield chunk
+
+
 def shuffle_in_chunks(
-    data_length: int, chunk_size: int
-) -> Generator[list[int], None, Any]:
+    data_length: int, chunk_size: int, partial: bool | None = None
+) -> Generator[np.ndarray, None, Any]:
     """
     Create shuffled indexes in chunks.
 
-    This reduces the cost of having to create all indexes,
-    but only of that what is needed.
-    Initial Code idea from:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
+    By default, all indexes are permuted at once and yielded in chunks. When
+    partial, the indexes are instead sampled chunk by chunk, which reduces the
+    cost of having to create all indexes when only the first chunks of a
+    long dataset are needed.
 
     :param data_length: length of data to be shuffled
     :param chunk_size: size of shuffled chunks
-    :return: list of shuffled indices of chunk size
+    :param partial: whether to sample the chunks without permuting all indexes,
+        if None only when the chunks are small relative to the data
+    :return: arrays of shuffled indices of chunk size
     """
     if not data_length or data_length == 0 or not chunk_size or chunk_size == 0:
         return []
@@ -112,33 +152,16 @@ def shuffle_in_chunks(
         else:
             warnings.warn("Seed should be an integer", RuntimeWarning)
 
-    indices = KeyDict()
-    j = 0
-
-    # loop through all chunks
-    for chunk_ind in range(max(math.ceil(data_length / chunk_size), 1)):
-
-        # determine the chunk size and preallocate an array
-        true_chunk_size = min(chunk_size, data_length - chunk_size * chunk_ind)
-        values = [-1] * true_chunk_size
+    if partial is None:
+        partial = chunk_size * 50 <= data_length
 
-        # Generate random list of indexes
-        lower_bound_list = np.array(range(j, j + true_chunk_size))
-        random_list = rng.integers(lower_bound_list, data_length)
+    if partial:
+        yield from _sample_chunks_without_permutation(rng, data_length, chunk_size)
+        return
 
-        # shuffle the indexes
-        for count in range(true_chunk_size):
-            # get a random index to swap and swap it with j
-            k = random_list[count]
-            indices[j], indices[k] = indices[k], indices[j]
-
-            # set the swapped value to the output
-            values[count] = indices[j]
-
-            # increment so as not to include values already swapped
-            j += 1
-
-        yield values
+    indices = rng.permutation(data_length)
+    for start in range(0, data_length, chunk_size):
+        yield indices[start : start + chunk_size]
 
 
 def warn_on_profile(col_profile: str, e: Exception) -> None:
@@ -293,6 +316,172 @@ def add_nested_dictionaries(first_dict: dict, second_dict: dict) -> dict:
     return merged_dict
 
 
+# Every string accepted by `float` only consists of these characters, which
+# allows values that are clearly not numbers to skip the conversion attempt.
+_FLOAT_CHARACTERS_REGEX = re.compile(r"[\s\d+\-._eEnNaAiIfFtTyY]+")
+
+
+def _to_float(value: Any) -> float | None:
+    """
+    Convert a value to a float, returning None if not convertible.
+
+    :param value: value to convert
+    :type value: Any
+    :return: the float value or None
+    :rtype: Union[float, None]
+    """
+    if isinstance(value, str) and not _FLOAT_CHARACTERS_REGEX.fullmatch(value):
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def parse_floats(df_series: Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert each value of a column to a float where `float` can convert it.
+
+    Native numeric columns are converted without any parsing and string
+    columns are converted in bulk, falling back to converting each unique
+    value once if the bulk conversion fails.
+
+    :param df_series: series of values to convert
+    :type df_series: pandas.core.series.Series
+    :return: the float values, NaN where not convertible, and the mask of
+        values which are convertible
+    :rtype: tuple(numpy.ndarray, numpy.ndarray)
+    """
+    values = df_series.to_numpy()
+    is_float = np.ones(len(values), dtype=bool)
+    try:
+        floats = values.astype(float)
+    except (ValueError, TypeError, OverflowError):
+        # the extra trailing entry is used by missing values, coded as -1
+        codes, uniques = factorize(values)
+        unique_floats = np.full(len(uniques) + 1, np.nan)
+        unique_is_float = np.zeros(len(uniques) + 1, dtype=bool)
+        for i, value in enumerate(uniques):
+            float_value = _to_float(value)
+            if float_value is not None:
+                unique_floats[i] = float_value
+                unique_is_float[i] = True
+        floats = unique_floats[codes]
+        is_float = unique_is_float[codes]
+
+        # missing values are not factorized and are converted separately
+        for i in np.flatnonzero(codes < 0):
+            float_value = _to_float(values[i])
+            floats[i] = np.nan if float_value is None else float_value
+            is_float[i] = float_value is not None
+    return floats, is_float
+
+
+def get_numeric_type_masks(
+    df_series: Series, parsed_floats: tuple[np.ndarray, np.ndarray] | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Determine whether each value of a column is an int, a float or text.
+
+    A value is a float if `float` can convert it, including NaN and inf, and
+    an int if it is additionally a finite, integral value. All other values
+    are text.
+
+    :param df_series: series of values to evaluate
+    :type df_series: pandas.core.series.Series
+    :param parsed_floats: result of `parse_floats` for the series if known
+    :type parsed_floats: tuple(numpy.ndarray, numpy.ndarray)
+    :return: int mask, float mask and text mask
+    :rtype: tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)
+    """
+    if df_series.dtype.kind in "iu":
+        is_float = np.ones(len(df_series), dtype=bool)
+        return is_float, is_float.copy(), ~is_float
+
+    floats, is_float = parsed_floats or parse_floats(df_series)
+    with np.errstate(invalid="ignore"):
+        is_int = is_float & np.isfinite(floats) & (floats == np.floor(floats))
+    return is_int, is_float, ~is_float
+
+
+class BatchMoments:
+    """
+    Moments and counts of a batch of numeric values, computed in bulk.
+
+    The values are converted once to a contiguous float array, from which
+    the extremes, sum and counts are reduced and, in a second pass over the
+    deviations from the mean, the central moments up to the requested
+    order. The batch statistics are those merged into the profile by the
+    `_merge_biased_*` functions of the numeric stats.
+    """
+
+    def __init__(self, values: np.ndarray | Series, order: int = 4) -> None:
+        """
+        Compute the moments of a batch of values.
+
+        As with pandas, the extremes, sum and variance skip NaN values, while
+        the skewness and kurtosis of a batch with NaN values are NaN.
+
+        :param values: values of the batch
+        :type values: Union[numpy.ndarray, pandas.Series]
+        :param order: highest order of the central moments computed, 2 for
+            the variance, 3 for the skewness and 4 for the kurtosis
+        :type order: int
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        self.count = len(values)
+        self.min = np.nan
+        self.max = np.nan
+        self.sum = 0.0
+        self.biased_variance = np.nan
+        self.biased_skewness = np.nan
+        self.biased_kurtosis = np.nan
+        self.num_zeros = int(np.count_nonzero(values == 0))
+        self.num_negatives = int(np.count_nonzero(values < 0))
+
+        is_nan = np.isnan(values)
+        has_nan = bool(is_nan.any())
+        if has_nan:
+            values = values[~is_nan]
+        count = len(values)
+        if not count:
+            return
+
+        # Suppress any numpy warnings as the numeric stats have a custom
+        # warning for invalid or infinite data already
+        with np.errstate(all="ignore"):
+            self.min = values.min()
+            self.max = values.max()
+            self.sum = values.sum()
+            mean = self.sum / count
+            if order < 2 or not np.isfinite(mean):
+                # Infinite values make the moments invalid
+                return
+
+            diffs = values - mean
+            squared_diffs = diffs * diffs
+            M2 = squared_diffs.sum()
+            self.biased_variance = M2 / count
+            if has_nan:
+                return
+            # This correction comes from the pandas implementation of
+            # skewness and kurtosis, which zeroes these values out before
+            # computation due to possible floating point errors that can occur.
+            M2 = 0 if np.abs(M2) < 1e-14 else M2
+            if order >= 3:
+                M3 = np.dot(squared_diffs, diffs)
+                M3 = 0 if np.abs(M3) < 1e-14 else M3
+                self.biased_skewness = (
+                    0.0 if M2 == 0 else np.sqrt(count) * M3 / np.power(M2, 1.5)
+                )
+            if order >= 4:
+                M4 = np.dot(squared_diffs, squared_diffs)
+                M4 = 0 if np.abs(M4) < 1e-14 else M4
+                self.biased_kurtosis = (
+                    -3.0 if M2 == 0 else count * M4 / np.power(M2, 2) - 3
+                )
+
+
 def biased_skew(df_series: Series) -> float:
     """
     Calculate the biased estimator for skewness of the given data.
@@ -304,31 +493,7 @@ def biased_skew(df_series: Series) -> float:
     :return: biased skewness
     :rtype: float
     """
-    n = len(df_series)
-    if n < 1:
-        return np.nan
-
-    mean = sum(df_series) / n
-    if np.isinf(mean) or np.isnan(mean):
-        return np.nan
-
-    diffs = df_series - mean
-    squared_diffs = diffs**2
-    cubed_diffs = squared_diffs * diffs
-    M2 = sum(squared_diffs)
-    M3 = sum(cubed_diffs)
-    # This correction comes from the pandas implementation of
-    # skewness, which zeroes these values out before computation
-    # due to possible floating point errors that can occur.
-    M2 = 0 if np.abs(M2) < 1e-14 else M2
-    M3 = 0 if np.abs(M3) < 1e-14 else M3
-
-    if M2 == 0:
-        return 0.0
-
-    with np.errstate(all="ignore"):
-        skew: float = np.sqrt(n) * M3 / np.power(M2, 1.5)
-    return skew
+    return cast(float, BatchMoments(df_series, order=3).biased_skewness)
 
 
 def biased_kurt(df_series: Series) -> float:
@@ -342,31 +507,7 @@ def biased_kurt(df_series: Series) -> float:
     :return: biased kurtosis
     :rtype: float
     """
-    n = len(df_series)
-    if n < 1:
-        return np.nan
-
-    mean = sum(df_series) / n
-    if np.isinf(mean) or np.isnan(mean):
-        return np.nan
-
-    diffs = df_series - mean
-    squared_diffs = diffs**2
-    fourth_diffs = squared_diffs * squared_diffs
-    M2 = sum(squared_diffs)
-    M4 = sum(fourth_diffs)
-    # This correction comes from the pandas implementation of
-    # kurtosis, which zeroes these values out before computation
-    # due to possible floating point errors that can occur.
-    M2 = 0 if np.abs(M2) < 1e-14 else M2
-    M4 = 0 if np.abs(M4) < 1e-14 else M4
-
-    if M2 == 0:
-        return -3.0
-
-    with np.errstate(all="ignore"):
-        kurt: float = n * M4 / np.power(M2, 2) - 3
-    return kurt
+    return cast(float, BatchMoments(df_series, order=4).biased_kurtosis)
 
 
 class Subtractable(Protocol):
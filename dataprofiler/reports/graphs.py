@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import math
 import warnings
-from typing import TYPE_CHECKING, List, Union, cast
+from typing import TYPE_CHECKING, Iterable, List, Union, cast
 
 if TYPE_CHECKING:
     from ..profilers.float_column_profile import FloatColumn
@@ -286,7 +286,8 @@ def plot_col_missing_values(
         for i, null_type in enumerate(null_data):
 
             # sorted null indexes for plotting contiguous
-            null_indexes = sorted(null_data[null_type])
+            # the rows of the profiled data are indexed by ints
+            null_indexes = sorted(cast(Iterable[int], null_data[null_type]))
 
             # get the color for this nan value, if it hasn't been determined,
             # determine it now
@@ -180,6 +180,23 @@ class TestAVRODataClass(unittest.TestCase):
             data = AVROData(input_file["path"])
             self.assertIsNone(data.file_encoding)
 
+    def test_native_numeric_dtypes(self):
+        """Determine if the int and float columns typed by avro are kept native"""
+        file_path = os.path.join(test_root_path, "data/avro/userdata1.avro")
+
+        # by default, the columns are read as strings
+        data = AVROData(file_path)
+        self.assertIsInstance(data.data["id"][0], str)
+        self.assertIsInstance(data.data["salary"][0], str)
+
+        data = AVROData(file_path, options={"keep_native_numeric": True})
+        self.assertEqual("int64", data.data["id"].dtype)
+        self.assertEqual("float64", data.data["salary"].dtype)
+        self.assertIsInstance(data.data["first_name"][0], str)
+
+        with self.assertRaisesRegex(ValueError, "'keep_native_numeric' must be a bool"):
+            AVROData(options={"keep_native_numeric": 1})
+
     def test_is_structured(self):
         # Default construction
         data = AVROData()
@@ -691,6 +691,13 @@ class TestCSVDataClass(unittest.TestCase):
             expected_error="'record_samples_per_line' must be an int more than " "0",
         )
 
+        _test_options(
+            "chunk_size",
+            valid=[1, 10, None],
+            invalid=[0, -1, "", True, 1.5],
+            expected_error="'chunk_size' must be None or an int more than 0",
+        )
+
         # test edge case for header being set
         file = self.input_file_names[0]
         filepath = file["path"]
@@ -716,6 +723,34 @@ class TestCSVDataClass(unittest.TestCase):
             self.assertEqual(input_file["count"], len(data), msg=input_file["path"])
             self.assertEqual(input_file["count"], data.length, msg=input_file["path"])
 
+    def test_get_chunk_generator(self):
+        """
+        Validate that the chunk generator streams the same data as is loaded
+        into memory.
+        """
+        for input_file in self.file_or_buf_list:
+            data = CSVData(input_file["path"], options={"chunk_size": 7})
+            chunks = list(data.get_chunk_generator())
+            self.assertIsNone(data._data, msg=input_file["path"])
+            self.assertTrue(
+                all(len(chunk) <= 7 for chunk in chunks), msg=input_file["path"]
+            )
+
+            if isinstance(input_file["path"], (StringIO, BytesIO)):
+                input_file["path"].seek(0)
+            expected_df = CSVData(input_file["path"]).data
+            pd.testing.assert_frame_equal(
+                expected_df, pd.concat(chunks), obj=input_file["path"]
+            )
+
+        # in memory data is sliced into chunks
+        data = CSVData(data=pd.DataFrame({"a": ["1", "2", "3"]}))
+        chunks = list(data.get_chunk_generator(chunk_size=2))
+        self.assertEqual([2, 1], [len(chunk) for chunk in chunks])
+
+        with self.assertRaisesRegex(ValueError, "`chunk_size` must be an int"):
+            list(data.get_chunk_generator())
+
     def test_is_structured(self):
         # Default construction
         data = CSVData()
@@ -2,6 +2,8 @@ import os
 import unittest
 from itertools import islice
 
+import pandas as pd
+
 from dataprofiler.data_readers import data_utils
 
 test_root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
@@ -238,3 +240,18 @@ class TestDataReadingWriting(unittest.TestCase):
                 chunk_size_bytes=f["chunk_size_bytes"],
             )
             self.assertEqual(expected, output_str, f["path"])
+
+    def test_convert_to_str(self):
+        df = pd.DataFrame(
+            [[1, 1.5, "a", True], [2, 2.0, "b", False]], columns=["a", "b", "c", "a"]
+        )
+        str_df = data_utils.convert_to_str(df)
+        self.assertListEqual(["1", "1.5", "a", "True"], str_df.iloc[0].tolist())
+
+        # the int and float64 columns are kept as is, even if duplicated
+        native_df = data_utils.convert_to_str(df, keep_native_numeric=True)
+        self.assertListEqual(list(df.columns), list(native_df.columns))
+        self.assertEqual("int64", native_df.iloc[:, 0].dtype)
+        self.assertEqual("float64", native_df.iloc[:, 1].dtype)
+        self.assertListEqual(["a", "b"], native_df.iloc[:, 2].tolist())
+        self.assertListEqual(["True", "False"], native_df.iloc[:, 3].tolist())
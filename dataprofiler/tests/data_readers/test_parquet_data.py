@@ -2,6 +2,10 @@ import os
 import unittest
 from io import BytesIO
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 from dataprofiler.data_readers.data import Data
 from dataprofiler.data_readers.parquet_data import ParquetData
 
@@ -187,6 +191,93 @@ class TestParquetDataClass(unittest.TestCase):
             data = ParquetData(input_file["path"])
             self.assertIsNone(data.file_encoding)
 
+    def test_get_chunk_generator(self):
+        """
+        Determine if the parquet file can be streamed one row group at a time
+        """
+        df = pd.DataFrame({"a": range(10), "b": [" x ", "y"] * 5, "c": [1.5] * 10})
+        buffer = BytesIO()
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer, 4)
+
+        buffer.seek(0)
+        expected_data = ParquetData(buffer, options={"selected_columns": ["a", "b"]})
+        buffer.seek(0)
+        data = ParquetData(
+            buffer,
+            options={"selected_columns": ["a", "b"], "chunk_by_row_group": True},
+        )
+        self.assertTrue(data.chunk_by_row_group)
+
+        chunks = list(data.get_chunk_generator())
+        self.assertIsNone(data._data)
+        self.assertEqual([4, 4, 2], [len(chunk) for chunk in chunks])
+        for chunk in chunks:
+            self.assertListEqual(["a", "b"], list(chunk.columns))
+        self.assertListEqual(list(range(10)), pd.concat(chunks).index.tolist())
+        pd.testing.assert_frame_equal(
+            expected_data.data.reset_index(drop=True),
+            pd.concat(chunks).reset_index(drop=True),
+        )
+
+        # in memory data is yielded as a single chunk
+        data = ParquetData(data=df, options={"chunk_by_row_group": True})
+        chunks = list(data.get_chunk_generator())
+        self.assertEqual(1, len(chunks))
+        self.assertIs(df, chunks[0])
+
+    def test_chunk_by_row_group_option(self):
+        """
+        Determine if the chunk_by_row_group option must be a bool
+        """
+        df = pd.DataFrame({"a": range(4)})
+        for value in [True, False]:
+            data = ParquetData(data=df, options={"chunk_by_row_group": value})
+            self.assertEqual(value, data.chunk_by_row_group)
+        for value in [1, "True", None]:
+            with self.assertRaisesRegex(
+                ValueError, "'chunk_by_row_group' must be a bool"
+            ):
+                ParquetData(data=df, options={"chunk_by_row_group": value})
+
+    def test_native_numeric_dtypes(self):
+        """
+        Determine if the int and float columns of a parquet file are kept native
+        """
+        df = pd.DataFrame({"a": range(4), "b": ["x", "y"] * 2, "c": [1.5] * 4})
+        buffer = BytesIO()
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer, 2)
+
+        # by default, the columns are read as strings
+        buffer.seek(0)
+        data = ParquetData(buffer)
+        self.assertListEqual(["0", "1", "2", "3"], data.data["a"].tolist())
+        self.assertListEqual(["1.5"] * 4, data.data["c"].tolist())
+
+        for chunk_by_row_group in [False, True]:
+            buffer.seek(0)
+            data = ParquetData(
+                buffer,
+                options={
+                    "chunk_by_row_group": chunk_by_row_group,
+                    "keep_native_numeric": True,
+                },
+            )
+            for chunk in data.get_chunk_generator():
+                self.assertEqual("int64", chunk["a"].dtype)
+                self.assertEqual("float64", chunk["c"].dtype)
+                self.assertListEqual(["x", "y"], chunk["b"].tolist())
+
+        # the records are still made of strings
+        buffer.seek(0)
+        data = ParquetData(
+            buffer, options={"data_format": "records", "keep_native_numeric": True}
+        )
+        first_record = data.data[0].splitlines()[0]
+        self.assertEqual('{"a":"0","b":"x","c":"1.5"}', first_record)
+
+        with self.assertRaisesRegex(ValueError, "'keep_native_numeric' must be a bool"):
+            ParquetData(data=df, options={"keep_native_numeric": "True"})
+
     def test_is_structured(self):
         # Default construction
         data = ParquetData()
@@ -1,4 +1,7 @@
-from dataprofiler.profilers.profiler_options import CategoricalOptions
+from dataprofiler.profilers.profiler_options import (
+    CategoricalOptions,
+    HeavyHitterOptions,
+)
 from dataprofiler.tests.profilers.profiler_options.test_base_inspector_options import (
     TestBaseInspectorOptions,
 )
@@ -16,6 +19,7 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
                 "top_k_categories": None,
                 "max_sample_size_to_check_stop_condition": None,
                 "stop_condition_unique_value_ratio": None,
+                "heavy_hitters": HeavyHitterOptions(),
             },
             option.properties,
         )
@@ -26,6 +30,7 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
                 "top_k_categories": None,
                 "max_sample_size_to_check_stop_condition": None,
                 "stop_condition_unique_value_ratio": None,
+                "heavy_hitters": HeavyHitterOptions(),
             },
             option.properties,
         )
@@ -36,6 +41,7 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
                 "top_k_categories": 2,
                 "max_sample_size_to_check_stop_condition": None,
                 "stop_condition_unique_value_ratio": None,
+                "heavy_hitters": HeavyHitterOptions(),
             },
             option.properties,
         )
@@ -46,6 +52,7 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
                 "top_k_categories": None,
                 "max_sample_size_to_check_stop_condition": 20,
                 "stop_condition_unique_value_ratio": None,
+                "heavy_hitters": HeavyHitterOptions(),
             },
             option.properties,
         )
@@ -56,6 +63,7 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
                 "top_k_categories": None,
                 "max_sample_size_to_check_stop_condition": None,
                 "stop_condition_unique_value_ratio": 2,
+                "heavy_hitters": HeavyHitterOptions(),
             },
             option.properties,
         )
@@ -69,6 +77,7 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
                 "top_k_categories": None,
                 "max_sample_size_to_check_stop_condition": 20,
                 "stop_condition_unique_value_ratio": 2,
+                "heavy_hitters": HeavyHitterOptions(),
             },
             option.properties,
         )
@@ -85,13 +94,18 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
             dict(prop="top_k_categories", value_list=[None, 3]),
             dict(prop="max_sample_size_to_check_stop_condition", value_list=[None, 20]),
             dict(prop="stop_condition_unique_value_ratio", value_list=[None, 0.7]),
+            dict(prop="heavy_hitters.is_enabled", value_list=[True, False]),
+            dict(prop="heavy_hitters.capacity", value_list=[100, 1000]),
         ]
 
         # this code can be abstracted to limit code everywhere else
         # AKA, params_to_check would be the only needed code plus raise errors
         def _assert_set_helper(prop, value):
             option.set({prop: value})
-            self.assertEqual(value, getattr(option, prop), msg=prop)
+            option_value = option
+            for attr in prop.split("."):
+                option_value = getattr(option_value, attr)
+            self.assertEqual(value, option_value, msg=prop)
 
         for params in params_to_check:
             prop, value_list = params["prop"], params["value_list"]
@@ -229,6 +243,19 @@ class TestCategoricalOptions(TestBaseInspectorOptions):
         )
         self.assertEqual([], options._validate_helper())
 
+        # Errors of the heavy hitter options are nested
+        options = self.get_options()
+        options.heavy_hitters.capacity = 0
+        self.assertEqual(
+            [f"{optpth}.heavy_hitters.capacity must be a positive integer."],
+            options._validate_helper(),
+        )
+        options.heavy_hitters = None
+        self.assertEqual(
+            [f"{optpth}.heavy_hitters must be a HeavyHitterOptions."],
+            options._validate_helper(),
+        )
+
     def test_validate(self):
         super().test_validate()
 
@@ -0,0 +1,72 @@
+from dataprofiler.profilers.profiler_options import (
+    DistinctCountOptions,
+    HyperLogLogOptions,
+)
+from dataprofiler.tests.profilers.profiler_options.test_base_option import (
+    TestBaseOption,
+)
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBooleanOption,
+)
+
+
+class TestDistinctCountOptions(TestBooleanOption):
+
+    option_class = DistinctCountOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual(
+            {"is_enabled": False, "hll": HyperLogLogOptions(register_count=12)},
+            option.properties,
+        )
+        option = self.get_options(is_enabled=True)
+        self.assertTrue(option.properties["is_enabled"])
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"hll.register_count": 10, "hll.seed": 3})
+        self.assertEqual(10, option.hll.register_count)
+        self.assertEqual(3, option.hll.seed)
+
+    def test_validate_helper(self):
+        super().test_validate_helper()
+
+        optpth = self.get_options_path()
+
+        # Errors of the HyperLogLog options are nested
+        option = self.get_options()
+        option.hll.register_count = 0
+        expected_error = [f"{optpth}.hll.register_count must be greater than 0."]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        option.hll = None
+        expected_error = [f"{optpth}.hll must be a HyperLogLogOptions."]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+    def test_validate(self):
+        super().test_validate()
+
+        option = self.get_options()
+        option.hll.seed = "0"
+        expected_error = "DistinctCountOptions.hll.seed must be an integer."
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        TestBaseOption.test_eq(self)
+
+        options = self.get_options()
+        options2 = self.get_options()
+        options.is_enabled = True
+        self.assertNotEqual(options, options2)
+        options2.is_enabled = True
+        self.assertEqual(options, options2)
+        options.hll.register_count = 10
+        self.assertNotEqual(options, options2)
+        options2.hll.register_count = 10
+        self.assertEqual(options, options2)
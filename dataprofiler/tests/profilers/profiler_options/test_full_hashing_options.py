@@ -0,0 +1,88 @@
+from dataprofiler.profilers.profiler_options import FullHashingOptions
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBaseOption,
+)
+
+
+class TestFullHashingOptions(TestBaseOption):
+
+    option_class = FullHashingOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual(
+            {"spill_threshold": None, "spill_dirpath": None}, option.properties
+        )
+        option = self.get_options(spill_threshold=1024, spill_dirpath="tmp")
+        self.assertDictEqual(
+            {"spill_threshold": 1024, "spill_dirpath": "tmp"}, option.properties
+        )
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"spill_threshold": 2048, "spill_dirpath": "tmp"})
+        self.assertDictEqual(
+            {"spill_threshold": 2048, "spill_dirpath": "tmp"}, option.properties
+        )
+
+    def test_validate_helper(self):
+        optpth = self.get_options_path()
+
+        # Default configuration
+        option = self.get_options()
+        self.assertEqual([], option._validate_helper())
+
+        # Valid configurations
+        option = self.get_options(spill_threshold=1, spill_dirpath="tmp")
+        self.assertEqual([], option._validate_helper())
+
+        expected_error = [
+            f"{optpth}.spill_threshold must be either None or a positive integer."
+        ]
+
+        # Option spill_threshold cannot be a float
+        option = self.get_options(spill_threshold=1.5)
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        # Option spill_threshold cannot be 0
+        option = self.get_options(spill_threshold=0)
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        # Option spill_threshold cannot be a bool
+        option = self.get_options(spill_threshold=True)
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        # Testing multiple errors
+        expected_error += [f"{optpth}.spill_dirpath must be either None or a string."]
+        option = self.get_options(spill_threshold=-1, spill_dirpath=1)
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+    def test_validate(self):
+        option = self.get_options(spill_threshold=-1)
+        expected_error = (
+            "FullHashingOptions.spill_threshold must be either None or a "
+            "positive integer."
+        )
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+        option = self.get_options(spill_dirpath=5)
+        expected_error = "FullHashingOptions.spill_dirpath must be either None or a"
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        options = self.get_options()
+        options2 = self.get_options()
+        options.spill_threshold = 1024
+        self.assertNotEqual(options, options2)
+        options2.spill_threshold = 1024
+        self.assertEqual(options, options2)
+        options.spill_dirpath = "tmp"
+        self.assertNotEqual(options, options2)
+        options2.spill_dirpath = "tmp"
+        self.assertEqual(options, options2)
@@ -0,0 +1,90 @@
+from dataprofiler.profilers.profiler_options import HeavyHitterOptions
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBooleanOption,
+)
+
+
+class TestHeavyHitterOptions(TestBooleanOption):
+
+    option_class = HeavyHitterOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual(
+            {
+                "is_enabled": False,
+                "capacity": 1000,
+                "width": 2048,
+                "depth": 4,
+                "seed": 0,
+            },
+            option.properties,
+        )
+        option = self.get_options(is_enabled=True, capacity=10, width=64, depth=2)
+        self.assertDictEqual(
+            {"is_enabled": True, "capacity": 10, "width": 64, "depth": 2, "seed": 0},
+            option.properties,
+        )
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"capacity": 50, "width": 128, "depth": 3, "seed": 7})
+        self.assertDictEqual(
+            {"is_enabled": False, "capacity": 50, "width": 128, "depth": 3, "seed": 7},
+            option.properties,
+        )
+
+    def test_validate_helper(self):
+        super().test_validate_helper()
+        optpth = self.get_options_path()
+
+        # Valid configurations
+        option = self.get_options(is_enabled=True, capacity=1, width=1, depth=1)
+        self.assertEqual([], option._validate_helper())
+
+        # Sizes must be positive integers
+        for option_name in ["capacity", "width", "depth"]:
+            expected_error = [f"{optpth}.{option_name} must be a positive integer."]
+            for value in [0, -1, 1.5, True, "1"]:
+                option = self.get_options(**{option_name: value})
+                self.assertEqual(expected_error, option._validate_helper())
+
+        # Seed must be an integer
+        option = self.get_options(seed="0")
+        self.assertEqual(
+            [f"{optpth}.seed must be an integer."], option._validate_helper()
+        )
+
+        # Testing multiple errors
+        option = self.get_options(capacity=0, seed=None)
+        self.assertSetEqual(
+            {
+                f"{optpth}.capacity must be a positive integer.",
+                f"{optpth}.seed must be an integer.",
+            },
+            set(option._validate_helper()),
+        )
+
+    def test_validate(self):
+        super().test_validate()
+        option = self.get_options(width=0)
+        expected_error = "HeavyHitterOptions.width must be a positive integer."
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        options = self.get_options()
+        options2 = self.get_options()
+        self.assertEqual(options, options2)
+        options.is_enabled = True
+        self.assertNotEqual(options, options2)
+        options2.is_enabled = True
+        self.assertEqual(options, options2)
+        options.capacity = 10
+        self.assertNotEqual(options, options2)
+        options2.capacity = 10
+        self.assertEqual(options, options2)
@@ -1,4 +1,8 @@
-from dataprofiler.profilers.profiler_options import HistogramOption
+from dataprofiler.profilers.profiler_options import (
+    HistogramOption,
+    HistogramSelectionOptions,
+    QuantileSketchOptions,
+)
 
 from .test_boolean_option import TestBooleanOption
 
@@ -12,6 +16,8 @@ class TestHistogramOption(TestBooleanOption):
         option = self.get_options()
         self.assertTrue(option.is_enabled)
         self.assertEqual(option.bin_count_or_method, "auto")
+        self.assertEqual(QuantileSketchOptions(), option.quantile_sketch)
+        self.assertEqual(HistogramSelectionOptions(), option.selection)
 
     def test_set_helper(self):
         option = self.get_options()
@@ -68,9 +74,48 @@ class TestHistogramOption(TestBooleanOption):
         with self.assertRaisesRegex(AttributeError, expected_error):
             option.set({"bin_count_or_method.is_enabled": True})
 
+        # Set the nested quantile sketch options
+        option.set({"quantile_sketch.is_enabled": True})
+        option.set({"quantile_sketch.compactor_size": 50})
+        self.assertTrue(option.quantile_sketch.is_enabled)
+        self.assertEqual(50, option.quantile_sketch.compactor_size)
+
+        # Set the nested selection options
+        option.set({"selection.is_enabled": True, "selection.freeze_after": 3})
+        self.assertTrue(option.selection.is_enabled)
+        self.assertEqual(3, option.selection.freeze_after)
+
     def test_validate_helper(self):
         super().test_validate_helper()
 
+        optpth = self.get_options_path()
+
+        # Errors of the quantile sketch options are nested
+        option = self.get_options()
+        option.quantile_sketch.compactor_size = 1
+        expected_error = [
+            f"{optpth}.quantile_sketch.compactor_size must be an integer greater "
+            "than 1."
+        ]
+        self.assertEqual(expected_error, option._validate_helper())
+
+        option.quantile_sketch = None
+        expected_error = [f"{optpth}.quantile_sketch must be a QuantileSketchOptions."]
+        self.assertEqual(expected_error, option._validate_helper())
+
+        # Errors of the selection options are nested
+        option = self.get_options()
+        option.selection.freeze_after = 0
+        expected_error = [
+            f"{optpth}.selection.freeze_after must be either None or a positive "
+            "integer."
+        ]
+        self.assertEqual(expected_error, option._validate_helper())
+
+        option.selection = None
+        expected_error = [f"{optpth}.selection must be a HistogramSelectionOptions."]
+        self.assertEqual(expected_error, option._validate_helper())
+
     def test_validate(self):
 
         super().test_validate()
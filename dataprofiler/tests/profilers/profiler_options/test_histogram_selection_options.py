@@ -0,0 +1,70 @@
+from dataprofiler.profilers.profiler_options import HistogramSelectionOptions
+from dataprofiler.tests.profilers.profiler_options.test_base_option import (
+    TestBaseOption,
+)
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBooleanOption,
+)
+
+
+class TestHistogramSelectionOptions(TestBooleanOption):
+
+    option_class = HistogramSelectionOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual(
+            {"is_enabled": False, "freeze_after": None}, option.properties
+        )
+        option = self.get_options(is_enabled=True, freeze_after=5)
+        self.assertDictEqual({"is_enabled": True, "freeze_after": 5}, option.properties)
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"freeze_after": 10})
+        self.assertEqual(10, option.freeze_after)
+
+    def test_validate_helper(self):
+        super().test_validate_helper()
+        optpth = self.get_options_path()
+
+        # Valid configurations
+        for value in [None, 1, 20]:
+            option = self.get_options(is_enabled=True, freeze_after=value)
+            self.assertEqual([], option._validate_helper())
+
+        # Freeze after must be None or a positive integer
+        expected_error = [
+            f"{optpth}.freeze_after must be either None or a positive integer."
+        ]
+        for value in [0, -1, 1.5, True, "3"]:
+            option = self.get_options(freeze_after=value)
+            self.assertEqual(expected_error, option._validate_helper())
+
+    def test_validate(self):
+        super().test_validate()
+        option = self.get_options(freeze_after=0)
+        expected_error = (
+            "HistogramSelectionOptions.freeze_after must be either None or a "
+            "positive integer."
+        )
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        TestBaseOption.test_eq(self)
+
+        options = self.get_options()
+        options2 = self.get_options()
+        options.is_enabled = True
+        self.assertNotEqual(options, options2)
+        options2.is_enabled = True
+        self.assertEqual(options, options2)
+        options.freeze_after = 3
+        self.assertNotEqual(options, options2)
+        options2.freeze_after = 3
+        self.assertEqual(options, options2)
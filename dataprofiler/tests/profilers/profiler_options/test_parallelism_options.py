@@ -0,0 +1,94 @@
+from dataprofiler.profilers.profiler_options import ParallelismOptions
+from dataprofiler.tests.profilers.profiler_options.test_base_option import (
+    TestBaseOption,
+)
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBooleanOption,
+)
+
+
+class TestParallelismOptions(TestBooleanOption):
+
+    option_class = ParallelismOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual(
+            {
+                "is_enabled": False,
+                "null_cleaning": "process",
+                "stats": "process",
+                "labeling": "serial",
+            },
+            option.properties,
+        )
+        option = self.get_options(
+            is_enabled=True, null_cleaning="serial", stats="thread", labeling="thread"
+        )
+        self.assertDictEqual(
+            {
+                "is_enabled": True,
+                "null_cleaning": "serial",
+                "stats": "thread",
+                "labeling": "thread",
+            },
+            option.properties,
+        )
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"null_cleaning": "thread", "stats": "serial"})
+        self.assertEqual("thread", option.null_cleaning)
+        self.assertEqual("serial", option.stats)
+        self.assertEqual("serial", option.labeling)
+
+    def test_validate_helper(self):
+        super().test_validate_helper()
+
+        optpth = self.get_options_path()
+
+        # Valid configurations
+        for backend in ["serial", "thread", "process"]:
+            option = self.get_options(null_cleaning=backend, stats=backend)
+            self.assertEqual([], option._validate_helper())
+        option = self.get_options(labeling="thread")
+        self.assertEqual([], option._validate_helper())
+
+        # Backends must be known
+        option = self.get_options(null_cleaning="fork", stats=None)
+        expected_error = [
+            f"{optpth}.null_cleaning must be one of 'serial', 'thread' or 'process'.",
+            f"{optpth}.stats must be one of 'serial', 'thread' or 'process'.",
+        ]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        # The data labeler cannot be sent to other processes
+        option = self.get_options(labeling="process")
+        expected_error = [f"{optpth}.labeling must be 'serial' or 'thread'."]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+    def test_validate(self):
+        super().test_validate()
+
+        option = self.get_options(labeling="process")
+        expected_error = "ParallelismOptions.labeling must be 'serial' or 'thread'."
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        TestBaseOption.test_eq(self)
+
+        options = self.get_options()
+        options2 = self.get_options()
+        options.is_enabled = True
+        self.assertNotEqual(options, options2)
+        options2.is_enabled = True
+        self.assertEqual(options, options2)
+        options.stats = "thread"
+        self.assertNotEqual(options, options2)
+        options2.stats = "thread"
+        self.assertEqual(options, options2)
@@ -26,7 +26,14 @@ class TestProfilerOptions(unittest.TestCase):
         self.assertTrue(profile.options.data_labeler.is_enabled)
         for column in profile.options.properties:
             # TODO: remove the check for correlation option once it's updated to True
-            if column == "correlation" or column == "null_replication_metrics":
+            if column in [
+                "correlation",
+                "null_replication_metrics",
+                "type_probing",
+                "parallelism",
+                "reservoir_sampling",
+                "distinct_count",
+            ]:
                 self.assertFalse(profile.options.properties[column].is_enabled)
             elif column == "null_values" or column == "column_null_values":
                 self.assertIsNone(profile.options.properties[column])
@@ -269,6 +276,25 @@ class TestProfilerOptions(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, expected_error):
             options.validate()
 
+    def test_validate_row_statistics(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"row_statistics.unique_count.full.spill_threshold": -5})
+        expected_error = (
+            "ProfilerOptions.structured_options.row_statistics.unique_count.full."
+            "spill_threshold must be either None or a positive integer."
+        )
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+        options = ProfilerOptions()
+        options.set({"row_statistics.unique_count.hashing_method": "invalid"})
+        expected_error = (
+            "ProfilerOptions.structured_options.row_statistics.unique_count."
+            "hashing_method must be 'full' or 'hll'."
+        )
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
     def test_validate_numeric_stats(self, *mocks):
         options = ProfilerOptions()
         numerical_options = {
@@ -0,0 +1,79 @@
+from dataprofiler.profilers.profiler_options import QuantileSketchOptions
+from dataprofiler.tests.profilers.profiler_options.test_base_option import (
+    TestBaseOption,
+)
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBooleanOption,
+)
+
+
+class TestQuantileSketchOptions(TestBooleanOption):
+
+    option_class = QuantileSketchOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual(
+            {"is_enabled": False, "compactor_size": 200, "seed": 0},
+            option.properties,
+        )
+        option = self.get_options(is_enabled=True, compactor_size=50, seed=3)
+        self.assertDictEqual(
+            {"is_enabled": True, "compactor_size": 50, "seed": 3},
+            option.properties,
+        )
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"compactor_size": 100, "seed": 7})
+        self.assertDictEqual(
+            {"is_enabled": False, "compactor_size": 100, "seed": 7},
+            option.properties,
+        )
+
+    def test_validate_helper(self):
+        super().test_validate_helper()
+        optpth = self.get_options_path()
+
+        # Valid configurations
+        option = self.get_options(is_enabled=True, compactor_size=2)
+        self.assertEqual([], option._validate_helper())
+
+        # Compactor size must be an integer greater than 1
+        expected_error = [f"{optpth}.compactor_size must be an integer greater than 1."]
+        for value in [1, 0, -1, 1.5, True, "200"]:
+            option = self.get_options(compactor_size=value)
+            self.assertEqual(expected_error, option._validate_helper())
+
+        # Seed must be an integer
+        option = self.get_options(seed="0")
+        self.assertEqual(
+            [f"{optpth}.seed must be an integer."], option._validate_helper()
+        )
+
+    def test_validate(self):
+        super().test_validate()
+        option = self.get_options(compactor_size=0)
+        expected_error = (
+            "QuantileSketchOptions.compactor_size must be an integer greater than 1."
+        )
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        TestBaseOption.test_eq(self)
+
+        options = self.get_options()
+        options2 = self.get_options()
+        options.is_enabled = True
+        self.assertNotEqual(options, options2)
+        options2.is_enabled = True
+        self.assertEqual(options, options2)
+        options.compactor_size = 100
+        self.assertNotEqual(options, options2)
+        options2.compactor_size = 100
+        self.assertEqual(options, options2)
@@ -0,0 +1,68 @@
+from dataprofiler.profilers.profiler_options import ReservoirSamplingOptions
+from dataprofiler.tests.profilers.profiler_options.test_base_option import (
+    TestBaseOption,
+)
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBooleanOption,
+)
+
+
+class TestReservoirSamplingOptions(TestBooleanOption):
+
+    option_class = ReservoirSamplingOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual({"is_enabled": False, "size": 5000}, option.properties)
+        option = self.get_options(is_enabled=True, size=100)
+        self.assertDictEqual({"is_enabled": True, "size": 100}, option.properties)
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"size": 100})
+        self.assertDictEqual({"is_enabled": False, "size": 100}, option.properties)
+
+    def test_validate_helper(self):
+        super().test_validate_helper()
+
+        optpth = self.get_options_path()
+
+        # Valid configurations
+        option = self.get_options(size=1)
+        self.assertEqual([], option._validate_helper())
+
+        # Option size must be an integer
+        option = self.get_options(size=1.5)
+        expected_error = [f"{optpth}.size must be an integer."]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        # Option size must be positive
+        option = self.get_options(size=0)
+        expected_error = [f"{optpth}.size must be greater than 0."]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+    def test_validate(self):
+        super().test_validate()
+
+        option = self.get_options(size=-1)
+        expected_error = "ReservoirSamplingOptions.size must be greater than 0."
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        TestBaseOption.test_eq(self)
+
+        options = self.get_options()
+        options2 = self.get_options()
+        options.is_enabled = True
+        self.assertNotEqual(options, options2)
+        options2.is_enabled = True
+        self.assertEqual(options, options2)
+        options.size = 100
+        self.assertNotEqual(options, options2)
+        options2.size = 100
+        self.assertEqual(options, options2)
@@ -22,6 +22,10 @@ class TestStructuredOptions(TestBaseOption):
         "correlation",
         "chi2_homogeneity",
         "row_statistics",
+        "type_probing",
+        "parallelism",
+        "reservoir_sampling",
+        "distinct_count",
     ]
     keys = boolean_keys + other_keys
 
@@ -143,6 +147,10 @@ class TestStructuredOptions(TestBaseOption):
         option.correlation = StructuredOptions()
         option.chi2_homogeneity = StructuredOptions()
         option.row_statistics = StructuredOptions()
+        option.type_probing = StructuredOptions()
+        option.parallelism = StructuredOptions()
+        option.reservoir_sampling = StructuredOptions()
+        option.distinct_count = StructuredOptions()
 
         expected_error = set()
         for key in self.boolean_keys:
@@ -155,6 +163,12 @@ class TestStructuredOptions(TestBaseOption):
                 ckey = "DateTime"
             elif key == "row_statistics":
                 ckey = "RowStatistics"
+            elif key == "type_probing":
+                ckey = "TypeProbing"
+            elif key == "reservoir_sampling":
+                ckey = "ReservoirSampling"
+            elif key == "distinct_count":
+                ckey = "DistinctCount"
             if key == "multiprocess" or key == "chi2_homogeneity":
                 expected_error.add(f"{optpth}.{key} must be a(n) BooleanOption.")
             else:
@@ -210,6 +224,10 @@ class TestStructuredOptions(TestBaseOption):
         option.correlation = StructuredOptions()
         option.chi2_homogeneity = StructuredOptions()
         option.row_statistics = StructuredOptions()
+        option.type_probing = StructuredOptions()
+        option.parallelism = StructuredOptions()
+        option.reservoir_sampling = StructuredOptions()
+        option.distinct_count = StructuredOptions()
 
         expected_error = set()
         for key in self.boolean_keys:
@@ -222,6 +240,12 @@ class TestStructuredOptions(TestBaseOption):
                 ckey = "DateTime"
             elif key == "row_statistics":
                 ckey = "RowStatistics"
+            elif key == "type_probing":
+                ckey = "TypeProbing"
+            elif key == "reservoir_sampling":
+                ckey = "ReservoirSampling"
+            elif key == "distinct_count":
+                ckey = "DistinctCount"
             if key == "multiprocess" or key == "chi2_homogeneity":
                 expected_error.add(f"{optpth}.{key} must be a(n) BooleanOption.")
             else:
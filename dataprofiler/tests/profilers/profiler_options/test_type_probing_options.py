@@ -0,0 +1,91 @@
+from dataprofiler.profilers.profiler_options import TypeProbingOptions
+from dataprofiler.tests.profilers.profiler_options.test_base_option import (
+    TestBaseOption,
+)
+from dataprofiler.tests.profilers.profiler_options.test_boolean_option import (
+    TestBooleanOption,
+)
+
+
+class TestTypeProbingOptions(TestBooleanOption):
+
+    option_class = TypeProbingOptions
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertDictEqual(
+            {"is_enabled": False, "probe_size": 50, "sample_size": 1000},
+            option.properties,
+        )
+        option = self.get_options(is_enabled=True, probe_size=10, sample_size=20)
+        self.assertDictEqual(
+            {"is_enabled": True, "probe_size": 10, "sample_size": 20},
+            option.properties,
+        )
+
+    def test_set_helper(self):
+        super().test_set_helper()
+
+    def test_set(self):
+        super().test_set()
+        option = self.get_options()
+        option.set({"probe_size": 10, "sample_size": 20})
+        self.assertDictEqual(
+            {"is_enabled": False, "probe_size": 10, "sample_size": 20},
+            option.properties,
+        )
+
+    def test_validate_helper(self):
+        super().test_validate_helper()
+
+        optpth = self.get_options_path()
+
+        # Valid configurations
+        option = self.get_options(probe_size=10, sample_size=10)
+        self.assertEqual([], option._validate_helper())
+
+        # Options must be integers
+        option = self.get_options(probe_size="Hello", sample_size=1.5)
+        expected_error = [
+            f"{optpth}.probe_size must be an integer.",
+            f"{optpth}.sample_size must be an integer.",
+        ]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        # Option probe_size must be positive
+        option = self.get_options(probe_size=0)
+        expected_error = [f"{optpth}.probe_size must be greater than 0."]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+        # Option sample_size must contain the probe
+        option = self.get_options(probe_size=10, sample_size=5)
+        expected_error = [
+            f"{optpth}.sample_size must be greater than or equal to the probe_size."
+        ]
+        self.assertSetEqual(set(expected_error), set(option._validate_helper()))
+
+    def test_validate(self):
+        super().test_validate()
+
+        # Option sample_size must contain the probe
+        option = self.get_options(probe_size=10, sample_size=5)
+        expected_error = (
+            "TypeProbingOptions.sample_size must be greater than or equal to "
+            "the probe_size."
+        )
+        with self.assertRaisesRegex(ValueError, expected_error):
+            option.validate()
+
+    def test_eq(self):
+        TestBaseOption.test_eq(self)
+
+        options = self.get_options()
+        options2 = self.get_options()
+        options.is_enabled = True
+        self.assertNotEqual(options, options2)
+        options2.is_enabled = True
+        self.assertEqual(options, options2)
+        options.probe_size = 10
+        self.assertNotEqual(options, options2)
+        options2.probe_size = 10
+        self.assertEqual(options, options2)
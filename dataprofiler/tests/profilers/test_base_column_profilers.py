@@ -11,6 +11,7 @@ from dataprofiler.profilers import utils
 from dataprofiler.profilers.base_column_profilers import (
     BaseColumnPrimitiveTypeProfiler,
     BaseColumnProfiler,
+    ColumnView,
 )
 from dataprofiler.profilers.json_encoder import ProfileEncoder
 from dataprofiler.tests.profilers import utils as test_utils
@@ -249,6 +250,60 @@ def get_object_path(obj):
     return ".".join(["data_profiler.profilers.profile_builder", obj.__name__])
 
 
+class TestColumnView(unittest.TestCase):
+    def test_str_column(self):
+        data = pd.Series(["1", "2.5", "a", "a"], name="col")
+        column_view = ColumnView.from_series(data)
+        self.assertIs(column_view, ColumnView.from_series(column_view))
+        self.assertEqual("col", column_view.name)
+        self.assertEqual(4, len(column_view))
+        self.assertIsNone(column_view.native_series)
+        self.assertIs(data, column_view.series)
+        self.assertIs(data, column_view.str_series)
+
+        np.testing.assert_array_equal(
+            [1, 2.5, np.nan, np.nan], column_view.float_values
+        )
+        is_int, is_float, is_text = column_view.numeric_type_masks
+        np.testing.assert_array_equal([True, False, False, False], is_int)
+        np.testing.assert_array_equal([True, True, False, False], is_float)
+        np.testing.assert_array_equal([False, False, True, True], is_text)
+        self.assertListEqual([1, 3, 1, 1], column_view.str_lengths.tolist())
+        self.assertDictEqual(
+            {"a": 2, "1": 1, "2.5": 1}, column_view.value_counts.to_dict()
+        )
+
+    def test_native_column(self):
+        data = pd.Series([1.0, 2.5, 2.0], name="col")
+        column_view = ColumnView(data)
+        self.assertIs(data, column_view.series)
+        self.assertIs(data, column_view.native_series)
+        self.assertListEqual(["1.0", "2.5", "2.0"], column_view.str_series.tolist())
+        self.assertEqual(object, column_view.str_series.dtype)
+        np.testing.assert_array_equal([1.0, 2.5, 2.0], column_view.float_values)
+        np.testing.assert_array_equal(
+            [True, False, True], column_view.numeric_type_masks[0]
+        )
+
+        # only ints and float64s are kept natively
+        self.assertIsNone(ColumnView(data.astype(np.float32)).native_series)
+        self.assertIsNone(ColumnView(data.astype(bool)).native_series)
+        self.assertIsNotNone(ColumnView(data.astype(np.uint8)).native_series)
+
+    def test_conversions_are_cached(self):
+        column_view = ColumnView(pd.Series([1, 2, 3]))
+        with patch(
+            "dataprofiler.profilers.utils.parse_floats", wraps=utils.parse_floats
+        ) as mock_parse_floats:
+            column_view.float_values
+            column_view.numeric_type_masks
+            column_view.float_values
+        mock_parse_floats.assert_called_once()
+        self.assertIs(column_view.str_series, column_view.str_series)
+        self.assertIs(column_view.str_lengths, column_view.str_lengths)
+        self.assertIs(column_view.value_counts, column_view.value_counts)
+
+
 class AbstractTestColumnProfiler:
 
     column_profiler = None
@@ -821,6 +821,80 @@ class TestCategoricalColumn(unittest.TestCase):
         self.assertEqual(0.20, profile.stop_condition_unique_value_ratio)
         self.assertEqual(100, profile.max_sample_size_to_check_stop_condition)
 
+    def test_heavy_hitters(self):
+        options = CategoricalOptions(top_k_categories=3)
+        options.heavy_hitters.is_enabled = True
+        options.heavy_hitters.capacity = 5
+
+        # exact while there are no more categories than the capacity
+        data = pd.Series(["a"] * 6 + ["b"] * 4 + ["c"] * 2 + ["d"])
+        profile = CategoricalColumn("test", options=options)
+        profile.update(data)
+        self.assertEqual({"a": 6, "b": 4, "c": 2, "d": 1}, profile.categorical_counts)
+        self.assertEqual(4, profile.unique_count)
+        self.assertTrue(profile.is_match)
+        report = profile.report()
+        self.assertEqual(
+            {"a": 6, "b": 4, "c": 2}, report["statistics"]["categorical_count"]
+        )
+        self.assertEqual(
+            {"a": 0, "b": 0, "c": 0}, report["statistics"]["categorical_count_error"]
+        )
+
+        # past the capacity, only the most frequent categories are kept
+        data2 = pd.Series(["a"] * 300 + ["b"] * 20 + list(map(str, range(30))))
+        profile.update(data2)
+        true_counts = pd.concat([data, data2]).value_counts()
+        self.assertEqual(5, len(profile.categories))
+        self.assertEqual(363, profile.sample_size)
+        self.assertEqual(34, profile.unique_count)
+        self.assertTrue(profile.is_match)
+        report = profile.report()
+        counts = report["statistics"]["categorical_count"]
+        self.assertEqual(["a", "b"], list(counts)[:2])
+        self.assertEqual(3, len(counts))
+        for category, count in counts.items():
+            error = report["statistics"]["categorical_count_error"][category]
+            self.assertLessEqual(count - error, true_counts[category])
+            self.assertLessEqual(true_counts[category], count)
+
+        # the unique count is estimated for ID-like columns
+        profile.update(pd.Series(list(map(str, range(1000, 3000)))))
+        self.assertAlmostEqual(2034, profile.unique_count, delta=2034 * 0.05)
+        self.assertFalse(profile.is_match)
+
+    def test_heavy_hitters_merge(self):
+        options = CategoricalOptions()
+        options.heavy_hitters.is_enabled = True
+        options.heavy_hitters.capacity = 3
+
+        profile1 = CategoricalColumn("test", options=options)
+        profile1.update(pd.Series(["a", "a", "b", "c"]))
+        profile2 = CategoricalColumn("test", options=options)
+        profile2.update(pd.Series(["a", "d", "d"]))
+        merged_profile = profile1 + profile2
+        self.assertEqual(7, merged_profile.sample_size)
+        self.assertEqual(4, merged_profile.unique_count)
+        self.assertEqual(3, merged_profile.categorical_counts["a"])
+        self.assertEqual(2, merged_profile.categorical_counts["d"])
+        self.assertEqual(3, len(merged_profile.categories))
+
+        # the exact counts of a profile without a sketch are added to the sketch
+        profile3 = CategoricalColumn("test")
+        profile3.update(pd.Series(["b", "b", "b", "b"]))
+        for merged_profile in [profile1 + profile3, profile3 + profile1]:
+            self.assertIsNotNone(merged_profile._heavy_hitters)
+            self.assertEqual(
+                {"b": 5, "a": 2, "c": 1}, merged_profile.categorical_counts
+            )
+        self.assertIsNone(profile3._heavy_hitters)
+
+        diff = profile1.diff(profile2)
+        self.assertEqual(
+            {"a": 1, "b": [1, None], "c": [1, None], "d": [None, 2]},
+            diff["statistics"]["categorical_count"],
+        )
+
     def test_json_encode(self):
         profile = CategoricalColumn("0")
 
@@ -843,6 +917,7 @@ class TestCategoricalColumn(unittest.TestCase):
                     "_stop_condition_is_met": False,
                     "_stopped_at_unique_ratio": None,
                     "_stopped_at_unique_count": None,
+                    "_heavy_hitters": None,
                 },
             }
         )
@@ -890,6 +965,7 @@ class TestCategoricalColumn(unittest.TestCase):
                     "_stop_condition_is_met": False,
                     "_stopped_at_unique_ratio": None,
                     "_stopped_at_unique_count": None,
+                    "_heavy_hitters": None,
                 },
             }
         )
@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import dataprofiler as dp
+from dataprofiler.profilers import utils
+from dataprofiler.profilers.chi2_homogeneity import Chi2HomogeneityMatrix
+
+
+class TestChi2HomogeneityMatrix(unittest.TestCase):
+    def test_update(self):
+        rng = np.random.default_rng(0)
+        columns = []
+        for _ in range(6):
+            categories = rng.choice(
+                list("abcdefg"), size=rng.integers(1, 6), replace=False
+            )
+            counts = {category: int(rng.integers(1, 20)) for category in categories}
+            columns.append((counts, sum(counts.values())))
+        columns[2] = None
+        columns[4] = ({"x": 3}, 3)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            chi2_mat = Chi2HomogeneityMatrix(6).update(columns)
+
+            for i in range(6):
+                for j in range(6):
+                    if columns[i] is None or columns[j] is None:
+                        self.assertTrue(np.isnan(chi2_mat[i, j]))
+                    elif i == j:
+                        self.assertEqual(1, chi2_mat[i, j])
+                    else:
+                        results = utils.perform_chi_squared_test_for_homogeneity(
+                            *columns[i], *columns[j]
+                        )
+                        expected = results["p-value"]
+                        if expected is None:
+                            self.assertTrue(np.isnan(chi2_mat[i, j]))
+                        else:
+                            self.assertAlmostEqual(expected, chi2_mat[i, j])
+
+    def test_insufficient_categories(self):
+        chi2_homogeneity = Chi2HomogeneityMatrix(2)
+        with self.assertWarnsRegex(RuntimeWarning, "Insufficient number of categories"):
+            chi2_mat = chi2_homogeneity.update([({"y": 2}, 2), ({"y": 3}, 3)])
+        np.testing.assert_array_equal([[1, np.nan], [np.nan, 1]], chi2_mat)
+
+        # a zero sample size gives a null p-value
+        chi2_mat = Chi2HomogeneityMatrix(2).update([({"y": 2, "n": 1}, 3), ({}, 0)])
+        self.assertEqual(0, chi2_mat[0, 1])
+
+    def test_changed_columns(self):
+        chi2_homogeneity = Chi2HomogeneityMatrix(3)
+        columns = [
+            ({"y": 4, "n": 3}, 7),
+            ({"y": 3, "maybe": 2, "n": 2}, 7),
+            ({"n": 4, "maybe": 1, "y": 2}, 7),
+        ]
+        chi2_mat = chi2_homogeneity.update(columns)
+
+        # only the pairs of the changed column are tested again
+        columns[2] = ({"n": 5, "maybe": 1, "y": 2}, 8)
+        with mock.patch.object(
+            chi2_homogeneity,
+            "_get_p_values",
+            wraps=chi2_homogeneity._get_p_values,
+        ) as get_p_values:
+            new_chi2_mat = chi2_homogeneity.update(columns)
+        self.assertEqual(2, get_p_values.call_args[0][0])
+        self.assertEqual(chi2_mat[0, 1], new_chi2_mat[0, 1])
+        expected = utils.perform_chi_squared_test_for_homogeneity(
+            *columns[0], *columns[2]
+        )["p-value"]
+        self.assertAlmostEqual(expected, new_chi2_mat[0, 2])
+        self.assertEqual(new_chi2_mat[0, 2], new_chi2_mat[2, 0])
+
+        # columns which are no longer categorical are invalid
+        columns[1] = None
+        new_chi2_mat = chi2_homogeneity.update(columns)
+        self.assertTrue(np.isnan(new_chi2_mat[1]).all())
+        self.assertTrue(np.isnan(new_chi2_mat[:, 1]).all())
+
+    def test_sparse_counts(self):
+        # each column only holds the counts of its own categories
+        columns = [
+            ({f"{prefix}{i}": i + 1 for i in range(100)}, 5050) for prefix in "abc"
+        ]
+        columns.append(({"a0": 3, "b0": 1, "c0": 2}, 6))
+        chi2_homogeneity = Chi2HomogeneityMatrix(4)
+        chi2_mat = chi2_homogeneity.update(columns)
+        self.assertListEqual(
+            [100, 100, 100, 3],
+            [len(counts) for counts in chi2_homogeneity._column_counts],
+        )
+        for i, j in [(0, 1), (0, 3), (2, 3)]:
+            expected = utils.perform_chi_squared_test_for_homogeneity(
+                *columns[i], *columns[j]
+            )["p-value"]
+            self.assertAlmostEqual(expected, chi2_mat[i, j])
+
+    def test_after_load(self):
+        data = pd.DataFrame(
+            {"a": ["y", "n", "y", "y"], "b": ["n", "n", "y", "n"], "c": [1, 2, 3, 4]}
+        )
+        new_data = pd.DataFrame(
+            {"a": ["n", "n", "n", "y"], "b": ["y", "y", "y", "n"], "c": [5, 6, 7, 8]}
+        )
+        options = dp.ProfilerOptions()
+        options.set({"data_labeler.is_enabled": False})
+        profiler = dp.StructuredProfiler(data, options=options)
+        self.assertIsNotNone(profiler.chi2_matrix)
+
+        # the counts of the categories are rebuilt from the loaded profiles
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "profile.pkl")
+            profiler.save(filepath)
+            loaded = dp.StructuredProfiler.load(filepath)
+        self.assertIsNone(loaded._chi2_homogeneity)
+        np.testing.assert_array_equal(profiler.chi2_matrix, loaded.chi2_matrix)
+
+        profiler.update_profile(new_data)
+        loaded.update_profile(new_data)
+        np.testing.assert_array_almost_equal(profiler.chi2_matrix, loaded.chi2_matrix)
+        self.assertIsNotNone(loaded._chi2_homogeneity)
+        self.assertFalse(np.isnan(loaded.chi2_matrix[0, 1]))
+
+    def test_deferred_in_profiler(self):
+        data = pd.DataFrame({"a": ["y", "n", "y"], "b": ["n", "n", "y"]})
+        options = dp.ProfilerOptions()
+        options.set({"data_labeler.is_enabled": False})
+        with mock.patch(
+            "dataprofiler.profilers.profile_builder.StructuredProfiler._update_chi2",
+            return_value=np.ones((2, 2)),
+        ) as update_chi2:
+            profiler = dp.StructuredProfiler(data, options=options)
+            profiler.update_profile(data)
+            update_chi2.assert_not_called()
+
+            np.testing.assert_array_equal(np.ones((2, 2)), profiler.chi2_matrix)
+            profiler.report()
+            update_chi2.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from dataprofiler.profilers.co_moments import CoMoments
+
+
+class TestCoMoments(unittest.TestCase):
+    def test_update(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(1000, 3))
+        values[:, 1] += values[:, 0]
+        values[:, 2] -= 2 * values[:, 0]
+
+        moments = CoMoments(3)
+        for start in range(0, 1000, 300):
+            moments.update(values[start : start + 300], [0, 1, 2])
+        self.assertEqual(1000, moments.count)
+        np.testing.assert_allclose(values.mean(axis=0), moments.mean)
+        np.testing.assert_allclose(
+            np.cov(values, rowvar=False) * 999, moments.co_moments
+        )
+        np.testing.assert_allclose(
+            np.corrcoef(values, rowvar=False), moments.correlation()
+        )
+
+        # empty batches are ignored
+        moments.update(np.empty((0, 3)), [0, 1, 2])
+        self.assertEqual(1000, moments.count)
+
+    def test_missing_values(self):
+        values = np.array([[1.0, 2.0], [np.nan, 4.0], [3.0, 1.0], [5.0, np.nan]])
+        moments = CoMoments(2)
+        moments.update(values, [0, 1])
+
+        # missing values are imputed with the mean of the column in the batch
+        imputed = np.array([[1.0, 2.0], [3.0, 4.0], [3.0, 1.0], [5.0, 7 / 3]])
+        np.testing.assert_allclose(
+            np.corrcoef(imputed, rowvar=False), moments.correlation()
+        )
+
+    def test_invalid_columns(self):
+        moments = CoMoments(3)
+        moments.update(np.array([[1.0, 2.0], [2.0, 1.0], [3.0, 5.0]]), [0, 2])
+        corr_mat = moments.correlation()
+        self.assertTrue(np.isnan(corr_mat[1]).all())
+        self.assertTrue(np.isnan(corr_mat[:, 1]).all())
+        self.assertAlmostEqual(1.0, corr_mat[0, 0])
+        self.assertAlmostEqual(np.corrcoef([1, 2, 3], [2, 1, 5])[0, 1], corr_mat[0, 2])
+
+        # a column without values in a batch is invalid from then on
+        moments.update(np.array([[1.0, np.nan], [2.0, np.nan]]), [0, 2])
+        self.assertTrue(np.isnan(moments.correlation()[2]).all())
+
+        # as is a column without variance
+        moments = CoMoments(2)
+        moments.update(np.array([[1.0, 2.0], [1.0, 3.0]]), [0, 1])
+        self.assertTrue(np.isnan(moments.correlation()[0]).all())
+        self.assertAlmostEqual(1.0, moments.correlation()[1, 1])
+
+    def test_merge(self):
+        rng = np.random.default_rng(1)
+        values = rng.normal(loc=5, size=(500, 4))
+        moments1 = CoMoments(4)
+        moments1.update(values[:200], [0, 1, 2, 3])
+        moments2 = CoMoments(4)
+        moments2.update(values[200:], [0, 1, 2, 3])
+
+        merged = moments1 + moments2
+        self.assertEqual(200, moments1.count)
+        np.testing.assert_allclose(
+            np.corrcoef(values, rowvar=False), merged.correlation()
+        )
+        np.testing.assert_allclose(
+            merged.correlation(), (merged + CoMoments(4)).correlation()
+        )
+        np.testing.assert_allclose(
+            merged.correlation(), (CoMoments(4) + merged).correlation()
+        )
+
+        loaded = pickle.loads(pickle.dumps(merged))
+        np.testing.assert_array_equal(merged.co_moments, loaded.co_moments)
+
+    def test_reorder(self):
+        rng = np.random.default_rng(2)
+        values = rng.normal(size=(50, 3))
+        moments = CoMoments(3)
+        moments.update(values, [0, 1, 2])
+
+        reordered = moments.reorder([2, 0, 1])
+        np.testing.assert_allclose(values.mean(axis=0)[[2, 0, 1]], reordered.mean)
+        np.testing.assert_allclose(
+            np.corrcoef(values[:, [2, 0, 1]], rowvar=False), reordered.correlation()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
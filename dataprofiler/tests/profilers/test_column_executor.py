@@ -0,0 +1,348 @@
+import copy
+import multiprocessing as mp
+import pickle
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import dataprofiler as dp
+from dataprofiler.profilers import utils
+from dataprofiler.profilers.base_column_profilers import ColumnView
+from dataprofiler.profilers.column_executor import (
+    ColumnExecutor,
+    SharedArray,
+    SharedSeries,
+)
+from dataprofiler.profilers.data_labeler_column_profile import DataLabelerColumn
+from dataprofiler.profilers.profile_builder import StructuredColProfiler
+
+
+def _describe(df_series):
+    return type(df_series).__name__, len(df_series)
+
+
+class TestSharedData(unittest.TestCase):
+    def test_shared_array(self):
+        array = np.arange(12, dtype=np.int64).reshape(1, 12)
+        handle = SharedArray(array)
+        try:
+            loaded = pickle.loads(pickle.dumps(handle)).load()
+            np.testing.assert_array_equal(array, loaded)
+            self.assertEqual(array.dtype, loaded.dtype)
+        finally:
+            handle.unlink()
+
+    def test_shared_array_view(self):
+        array = np.linspace(0, 1, 5)
+        handle = SharedArray(array)
+        try:
+            # workers map the block read-only without tracking it
+            with mock.patch("multiprocessing.resource_tracker.register") as register:
+                loaded = pickle.loads(pickle.dumps(handle)).load()
+            register.assert_not_called()
+            self.assertFalse(loaded.flags.owndata)
+            self.assertFalse(loaded.flags.writeable)
+        finally:
+            handle.unlink()
+
+        # the block stays mapped by the loaded array once unlinked
+        np.testing.assert_array_equal(array, loaded)
+        np.testing.assert_array_equal(array[1:], pd.Series(loaded[1:]).to_numpy())
+
+    def test_shared_series(self):
+        strings = pd.Series(
+            ["a", "bb", "", "dé"] * 5, index=np.arange(20)[::-1] * 3, name="str"
+        )
+        floats = pd.Series(np.linspace(0, 1, 20), name=1)
+        dates = pd.Series(pd.date_range("2020-01-01", periods=5), name="date")
+        for df_series in [strings, floats, dates]:
+            handle = SharedSeries(df_series)
+            try:
+                loaded = pickle.loads(pickle.dumps(handle)).load()
+                pd.testing.assert_series_equal(df_series, loaded)
+            finally:
+                handle.unlink()
+
+        # views are rebuilt from their natively typed values
+        handle = SharedSeries(ColumnView(floats))
+        try:
+            loaded = handle.load()
+            self.assertIsInstance(loaded, ColumnView)
+            pd.testing.assert_series_equal(floats, loaded.native_series)
+        finally:
+            handle.unlink()
+
+    def test_shared_series_not_shareable(self):
+        # null values can not be restored as is, nor objects other than str
+        for df_series in [
+            pd.Series(["a", np.nan]),
+            pd.Series(["a", None]),
+            pd.Series(["a", 1], dtype=object),
+            pd.Series([[1], [2]]),
+        ]:
+            with self.assertRaises(ValueError):
+                SharedSeries(df_series)
+
+
+class TestColumnExecutor(unittest.TestCase):
+    @mock.patch("dataprofiler.profilers.utils.generate_pool")
+    def test_start_once(self, mock_generate_pool):
+        pool = mock.Mock()
+        mock_generate_pool.return_value = (pool, 3)
+        executor = ColumnExecutor()
+        self.assertFalse(executor.is_active)
+
+        self.assertTrue(executor.start(data_size=100, cols=4))
+        self.assertTrue(executor.start(data_size=100, cols=4))
+        mock_generate_pool.assert_called_once_with(
+            max_pool_size=None, data_size=100, cols=4
+        )
+        self.assertEqual(3, executor.pool_size)
+
+        executor.close()
+        self.assertFalse(executor.is_active)
+        pool.terminate.assert_called_once()
+
+    @mock.patch("dataprofiler.profilers.utils.generate_pool")
+    def test_start_without_pool(self, mock_generate_pool):
+        mock_generate_pool.return_value = (None, 1)
+        executor = ColumnExecutor()
+        self.assertFalse(executor.start(data_size=100, cols=4))
+        with self.assertRaisesRegex(RuntimeError, "must be started"):
+            executor.apply_async(len, ([1],))
+
+    def test_pickle_drops_pool(self):
+        executor = ColumnExecutor()
+        executor._pool = mock.Mock()
+        for copied in [pickle.loads(pickle.dumps(executor)), copy.deepcopy(executor)]:
+            self.assertFalse(copied.is_active)
+            self.assertIsNone(copied._finalizer)
+
+    def test_apply_async_shares_large_columns(self):
+        executor = ColumnExecutor()
+        executor._pool = mock.Mock()
+        executor._min_shared_nbytes = 80
+
+        large = pd.Series(np.arange(10, dtype=np.int64), name="large")
+        small = pd.Series(np.arange(9, dtype=np.int64), name="small")
+        mixed = pd.Series(["a", 1] * 10, name="mixed")
+        for df_series in [large, large, small, mixed]:
+            executor.apply_async(_describe, (df_series, "other"))
+
+        submitted = [
+            call.args[1][1] for call in executor._pool.apply_async.call_args_list
+        ]
+        self.assertIsInstance(submitted[0][0], SharedSeries)
+        # the same column is only shared once per batch
+        self.assertIs(submitted[0][0], submitted[1][0])
+        self.assertIs(small, submitted[2][0])
+        self.assertIs(mixed, submitted[3][0])
+        self.assertEqual("other", submitted[0][1])
+
+        handle = submitted[0][0]
+        executor.release()
+        self.assertEqual({}, executor._shared)
+        with self.assertRaises(FileNotFoundError):
+            handle.load()
+
+    def test_thread_backend(self):
+        with self.assertRaisesRegex(ValueError, "must be either"):
+            ColumnExecutor("fork")
+
+        executor = ColumnExecutor("thread", max_pool_size=2)
+        with mock.patch("psutil.cpu_count", return_value=1):
+            self.assertFalse(executor.start(cols=4))
+        with mock.patch("psutil.cpu_count", return_value=8):
+            self.assertTrue(executor.start(cols=4))
+        self.assertEqual(2, executor.pool_size)
+        try:
+            # threads receive the very same objects, never shared
+            df_series = pd.Series(np.arange(10**5))
+            result = executor.apply_async(lambda x: x, (df_series,))
+            self.assertIs(df_series, result.get())
+            self.assertEqual({}, executor._shared)
+        finally:
+            executor.close()
+
+        copied = pickle.loads(pickle.dumps(executor))
+        self.assertEqual("thread", copied.backend)
+        self.assertEqual(2, copied.max_pool_size)
+
+    def test_apply_async(self):
+        executor = ColumnExecutor()
+        executor._min_shared_nbytes = 1
+        with mock.patch.object(utils, "generate_pool", return_value=(mp.Pool(2), 2)):
+            self.assertTrue(executor.start())
+        try:
+            df_series = pd.Series(["a", "b", "c"], name="col")
+            results = [
+                executor.apply_async(_describe, (df_series,)),
+                executor.apply_async(_describe, (ColumnView(df_series),)),
+            ]
+            self.assertEqual(
+                [("Series", 3), ("ColumnView", 3)], [r.get() for r in results]
+            )
+        finally:
+            executor.close()
+
+
+class TestStructuredProfilerExecutor(unittest.TestCase):
+    @mock.patch("dataprofiler.profilers.utils.generate_pool")
+    def test_pool_reused_across_updates(self, mock_generate_pool):
+        mock_generate_pool.side_effect = lambda *args, **kwargs: (mp.Pool(2), 3)
+        data = pd.DataFrame(
+            {"int": np.arange(200), "str": ["a", "bb"] * 100},
+        )
+        options = dp.ProfilerOptions()
+        options.set({"data_labeler.is_enabled": False})
+
+        profiler = dp.StructuredProfiler(data, options=options)
+        executor = profiler._column_executors["process"]
+        try:
+            profiler.update_profile(data)
+            mock_generate_pool.assert_called_once()
+            self.assertTrue(executor.is_active)
+            self.assertEqual({}, executor._shared)
+            self.assertEqual(400, profiler.total_samples)
+            int_profile = profiler.report()["data_stats"][0]
+            self.assertEqual("int", int_profile["data_type"])
+            self.assertEqual(199, int_profile["statistics"]["max"])
+        finally:
+            executor.close()
+
+        # the merged profile starts its own pool when needed
+        merged = profiler + profiler
+        self.assertEqual({}, merged._column_executors)
+
+    @mock.patch("dataprofiler.profilers.utils.generate_pool")
+    def test_release_on_failed_task(self, mock_generate_pool):
+        mock_generate_pool.side_effect = lambda *args, **kwargs: (mp.Pool(2), 3)
+        data = pd.DataFrame({"int": np.arange(200), "float": np.arange(200) / 2})
+        options = dp.ProfilerOptions()
+        options.set({"data_labeler.is_enabled": False})
+        update_column_profilers = StructuredColProfiler.update_column_profilers
+
+        # the second column fails once the first one is shared with the workers
+        def fail_second_column(self, clean_sampled_df, pool, profile_types):
+            if self.name == "float":
+                raise ValueError("failed task")
+            update_column_profilers(self, clean_sampled_df, pool, profile_types)
+
+        profiler = dp.StructuredProfiler(data, options=options)
+        executor = profiler._column_executors["process"]
+        try:
+            with mock.patch.object(
+                ColumnExecutor, "_min_shared_nbytes", 1
+            ), mock.patch.object(
+                StructuredColProfiler, "update_column_profilers", fail_second_column
+            ), mock.patch.object(
+                ColumnExecutor,
+                "release",
+                autospec=True,
+                side_effect=ColumnExecutor.release,
+            ) as release:
+                with self.assertRaisesRegex(ValueError, "failed task"):
+                    profiler.update_profile(data)
+            self.assertEqual(2, release.call_count)
+            self.assertEqual({}, executor._shared)
+        finally:
+            executor.close()
+
+    @mock.patch("psutil.cpu_count", return_value=4)
+    def test_parallelism_backends(self, *mocks):
+        data = pd.DataFrame(
+            {
+                "int": np.arange(100),
+                "str": ["a", "bb"] * 50,
+                "date": ["2021-01-01", "2021-01-02"] * 50,
+            }
+        )
+
+        def profile(parallelism):
+            options = dp.ProfilerOptions()
+            options.set(
+                {
+                    f"structured_options.parallelism.{key}": value
+                    for key, value in parallelism.items()
+                }
+            )
+            np.random.seed(0)
+            profiler = dp.StructuredProfiler(data, options=options)
+            np.random.seed(1)
+            profiler.update_profile(data)
+            pool_sizes = {}
+            for key, executor in profiler._column_executors.items():
+                pool_sizes[key] = (executor.backend, executor.pool_size)
+                executor.close()
+            return profiler.report(), pool_sizes
+
+        serial_report, pool_sizes = profile(
+            {"is_enabled": True, "null_cleaning": "serial", "stats": "serial"}
+        )
+        self.assertEqual({}, pool_sizes)
+
+        with mock.patch("dataprofiler.profilers.utils.generate_pool") as mock_pool:
+            thread_report, pool_sizes = profile(
+                {
+                    "is_enabled": True,
+                    "null_cleaning": "thread",
+                    "stats": "thread",
+                    "labeling": "thread",
+                }
+            )
+        mock_pool.assert_not_called()
+        self.assertDictEqual(
+            {"thread": ("thread", 3), "labeling": ("thread", 1)}, pool_sizes
+        )
+
+        for serial_stats, thread_stats in zip(
+            serial_report["data_stats"], thread_report["data_stats"]
+        ):
+            self.assertEqual(serial_stats["data_type"], thread_stats["data_type"])
+            self.assertEqual(serial_stats["data_label"], thread_stats["data_label"])
+            self.assertEqual(
+                serial_stats["statistics"]["unique_count"],
+                thread_stats["statistics"]["unique_count"],
+            )
+
+    @mock.patch("psutil.cpu_count", return_value=4)
+    def test_thread_stats_serial_labeling(self, *mocks):
+        data = pd.DataFrame({"int": np.arange(100), "str": ["a", "bb"] * 50})
+        options = dp.ProfilerOptions()
+        options.set(
+            {
+                "structured_options.parallelism.is_enabled": True,
+                "structured_options.parallelism.null_cleaning": "serial",
+                "structured_options.parallelism.stats": "thread",
+                "structured_options.parallelism.labeling": "serial",
+            }
+        )
+
+        # the labeler is not thread safe, hence only labels in this thread
+        labeling_threads = []
+
+        def record_thread(df_series):
+            labeling_threads.append(threading.current_thread())
+
+        with mock.patch(
+            "dataprofiler.profilers.profile_builder.DataLabeler"
+        ), mock.patch(
+            "dataprofiler.profilers.data_labeler_column_profile.DataLabeler"
+        ), mock.patch.object(
+            DataLabelerColumn, "update", side_effect=record_thread
+        ):
+            profiler = dp.StructuredProfiler(data, options=options)
+        try:
+            self.assertEqual(["thread"], list(profiler._column_executors))
+            self.assertEqual([threading.main_thread()] * 2, labeling_threads)
+            for column in profiler.profile:
+                self.assertIn("data_label_profile", column.profiles)
+        finally:
+            profiler._column_executors["thread"].close()
+
+
+if __name__ == "__main__":
+    unittest.main()
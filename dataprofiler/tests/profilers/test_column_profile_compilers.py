@@ -5,6 +5,8 @@ import numpy as np
 import pandas as pd
 
 from dataprofiler.profilers import column_profile_compilers as col_pro_compilers
+from dataprofiler.profilers import utils
+from dataprofiler.profilers.base_column_profilers import ColumnView
 from dataprofiler.profilers.profiler_options import (
     BaseOption,
     StructuredOptions,
@@ -106,6 +108,91 @@ class TestBaseProfileCompilerClass(unittest.TestCase):
         report = compiler2.report(remove_disabled_flag=False)
         self.assertIn("vocab", report["statistics"])
 
+    def test_primitive_compiler_shares_column_view(self):
+        data = pd.Series(["1", "2.5", "a", "1e3"])
+        column_view = ColumnView(data)
+        with mock.patch(
+            "dataprofiler.profilers.utils.get_numeric_type_masks",
+            wraps=utils.get_numeric_type_masks,
+        ) as mock_get_masks:
+            compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(column_view)
+        mock_get_masks.assert_called_once()
+        self.assertEqual(2, compiler._profiles["int"].match_count)
+        self.assertEqual(3, compiler._profiles["float"].match_count)
+        self.assertEqual(4, compiler._profiles["text"].match_count)
+
+    def test_primitive_compiler_type_probing(self):
+        options = StructuredOptions()
+        options.set(
+            {
+                "type_probing.is_enabled": True,
+                "type_probing.probe_size": 10,
+                "type_probing.sample_size": 100,
+            }
+        )
+
+        # text column, only the text profile is updated with the whole batch
+        data = pd.Series(["text", "1", "2.5"] * 400)
+        compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(data, options)
+        self.assertEqual(100, compiler._profiles["datetime"].sample_size)
+        self.assertEqual(100, compiler._profiles["int"].sample_size)
+        self.assertEqual(100, compiler._profiles["float"].sample_size)
+        self.assertEqual(1200, compiler._profiles["text"].sample_size)
+        self.assertEqual("text", compiler.selected_data_type)
+
+        # probing is kept when updating and merging
+        compiler.update_profile(data)
+        self.assertEqual(200, compiler._profiles["int"].sample_size)
+        merged_compiler = compiler + compiler
+        self.assertEqual(options.type_probing, merged_compiler._type_probing)
+        merged_compiler.update_profile(data)
+        self.assertEqual(500, merged_compiler._profiles["int"].sample_size)
+
+        # the probing of either compiler is kept
+        no_probing_compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(data)
+        self.assertIsNone(no_probing_compiler._type_probing)
+        merged_compiler = no_probing_compiler + compiler
+        self.assertEqual(options.type_probing, merged_compiler._type_probing)
+
+        # int column, the int and float profiles match the probe
+        data = pd.Series(np.arange(1200))
+        compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(data, options)
+        self.assertEqual(100, compiler._profiles["datetime"].sample_size)
+        self.assertEqual(1200, compiler._profiles["int"].sample_size)
+        self.assertEqual(1200, compiler._profiles["float"].sample_size)
+        self.assertEqual("int", compiler.selected_data_type)
+
+        # batches not larger than the sample are profiled entirely
+        data = pd.Series(["text"] * 100)
+        compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(data, options)
+        self.assertEqual(100, compiler._profiles["int"].sample_size)
+        self.assertEqual(0.0, compiler._profiles["int"].data_type_ratio)
+
+    @mock.patch("dataprofiler.settings._seed", 0)
+    def test_primitive_compiler_type_probing_seed(self):
+        options = StructuredOptions()
+        options.set(
+            {
+                "type_probing.is_enabled": True,
+                "type_probing.probe_size": 10,
+                "type_probing.sample_size": 100,
+            }
+        )
+        data = pd.Series([str(i) if i % 3 else "text" for i in range(1200)])
+
+        # the sample is drawn from the seed of the profiler
+        int_profiles = []
+        for np_seed in range(2):
+            np.random.seed(np_seed)
+            compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+                data, options
+            )
+            int_profiles.append(compiler._profiles["int"])
+        self.assertEqual(100, int_profiles[0].sample_size)
+        self.assertEqual(int_profiles[0].match_count, int_profiles[1].match_count)
+        self.assertEqual(int_profiles[0].max, int_profiles[1].max)
+        self.assertEqual(int_profiles[0].sum, int_profiles[1].sum)
+
     def test_diff_primitive_compilers(self):
         # Test different data types
         data1 = pd.Series(["-2", "-1", "1", "2"])
@@ -390,6 +390,91 @@ class TestDateTimeColumnProfiler(unittest.TestCase):
         self.assertEqual("12thMar13", profiler.min)
         self.assertEqual(4, profiler.match_count)
 
+    def test_strict_date_format_matching(self):
+        # dates leniently parsed or out of bounds of pandas must be kept as
+        # matched by strptime
+        data = ["20130307", "2013-03-07 15", "0001-01-01", "9999-12-31", "2013-3-7"]
+        df = pd.Series(data)
+        profiler = DateTimeColumn(df.name)
+        profiler.update(df)
+        self.assertEqual(["%Y-%m-%d"], profiler.date_formats)
+        self.assertEqual(3, profiler.match_count)
+        self.assertEqual("0001-01-01", profiler.min)
+        self.assertEqual("9999-12-31", profiler.max)
+        self.assertEqual(datetime.datetime(1, 1, 1), profiler._dt_obj_min)
+        self.assertEqual(datetime.datetime(9999, 12, 31), profiler._dt_obj_max)
+
+    def test_date_formats_by_hit_rate(self):
+        profiler = DateTimeColumn("date")
+        self.assertEqual(
+            DateTimeColumn._date_formats, profiler._get_date_formats_by_hit_rate()
+        )
+
+        df = pd.Series(["3/8/2013", "3/9/2013", "March 9, 2013"])
+        profiler.update(df)
+        self.assertEqual(
+            ["%m/%d/%Y", "%b %d, %Y", "%B %d, %Y"],
+            profiler._get_date_formats_by_hit_rate()[:3],
+        )
+
+        # each date is attributed to the same format regardless of the order
+        df = pd.Series(["May 11, 2013", "Mar 12, 2013"])
+        profiler.update(df)
+        self.assertCountEqual(
+            ["%m/%d/%Y", "%b %d, %Y", "%B %d, %Y"], profiler.date_formats
+        )
+        self.assertEqual(
+            {"%m/%d/%Y": 4, "%B %d, %Y": 2, "%b %d, %Y": 4},
+            profiler._date_format_counts,
+        )
+
+        # counts are merged when adding profiles
+        merged_profile = profiler + profiler
+        self.assertEqual(
+            {"%m/%d/%Y": 8, "%B %d, %Y": 4, "%b %d, %Y": 8},
+            merged_profile._date_format_counts,
+        )
+
+    def test_text_column_skips_date_formats(self):
+        df = pd.Series(["text", "more text", "even more text"] * 100)
+        profiler = DateTimeColumn(df.name)
+        with mock.patch.object(
+            DateTimeColumn, "_parse_dates", wraps=DateTimeColumn._parse_dates
+        ) as mock_parse_dates:
+            profiler.update(df)
+        mock_parse_dates.assert_not_called()
+        self.assertEqual(0, profiler.match_count)
+        self.assertEqual(300, profiler.sample_size)
+
+    def test_without_strptime_regexes(self):
+        df = pd.Series(
+            [
+                "2013-03-10 15:43:30",
+                "03/10/14 15:43",
+                "Mar 11, 2013",
+                "May 1st, 2013",
+                "2013-02-30",
+                "1500-01-01",
+                "text",
+            ]
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            expected = DateTimeColumn(df.name)
+            expected.update(df)
+
+            # the dates are parsed one at a time with strptime instead
+            profiler = DateTimeColumn(df.name)
+            with mock.patch(
+                "dataprofiler.profilers.datetime_column_profile.TimeRE", None
+            ):
+                profiler.update(df)
+        self.assertCountEqual(expected.date_formats, profiler.date_formats)
+        self.assertEqual(expected._date_format_counts, profiler._date_format_counts)
+        self.assertEqual(expected.match_count, profiler.match_count)
+        self.assertEqual(expected.min, profiler.min)
+        self.assertEqual(expected.max, profiler.max)
+
     def test_diff(self):
         data1 = [None, "Mar 12, 2013", "2013-05-18", "2014-03-01"]
         df1 = pd.Series(data1).apply(str)
@@ -453,6 +538,7 @@ class TestDateTimeColumnProfiler(unittest.TestCase):
                     "max": None,
                     "_dt_obj_min": None,
                     "_dt_obj_max": None,
+                    "_date_format_counts": dict(),
                     "_DateTimeColumn__calculations": dict(),
                 },
             }
@@ -494,6 +580,12 @@ class TestDateTimeColumnProfiler(unittest.TestCase):
                     "max": "Mar 11, 2013",
                     "_dt_obj_min": "2013-03-10T15:43:00",
                     "_dt_obj_max": "2013-03-11T00:00:00",
+                    # matches of both the sampled check and the full update
+                    "_date_format_counts": {
+                        "%Y-%m-%d %H:%M:%S": 2,
+                        "%m/%d/%y %H:%M": 2,
+                        "%b %d, %Y": 2,
+                    },
                     "_DateTimeColumn__calculations": dict(),
                 },
             }
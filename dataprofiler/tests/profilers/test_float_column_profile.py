@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import unittest
 import warnings
 from collections import defaultdict
@@ -206,6 +207,50 @@ class TestFloatColumn(unittest.TestCase):
                 msg=f"Errored for: {sample[0]}",
             )
 
+    def test_count_significant_digits(self):
+        # the counts are the lengths left by the substitution of the
+        # insignificant characters
+        r = re.compile(r"^[+-.0\s]+|\.?0+(\s|$)|(?<=[e])(.*)|\D")
+        values = [
+            "10.01",
+            "100",
+            "100.0",
+            "-0.00123",
+            "1.0e5",
+            "1.5e-05",
+            "1E10",
+            "+1,000",
+            "nan",
+            "-inf",
+            "",
+            "000",
+            "  0012345600.  ",
+            "1\n2",
+            "1e0 5",
+            "1.5 ",
+            "٣.5",
+            "1" * 100,
+            "0" * 70 + "1",
+        ]
+        expected = [len(r.sub("", value)) for value in values]
+        for array in [np.array(values, dtype=object), np.array(values)]:
+            np.testing.assert_array_equal(
+                expected, FloatColumn._count_significant_digits(array)
+            )
+
+        # without any string counted from the matrix of character codes
+        for array in [np.array([], dtype=object), np.array(["1" * 100], dtype=object)]:
+            np.testing.assert_array_equal(
+                [len(value) for value in array],
+                FloatColumn._count_significant_digits(array),
+            )
+
+        # native values are counted from the strings numpy gives them
+        data = pd.Series([1500.0, 0.05, 1e16, 1.25e-7, -3.0, np.nan, 0.0, 1 / 3])
+        precision = FloatColumn._get_float_precision(data)
+        str_precision = FloatColumn._get_float_precision(data.apply(str))
+        self.assertDictEqual(str_precision, precision)
+
     def test_profiled_min(self):
         # test with multiple values
         data = np.linspace(-5, 5, 11)
@@ -1027,6 +1072,123 @@ class TestFloatColumn(unittest.TestCase):
         est_median_abs_dev = profile["median_abs_deviation"]
         self.assertAlmostEqual(0.0, est_median_abs_dev, places=2)
 
+    def test_quantile_sketch(self):
+        options = FloatOptions()
+        options.histogram_and_quantiles.quantile_sketch.is_enabled = True
+
+        # the quantiles are exact while the sketch holds all the values
+        data = np.array([1.5, 0.0, 4.0, 2.5, 10.0, 3.0, 7.0])
+        profiler = FloatColumn("test", options=options)
+        profiler.update(pd.Series(data).apply(str))
+        self.assertEqual(np.median(data), profiler.median)
+        self.assertEqual(
+            np.median(np.abs(data - np.median(data))), profiler.median_abs_deviation
+        )
+        np.testing.assert_allclose(
+            np.quantile(data, np.linspace(0, 1, 1001)[1:-1]), profiler.quantiles
+        )
+
+        # the sketches are merged
+        rng = np.random.default_rng(0)
+        data1 = rng.exponential(size=5000)
+        data2 = rng.exponential(scale=3, size=5000)
+        profiler1 = FloatColumn("test", options=options)
+        profiler1.update(pd.Series(data1).apply(str))
+        profiler2 = FloatColumn("test", options=options)
+        profiler2.update(pd.Series(data2).apply(str))
+        merged_profiler = profiler1 + profiler2
+        self.assertEqual(10000, merged_profiler._quantile_sketch.count)
+        self.assertEqual(5000, profiler1._quantile_sketch.count)
+
+        data = np.sort(np.concatenate([data1, data2]))
+        median_rank = np.searchsorted(data, merged_profiler.median) / len(data)
+        self.assertAlmostEqual(0.5, median_rank, delta=0.02)
+        self.assertEqual(
+            merged_profiler._quantile_sketch.quantiles([0.5, 0.75]),
+            merged_profiler._get_percentile([50, 75]),
+        )
+        self.assertEqual(
+            merged_profiler._quantile_sketch.median_abs_deviation(
+                merged_profiler.median
+            ),
+            merged_profiler.median_abs_deviation,
+        )
+
+        # the histogram is used unless both profiles keep a sketch
+        merged_profiler = profiler1 + FloatColumn("test")
+        self.assertIsNone(merged_profiler._quantile_sketch)
+        profiler = FloatColumn("test")
+        profiler.update(pd.Series(data1).apply(str))
+        self.assertIsNone(profiler._quantile_sketch)
+
+    def test_histogram_selection(self):
+        options = FloatOptions()
+        options.histogram_and_quantiles.bin_count_or_method = [
+            "auto",
+            "fd",
+            "doane",
+            "scott",
+            "rice",
+            "sturges",
+            "sqrt",
+        ]
+        options.histogram_and_quantiles.selection.is_enabled = True
+
+        rng = np.random.default_rng(0)
+        profiler = FloatColumn("test", options=options)
+        with mock.patch(
+            "dataprofiler.profilers.histogram_utils._get_bin_edges"
+        ) as get_bin_edges:
+            for _ in range(3):
+                profiler.update(pd.Series(rng.normal(size=2000)).apply(str))
+        get_bin_edges.assert_not_called()
+
+        # the losses of all the methods are accumulated at each batch
+        selected = profiler.histogram_selection
+        self.assertIsNotNone(selected)
+        self.assertEqual(3, profiler._histogram_expert_selection["lead_count"])
+        self.assertFalse(profiler._histogram_expert_selection["is_frozen"])
+        total_losses = {
+            method: profiler.histogram_methods[method]["total_loss"]
+            for method in profiler.histogram_bin_method_names
+        }
+        self.assertEqual(min(total_losses.values()), total_losses[selected])
+        histogram = profiler.profile["histogram"]
+        self.assertEqual(6000, sum(histogram["bin_counts"]))
+        self.assertEqual(
+            profiler.histogram_methods[selected]["suggested_bin_count"],
+            len(histogram["bin_counts"]),
+        )
+
+        # once frozen, only the selected method is evaluated
+        options.histogram_and_quantiles.selection.freeze_after = 2
+        profiler = FloatColumn("test", options=options)
+        for _ in range(2):
+            profiler.update(pd.Series(rng.normal(size=2000)).apply(str))
+        self.assertTrue(profiler._histogram_expert_selection["is_frozen"])
+        selected = profiler.histogram_selection
+        other_method = next(
+            method
+            for method in profiler.histogram_bin_method_names
+            if method != selected
+        )
+        other_loss = profiler.histogram_methods[other_method]["total_loss"]
+        profiler.update(pd.Series(rng.normal(size=2000)).apply(str))
+        self.assertEqual(selected, profiler.histogram_selection)
+        self.assertEqual(
+            other_loss, profiler.histogram_methods[other_method]["total_loss"]
+        )
+        self.assertEqual(6000, sum(profiler.profile["histogram"]["bin_counts"]))
+
+        # merged profiles select again unless one of them is not enabled
+        merged_profiler = profiler + profiler
+        self.assertDictEqual(
+            {"freeze_after": 2, "lead_count": 0, "is_frozen": False},
+            merged_profiler._histogram_expert_selection,
+        )
+        merged_profiler = profiler + FloatColumn("test")
+        self.assertIsNone(merged_profiler._histogram_expert_selection)
+
     def test_data_type_ratio(self):
         data = np.linspace(-5, 5, 4)
         df = pd.Series(data).apply(str)
@@ -1039,6 +1201,26 @@ class TestFloatColumn(unittest.TestCase):
         profiler.update(df)
         self.assertEqual(profiler.data_type_ratio, 0.8)
 
+    def test_native_numeric_data(self):
+        data = pd.Series([4.114, 3.16, np.nan, 12, 1.23e-3])
+        str_data = data.apply(str)
+
+        np.testing.assert_array_equal(
+            FloatColumn._is_each_row_float(str_data),
+            FloatColumn._is_each_row_float(data),
+        )
+
+        str_profiler = FloatColumn(str_data.name)
+        str_profiler.update(str_data)
+        profiler = FloatColumn(data.name)
+        profiler.update(data)
+        self.assertEqual(5, profiler.match_count)
+        self.assertEqual(str_profiler.match_count, profiler.match_count)
+        self.assertEqual(str_profiler.min, profiler.min)
+        self.assertEqual(str_profiler.max, profiler.max)
+        self.assertEqual(str_profiler.sum, profiler.sum)
+        self.assertDictEqual(str_profiler.precision, profiler.precision)
+
     def test_profile(self):
         data = [2.5, 12.5, "not a float", 5, "not a float"]
         df = pd.Series(data).apply(str)
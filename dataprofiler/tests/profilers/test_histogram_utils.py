@@ -469,3 +469,34 @@ class TestHistogramUtils(unittest.TestCase):
             profile = TestColumn()
             actual = histogram_utils._calculate_bins_from_profile(profile, "sqrt")
             self.assertEqual(1, actual)
+
+    def test_calculate_bins_from_histogram(self):
+        bin_methods = ["auto", "fd", "doane", "scott", "rice", "sturges", "sqrt"]
+
+        # the bins of a fine histogram give the bin counts of numpy
+        rng = np.random.default_rng(0)
+        for data in [rng.normal(size=10000), rng.exponential(size=5000)]:
+            bin_counts, bin_edges = np.histogram(data, bins=1000)
+            actual = histogram_utils._calculate_bins_from_histogram(
+                bin_counts, bin_edges, bin_methods
+            )
+            for bin_method in bin_methods:
+                _, expected = histogram_utils._get_bin_edges(
+                    data, bin_method, None, None
+                )
+                self.assertEqual(expected, actual[bin_method], msg=bin_method)
+
+        # an empty histogram or a zero width gives a single bin
+        actual = histogram_utils._calculate_bins_from_histogram(
+            np.zeros(3), np.array([0.0, 1.0, 2.0, 3.0]), ["sqrt"]
+        )
+        self.assertDictEqual({"sqrt": 1}, actual)
+        actual = histogram_utils._calculate_bins_from_histogram(
+            np.array([10, 0, 0]), np.array([0.0, 1.0, 2.0, 3.0]), ["scott", "doane"]
+        )
+        self.assertDictEqual({"scott": 1, "doane": 1}, actual)
+
+        with self.assertRaisesRegex(ValueError, "'bad' is not a valid estimator"):
+            histogram_utils._calculate_bins_from_histogram(
+                np.ones(3), np.array([0.0, 1.0, 2.0, 3.0]), ["bad"]
+            )
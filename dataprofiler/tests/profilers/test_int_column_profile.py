@@ -519,6 +519,30 @@ class TestIntColumn(unittest.TestCase):
         profiler.update(df)
         self.assertEqual(profiler.data_type_ratio, 11 / 13.0)
 
+    def test_native_numeric_data(self):
+        str_data = pd.Series(["1", "2.0", "2.5", "nan", "inf", "-3"])
+        float_data = pd.Series([1, 2.0, 2.5, np.nan, np.inf, -3])
+        int_data = pd.Series([1, 2, 3, -3], dtype=np.int32)
+
+        np.testing.assert_array_equal(
+            IntColumn._is_each_row_int(str_data),
+            IntColumn._is_each_row_int(float_data),
+        )
+        np.testing.assert_array_equal(
+            [True] * 4, IntColumn._is_each_row_int(int_data)
+        )
+
+        str_profiler = IntColumn(str_data.name)
+        str_profiler.update(str_data)
+        float_profiler = IntColumn(float_data.name)
+        float_profiler.update(float_data)
+        self.assertEqual(3, float_profiler.match_count)
+        self.assertEqual(str_profiler.match_count, float_profiler.match_count)
+        self.assertEqual(str_profiler.sample_size, float_profiler.sample_size)
+        self.assertEqual(str_profiler.min, float_profiler.min)
+        self.assertEqual(str_profiler.max, float_profiler.max)
+        self.assertEqual(str_profiler.sum, float_profiler.sum)
+
     def test_profile(self):
         data = [2.0, 12.5, "not a float", 6.0, "not a float"]
         df = pd.Series(data).apply(str)
@@ -1146,6 +1170,8 @@ class TestIntColumn(unittest.TestCase):
                     "_mode_is_enabled": True,
                     "num_zeros": 0,
                     "num_negatives": 0,
+                    "_quantile_sketch": None,
+                    "_histogram_expert_selection": None,
                     "histogram_methods": expected_historam_methods,
                     "_stored_histogram": {
                         "total_loss": 0,
@@ -1227,6 +1253,8 @@ class TestIntColumn(unittest.TestCase):
                     "_mode_is_enabled": True,
                     "num_zeros": 1,
                     "num_negatives": 0,
+                    "_quantile_sketch": None,
+                    "_histogram_expert_selection": None,
                     "histogram_methods": {
                         "custom": {
                             "total_loss": 0,
@@ -442,6 +442,40 @@ class TestNumericStatsMixin(unittest.TestCase):
 
         assert sum_error == np.inf
 
+    def test_assimilate_histogram(self):
+        num_profiler = TestColumn()
+
+        dest_bin_counts = np.zeros(3)
+        hist, hist_loss = num_profiler._assimilate_histogram(
+            from_hist_entity_count_per_bin=np.array([2, 2, 4, 1]),
+            from_hist_bin_edges=np.array([0.0, 2.0, 4.0, 6.0, 8.0]),
+            dest_hist_entity_count_per_bin=dest_bin_counts,
+            dest_hist_bin_edges=np.array([0.0, 3.0, 7.0, 9.0]),
+            dest_hist_num_bin=3,
+        )
+
+        # bins straddling two new bins are split by the percentage on each side
+        # bin_midpoints = [1.5, 5, 8]   from_midpoints = [1, 3, 5, 7]
+        np.testing.assert_array_equal([3, 5, 1], hist["bin_counts"])
+        self.assertEqual(
+            2 * (1.5 - 1) ** 2
+            + 1 * (1.5 - 3) ** 2
+            + 1 * (5 - 3) ** 2
+            + 4 * (5 - 5) ** 2
+            + 1 * (8 - 7) ** 2,
+            hist_loss,
+        )
+
+        # counts accumulate in the destination bins
+        hist, _ = num_profiler._assimilate_histogram(
+            from_hist_entity_count_per_bin=np.array([0, 4]),
+            from_hist_bin_edges=np.array([0.0, 5.0, 9.0]),
+            dest_hist_entity_count_per_bin=dest_bin_counts,
+            dest_hist_bin_edges=np.array([0.0, 3.0, 7.0, 9.0]),
+            dest_hist_num_bin=3,
+        )
+        np.testing.assert_array_equal([3, 7, 3], hist["bin_counts"])
+
     def test_get_best_histogram_profile(self):
         num_profiler = TestColumn()
 
@@ -1195,6 +1229,8 @@ class TestNumericStatsMixin(unittest.TestCase):
                     "_mode_is_enabled": True,
                     "num_zeros": 0,
                     "num_negatives": 0,
+                    "_quantile_sketch": None,
+                    "_histogram_expert_selection": None,
                     "histogram_methods": expected_historam_methods,
                     "_stored_histogram": {
                         "total_loss": 0,
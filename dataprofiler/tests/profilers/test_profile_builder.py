@@ -1,15 +1,18 @@
+import copy
 import json
 import logging
 import os
 import random
 import re
 import unittest
+import warnings
 from io import BytesIO, StringIO
 from unittest import mock
 
 import networkx as nx
 import numpy as np
 import pandas as pd
+from HLL import HyperLogLog
 
 import dataprofiler
 import dataprofiler as dp
@@ -253,7 +256,8 @@ class TestStructuredProfiler(unittest.TestCase):
     @mock.patch("dataprofiler.profilers.profile_builder." "ColumnDataLabelerCompiler")
     @mock.patch("dataprofiler.profilers.profile_builder.DataLabeler")
     @mock.patch(
-        "dataprofiler.profilers.profile_builder." "StructuredProfiler._get_correlation"
+        "dataprofiler.profilers.profile_builder."
+        "StructuredProfiler._update_correlation"
     )
     def test_stream_profilers(self, *mocks):
         mocks[0].return_value = None
@@ -293,6 +297,91 @@ class TestStructuredProfiler(unittest.TestCase):
         self.assertIsNone(profiler.correlation_matrix)
         self.assertDictEqual({"row_stats": 2}, profiler.times)
 
+    def test_stream_csv_data_in_chunks(self):
+        profiler_options = ProfilerOptions()
+        profiler_options.set(
+            {"data_labeler.is_enabled": False, "multiprocess.is_enabled": False}
+        )
+        data = dp.Data(self.input_file_path)
+        chunked_data = dp.Data(self.input_file_path, options={"chunk_size": 1000})
+
+        with test_utils.mock_timeit():
+            profiler = dp.StructuredProfiler(data, options=profiler_options)
+        with mock.patch(
+            "dataprofiler.data_readers.data_utils.read_csv_df",
+            side_effect=AssertionError("full file should not be loaded"),
+        ), mock.patch.object(
+            StructuredProfiler,
+            "_update_profile_from_chunk",
+            autospec=True,
+            side_effect=StructuredProfiler._update_profile_from_chunk,
+        ) as mock_update, test_utils.mock_timeit():
+            chunked_profiler = dp.StructuredProfiler(
+                chunked_data, options=profiler_options
+            )
+
+        # 2999 rows are profiled as three chunks without loading the file
+        self.assertEqual(3, mock_update.call_count)
+        self.assertEqual(
+            [1000, 1000, 999], [len(call[0][1]) for call in mock_update.call_args_list]
+        )
+        self.assertIsNone(chunked_data._data)
+
+        self.assertEqual(profiler.total_samples, chunked_profiler.total_samples)
+        self.assertEqual(
+            profiler.row_has_null_count, chunked_profiler.row_has_null_count
+        )
+        self.assertEqual(profiler.row_is_null_count, chunked_profiler.row_is_null_count)
+        self.assertEqual(
+            len(profiler.hashed_row_object), len(chunked_profiler.hashed_row_object)
+        )
+        self.assertEqual("utf-8", chunked_profiler.encoding)
+        self.assertEqual("csv", chunked_profiler.file_type)
+        for col_profile, chunked_col_profile in zip(
+            profiler.profile, chunked_profiler.profile
+        ):
+            self.assertEqual(col_profile.name, chunked_col_profile.name)
+            self.assertEqual(col_profile.null_count, chunked_col_profile.null_count)
+            self.assertEqual(
+                col_profile.null_types_index, chunked_col_profile.null_types_index
+            )
+
+    def test_stream_parquet_data_by_row_group(self):
+        profiler_options = ProfilerOptions()
+        profiler_options.set(
+            {"data_labeler.is_enabled": False, "multiprocess.is_enabled": False}
+        )
+        buffer = BytesIO()
+        self.aws_dataset.to_parquet(buffer, row_group_size=1000, index=False)
+
+        buffer.seek(0)
+        chunked_data = dp.Data(
+            buffer, data_type="parquet", options={"chunk_by_row_group": True}
+        )
+
+        with mock.patch.object(
+            StructuredProfiler,
+            "_update_profile_from_chunk",
+            autospec=True,
+            side_effect=StructuredProfiler._update_profile_from_chunk,
+        ) as mock_update, test_utils.mock_timeit():
+            chunked_profiler = dp.StructuredProfiler(
+                chunked_data, options=profiler_options
+            )
+
+        self.assertEqual(
+            [1000, 1000, 999], [len(call[0][1]) for call in mock_update.call_args_list]
+        )
+        self.assertIsNone(chunked_data._data)
+        self.assertEqual(2999, chunked_profiler.total_samples)
+        self.assertEqual(2999, chunked_profiler.row_has_null_count)
+        self.assertEqual(0, chunked_profiler.row_is_null_count)
+        self.assertEqual("parquet", chunked_profiler.file_type)
+        for col_profile, chunked_col_profile in zip(
+            self.trained_schema.profile, chunked_profiler.profile
+        ):
+            self.assertEqual(col_profile.null_count, chunked_col_profile.null_count)
+
     def test_correct_rows_ingested(self):
         self.assertEqual(2999, self.trained_schema.total_samples)
 
@@ -563,6 +652,44 @@ class TestStructuredProfiler(unittest.TestCase):
             expected_corr_mat, merged_profile.correlation_matrix
         )
 
+    @mock.patch("dataprofiler.profilers.profile_builder." "ColumnDataLabelerCompiler")
+    @mock.patch(
+        "dataprofiler.profilers.profile_builder.DataLabeler", spec=StructuredDataLabeler
+    )
+    def test_legacy_correlation(self, *mocks):
+        profile_options = dp.ProfilerOptions()
+        profile_options.set({"correlation.is_enabled": True})
+        data = pd.DataFrame(
+            {
+                "a": [3, 2, 1, 7, 5, 9, 4, 10, 7, 2],
+                "b": [10, 11, 1, 4, 2, 5, 6, 3, 9, 8],
+                "c": ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"],
+            }
+        )
+        with test_utils.mock_timeit():
+            expected_profile = dp.StructuredProfiler(data, options=profile_options)
+            profile1 = dp.StructuredProfiler(data[:5], options=profile_options)
+            profile2 = dp.StructuredProfiler(data[5:], options=profile_options)
+
+        # profiles saved by prior versions only have the correlation matrix
+        profile1._correlation_moments = None
+        merged_profile = profile1 + profile2
+        np.testing.assert_array_almost_equal(
+            expected_profile.correlation_matrix, merged_profile.correlation_matrix
+        )
+        merged_profile = profile2 + profile1
+        np.testing.assert_array_almost_equal(
+            expected_profile.correlation_matrix, merged_profile.correlation_matrix
+        )
+        self.assertIsNone(profile1._correlation_moments)
+
+        # and keep being updated from the rebuilt moments
+        with test_utils.mock_timeit():
+            profile1.update_profile(data[5:])
+        np.testing.assert_array_almost_equal(
+            expected_profile.correlation_matrix, profile1.correlation_matrix
+        )
+
     def test_correlation_update(self):
         profile_options = dp.ProfilerOptions()
         profile_options.set({"correlation.is_enabled": True})
@@ -2317,6 +2444,8 @@ class TestStructuredColProfilerClass(unittest.TestCase):
         )
         # note data above is a subset `df_series=data[1:]`, 1.0 will not exist
         self.assertTrue(np.issubdtype(np.object_, df_series.dtype))
+        null_mask = np.unpackbits(base_stats.pop("null_mask"), count=5)
+        self.assertEqual(2, null_mask.sum())
         self.assertDictEqual(
             {
                 "sample": ["4.0", "6.0", "3.0"],
@@ -2334,6 +2463,8 @@ class TestStructuredColProfilerClass(unittest.TestCase):
         df_series, base_stats = StructuredColProfiler.clean_data_and_get_base_stats(
             df_series=data, sample_size=6, null_values=null_values, min_true_samples=0
         )
+        null_mask = np.unpackbits(base_stats.pop("null_mask"), count=6)
+        self.assertEqual(2, null_mask.sum())
         self.assertDictEqual(
             {
                 "sample": ["nan", "6.0", "4.0", "nan"],
@@ -2351,6 +2482,8 @@ class TestStructuredColProfilerClass(unittest.TestCase):
         df_series, base_stats = StructuredColProfiler.clean_data_and_get_base_stats(
             df_series=data, sample_size=6, null_values=null_values, min_true_samples=0
         )
+        null_mask = np.unpackbits(base_stats.pop("null_mask"), count=6)
+        self.assertEqual(0, null_mask.sum())
         self.assertDictEqual(
             {
                 "sample": ["3.0", "4.0", "6.0", "nan", "1.0"],
@@ -2363,6 +2496,100 @@ class TestStructuredColProfilerClass(unittest.TestCase):
             base_stats,
         )
 
+    def test_clean_data_and_get_base_stats_numeric_and_str_match(self):
+        data = pd.Series([1.5, np.nan, np.inf, -np.inf, 0.0, np.nan, 2.0])
+        for null_values in [
+            {"": 0, "nan": re.IGNORECASE, "--*": 0},
+            {"nan": 0, "-?inf": 0},
+            {"2.0": 0, "INF": re.IGNORECASE},
+            {},
+        ]:
+            numeric_series, numeric_stats = (
+                StructuredColProfiler.clean_data_and_get_base_stats(
+                    df_series=data, sample_size=7, null_values=null_values
+                )
+            )
+            str_series, str_stats = StructuredColProfiler.clean_data_and_get_base_stats(
+                df_series=data.apply(str), sample_size=7, null_values=null_values
+            )
+            self.assertEqual(object, numeric_series.dtype)
+            self.assertListEqual(
+                sorted(str_series.items()), sorted(numeric_series.items())
+            )
+            self.assertEqual(str_stats["null_count"], numeric_stats["null_count"])
+            self.assertDictEqual(
+                {key: sorted(value) for key, value in str_stats["null_types"].items()},
+                {
+                    key: sorted(value)
+                    for key, value in numeric_stats["null_types"].items()
+                },
+            )
+
+        _, base_stats = StructuredColProfiler.clean_data_and_get_base_stats(
+            df_series=data,
+            sample_size=7,
+            null_values={"nan": 0, "-?inf": 0},
+            sample_ids=[[6, 5, 4, 3, 2, 1, 0]],
+        )
+        self.assertDictEqual(
+            {"nan": [1, 5], "inf": [2], "-inf": [3]},
+            {key: sorted(value) for key, value in base_stats["null_types"].items()},
+        )
+
+        # the null mask follows the order of the sample ids
+        self.assertListEqual(
+            [0, 1, 0, 1, 1, 1, 0],
+            np.unpackbits(base_stats["null_mask"], count=7).tolist(),
+        )
+
+        # the regex matches of a column of strings keep the mask boolean
+        data = pd.Series(["x", None, "--", "y", "x"], dtype=object)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", category=FutureWarning)
+            _, base_stats = StructuredColProfiler.clean_data_and_get_base_stats(
+                df_series=data, sample_size=5, null_values={"None": 0, "--*": 0}
+            )
+        self.assertDictEqual(
+            {"None": [1], "--": [2]},
+            {key: sorted(value) for key, value in base_stats["null_types"].items()},
+        )
+
+    def test_clean_data_and_get_base_stats_keep_native_dtype(self):
+        data = pd.Series([1.5, np.nan, 3.0, 2.0], name="float")
+        clean_series, base_stats = StructuredColProfiler.clean_data_and_get_base_stats(
+            df_series=data,
+            sample_size=4,
+            null_values={"nan": re.IGNORECASE},
+            keep_native_dtype=True,
+        )
+        self.assertEqual(np.float64, clean_series.dtype)
+        self.assertListEqual([1.5, 3.0, 2.0], clean_series.tolist())
+        self.assertEqual(1, base_stats["null_count"])
+        self.assertCountEqual(["1.5", "3.0", "2.0"], base_stats["sample"])
+
+        # only int and float64 are kept in their native dtype
+        for dtype in [bool, np.float32]:
+            clean_series, _ = StructuredColProfiler.clean_data_and_get_base_stats(
+                df_series=data.astype(dtype), sample_size=4, keep_native_dtype=True
+            )
+            self.assertEqual(object, clean_series.dtype)
+
+        # profiles of native and string columns are the same
+        options = StructuredOptions()
+        options.data_labeler.is_enabled = False
+        data = pd.Series([1, 2, 3, 2, -7, 10] * 5, name="int")
+        native_profile = StructuredColProfiler(data, options=options)
+        str_profile = StructuredColProfiler(data.apply(str), options=options)
+        native_report = native_profile.report()
+        str_report = str_profile.report()
+        for report in [native_report, str_report]:
+            report.pop("samples")
+            report["statistics"].pop("times")
+        self.assertEqual(
+            json.dumps(str_report, sort_keys=True, default=str),
+            json.dumps(native_report, sort_keys=True, default=str),
+        )
+
     def test_column_names(self):
         data = [["a", 1], ["b", 2], ["c", 3]]
         df = pd.DataFrame(data, columns=["letter", "number"])
@@ -2644,6 +2871,52 @@ class TestStructuredColProfilerClass(unittest.TestCase):
 
         self.assertDictEqual(expected_diff, dict(profile1.diff(profile2)))
 
+    def test_distinct_count(self):
+        options = StructuredOptions()
+        options.data_labeler.is_enabled = False
+        options.distinct_count.is_enabled = True
+
+        # exact while the categories are all kept
+        data = pd.Series(["a", "b", "a", None, "c"], name="cat")
+        profile = StructuredColProfiler(data, options=options)
+        report = profile.profile
+        self.assertEqual(3, report["statistics"]["unique_count"])
+        self.assertEqual(3 / 4, report["statistics"]["unique_ratio"])
+
+        # estimated by the sketch once the categories are no longer kept
+        options.category.max_sample_size_to_check_stop_condition = 100
+        options.category.stop_condition_unique_value_ratio = 0.5
+        data = pd.Series([str(i) for i in range(3000)], name="id")
+        profile = StructuredColProfiler(data, options=options)
+        category = profile.profiles["data_stats_profile"]._profiles["category"]
+        self.assertTrue(category._stop_condition_is_met)
+        estimate = profile._distinct_sketch.cardinality()
+        self.assertAlmostEqual(3000, estimate, delta=3000 * 0.05)
+        # the estimate is capped by the number of values
+        unique_count = profile.profile["statistics"]["unique_count"]
+        self.assertEqual(min(estimate, 3000), unique_count)
+
+        # the sketches are merged, such that repeated values are not counted
+        merged_profile = profile + StructuredColProfiler(data, options=options)
+        self.assertEqual(6000, merged_profile._distinct_sample_size)
+        merged_stats = merged_profile.profile["statistics"]
+        self.assertEqual(estimate, merged_stats["unique_count"])
+        self.assertEqual(estimate / 6000, merged_stats["unique_ratio"])
+
+        diff = profile.diff(merged_profile)
+        self.assertEqual(unique_count - estimate, diff["statistics"]["unique_count"])
+        self.assertEqual(
+            unique_count / 3000 - estimate / 6000,
+            diff["statistics"]["unique_ratio"],
+        )
+
+        # only kept when enabled on both profiles
+        options.distinct_count.is_enabled = False
+        profile2 = StructuredColProfiler(data, options=options)
+        self.assertIsNone(profile2._distinct_sketch)
+        merged_profile = profile + profile2
+        self.assertIsNone(merged_profile._distinct_sketch)
+
 
 @mock.patch(
     "dataprofiler.profilers.profile_builder.UnstructuredCompiler",
@@ -2854,7 +3127,7 @@ class TestUnstructuredProfiler(unittest.TestCase):
         self.assertEqual(25000, sample_size)
 
     def test_clean_data_and_get_base_stats(self, *mocks):
-        data = pd.Series(["here\n", "\t    ", "a", " is", "\n\r", "more data"])
+        data = pd.Series(["here\n", "a", "\t    ", "more data", " is", "\n\r"])
 
         # needed bc _clean_data_and_get_base_stats is not static
         # for timeit which wraps this func and uses the class
@@ -2887,7 +3160,7 @@ class TestUnstructuredProfiler(unittest.TestCase):
         self.assertTrue(np.issubdtype(np.object_, df_series.dtype))
         self.assertDictEqual(
             {
-                "sample": ["more data", "here\n", "a", " is"],
+                "sample": [" is", "here\n", "a", "more data"],
                 "sample_size": 6,
                 "empty_line_count": 2,
                 "memory_size": 25 / 1024**2,
@@ -3667,8 +3940,8 @@ class TestStructuredProfilerRowStatistics(unittest.TestCase):
         data = [
             ["test1", 1.0],
             ["test2", 2.0],
-            ["test3", 3.0],
             [None, None],
+            ["test3", 3.0],
             ["test5", 5.0],
             ["test6", 6.0],
             [None, None],
@@ -3698,7 +3971,7 @@ class TestStructuredProfilerRowStatistics(unittest.TestCase):
             data.index = pd.RangeIndex(8, 16)
             profile.update_profile(data)
 
-            # rows sampled are [5, 6], [13, 14] (0 index)
+            # rows sampled are [2, 4], [10, 12] (0 index)
             self.assertEqual(16, profile.total_samples)
             self.assertEqual(4, profile._max_col_samples_used)
             self.assertEqual(2, profile.row_has_null_count)
@@ -3728,9 +4001,9 @@ class TestStructuredProfilerRowStatistics(unittest.TestCase):
         profile = dp.StructuredProfiler(
             data, samples_per_update=5, min_true_samples=5, options=opts
         )
-        # Rows 2, 4, 5, 6, 7 are sampled in first column
+        # Rows 2, 3, 4, 5, 6 are sampled in first column
         # Therefore only those rows should be considered for null calculations
-        # The only null in those rows in second column in that subset are 5, 7
+        # The only null in those rows in second column in that subset are 3, 5
         # Therefore only 2 rows have null according to row_has_null_count
         self.assertEqual(0, profile.row_is_null_count)
         self.assertEqual(2, profile.row_has_null_count)
@@ -3741,17 +4014,17 @@ class TestStructuredProfilerRowStatistics(unittest.TestCase):
 
         data2 = pd.DataFrame(
             {
-                "sparse": [1, None, 3, None, 5, None, 7, None],
-                "sparser": [1, None, None, None, None, None, None, 8],
+                "sparse": [None, 1, 7, None, None, 3, 5, None],
+                "sparser": [None, 1, None, None, None, None, None, 8],
             }
         )
         profile2 = dp.StructuredProfiler(
             data2, samples_per_update=2, min_true_samples=2, options=opts
         )
-        # Rows are sampled as follows: [6, 5], [1, 4], [2, 3], [0, 7]
-        # First column gets min true samples from ids 1, 4, 5, 6
-        # Second column gets completely sampled (has a null in 1, 4, 5, 6)
-        # rows 1 and 5 are completely null, 4 and 6 only null in col 2
+        # Rows are sampled as follows: [2, 4], [3, 6], [5, 0], [1, 7]
+        # First column gets min true samples from ids 2, 3, 4, 6
+        # Second column gets completely sampled (has a null in 2, 3, 4, 6)
+        # rows 3 and 4 are completely null, 2 and 6 only null in col 2
         self.assertEqual(2, profile2.row_is_null_count)
         self.assertEqual(4, profile2.row_has_null_count)
         # Only 4 total rows sampled, ratio accordingly
@@ -4129,8 +4402,8 @@ class TestStructuredProfilerRowStatistics(unittest.TestCase):
             }
         )
         with mock.patch(
-            "dataprofiler.profilers.profile_builder.HyperLogLog",
-            spec=dataprofiler.profilers.profile_builder.HyperLogLog,
+            "dataprofiler.profilers.profile_builder.HyperLogLogSketch",
+            spec=dataprofiler.profilers.profile_builder.HyperLogLogSketch,
         ) as hll_mock:
             hll_mock.return_value.cardinality.return_value = 1000
             profiler = StructuredProfiler(pd.DataFrame([]), options=profiler_options)
@@ -4188,6 +4461,75 @@ class TestStructuredProfilerRowStatistics(unittest.TestCase):
         self.assertEqual(16, self.trained_schema_hll.hashed_row_object.cardinality())
         self.assertEqual(16, load_profile.hashed_row_object.cardinality())
 
+    def test_legacy_hashed_rows(self):
+        data = pd.DataFrame({"names": ["a", "b", "c"], "numbers": [1, 2, 3]})
+        new_data = pd.DataFrame({"names": ["a", "d"], "numbers": [1, 4]})
+        records = data.to_json(orient="records", lines=True).splitlines()
+
+        for hashing_method in ["full", "hll"]:
+            profiler_options = ProfilerOptions()
+            profiler_options.set(
+                {
+                    "*.is_enabled": False,
+                    "row_statistics.is_enabled": True,
+                    "row_statistics.unique_count.is_enabled": True,
+                    "row_statistics.unique_count.hashing_method": hashing_method,
+                }
+            )
+            with test_utils.mock_timeit():
+                profiler = StructuredProfiler(data, options=profiler_options)
+                other_profiler = StructuredProfiler(new_data, options=profiler_options)
+
+            # profiles saved by prior versions hashed the rows differently
+            if hashing_method == "full":
+                legacy_rows = dict.fromkeys(
+                    pd.util.hash_pandas_object(data, index=False), True
+                )
+            else:
+                sketch = profiler.hashed_row_object
+                legacy_rows = HyperLogLog(
+                    p=sketch.register_count, seed=sketch.seed, sparse=False
+                )
+                for record in records:
+                    legacy_rows.add(record)
+            profiler.hashed_row_object = copy.deepcopy(legacy_rows)
+
+            # which keeps being used to hash the new rows
+            with test_utils.mock_timeit():
+                profiler.update_profile(new_data)
+            self.assertIsInstance(profiler.hashed_row_object, type(legacy_rows))
+            self.assertEqual(4 / 5, profiler._get_unique_row_ratio())
+            self.assertEqual(1, profiler._get_duplicate_row_count())
+
+            # merging legacy rows keeps their hashing and the operands unchanged
+            other_profiler.hashed_row_object = copy.deepcopy(legacy_rows)
+            with test_utils.mock_timeit():
+                merged_profile = profiler + other_profiler
+            self.assertIsInstance(merged_profile.hashed_row_object, type(legacy_rows))
+            self.assertEqual(4 / 7, merged_profile._get_unique_row_ratio())
+            self.assertEqual(4 / 5, profiler._get_unique_row_ratio())
+            self.assertEqual(3 / 2, other_profiler._get_unique_row_ratio())
+
+            # merged with a sketch, the legacy rows are converted with a warning
+            with test_utils.mock_timeit():
+                sketch_profiler = StructuredProfiler(new_data, options=profiler_options)
+            with test_utils.mock_timeit(), self.assertWarnsRegex(
+                UserWarning, "hashed differently"
+            ):
+                merged_profile = sketch_profiler + other_profiler
+            self.assertIsInstance(
+                merged_profile.hashed_row_object,
+                type(sketch_profiler.hashed_row_object),
+            )
+            self.assertIsInstance(other_profiler.hashed_row_object, type(legacy_rows))
+
+        # rows hashed with different methods cannot be merged
+        sketch = sketch_profiler.hashed_row_object
+        with self.assertWarnsRegex(
+            UserWarning, "hashed differently"
+        ), self.assertRaisesRegex(ValueError, "same hashing method"):
+            StructuredProfiler._merge_hashed_rows(copy.deepcopy(sketch), sketch, {})
+
 
 class TestProfilerFactoryClass(unittest.TestCase):
     def test_profiler_factory_class_bad_input(self):
@@ -0,0 +1,78 @@
+import pickle
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler.profilers.row_index_set import RowIndexSet
+
+
+class TestRowIndexSet(unittest.TestCase):
+    def test_runs(self):
+        index_set = RowIndexSet([9, 3, 4, 5, 4, 12, 11])
+        starts, ends = index_set.runs
+        np.testing.assert_array_equal([3, 9, 11], starts)
+        np.testing.assert_array_equal([6, 10, 13], ends)
+        self.assertEqual(6, len(index_set))
+        self.assertEqual([3, 4, 5, 9, 11, 12], list(index_set))
+        self.assertEqual({3, 4, 5, 9, 11, 12}, index_set)
+        self.assertIn(4, index_set)
+        self.assertNotIn(6, index_set)
+
+        # a contiguous index is a single run
+        index_set = RowIndexSet(pd.RangeIndex(10**6))
+        self.assertEqual(1, len(index_set.runs[0]))
+        self.assertEqual(10**6, len(index_set))
+
+        self.assertEqual(0, len(RowIndexSet()))
+        self.assertEqual(set(), RowIndexSet([]))
+
+    def test_labels(self):
+        index_set = RowIndexSet(["a", 1, 2, "b", (0, 1)])
+        self.assertEqual({"a", "b", (0, 1), 1, 2}, index_set)
+        self.assertIn("a", index_set)
+        self.assertIn((0, 1), index_set)
+        self.assertNotIn("1", index_set)
+        np.testing.assert_array_equal(
+            [True, True, False, False], index_set.isin(["a", 2, "c", 3])
+        )
+        self.assertEqual({"a", 2}, index_set.intersection(["a", 2, "c"]))
+        self.assertEqual({"b", (0, 1), 1}, index_set.difference({"a", 2}))
+
+    def test_set_operations(self):
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            sets = [
+                set(rng.integers(-5, 60, size=rng.integers(0, 40)).tolist())
+                for _ in range(3)
+            ]
+            index_sets = [RowIndexSet(indices) for indices in sets]
+            self.assertEqual(
+                sets[0] | sets[1] | sets[2], index_sets[0].union(*sets[1:])
+            )
+            self.assertEqual(
+                sets[0] & sets[1] & sets[2], index_sets[0].intersection(*index_sets[1:])
+            )
+            self.assertEqual(
+                sets[0] - sets[1] - sets[2], index_sets[0].difference(*index_sets[1:])
+            )
+            self.assertEqual({index + 7 for index in sets[0]}, index_sets[0].shift(7))
+
+            values = rng.integers(-10, 70, size=30)
+            np.testing.assert_array_equal(
+                [value in sets[0] for value in values], index_sets[0].isin(values)
+            )
+
+            # the runs are the same no matter how the set was built
+            index_set = RowIndexSet()
+            for indices in sets:
+                index_set.update(indices)
+            self.assertEqual(RowIndexSet(sets[0] | sets[1] | sets[2]), index_set)
+
+    def test_pickle(self):
+        index_set = RowIndexSet([1, 2, 3, 7, "a"])
+        self.assertEqual(index_set, pickle.loads(pickle.dumps(index_set)))
+
+
+if __name__ == "__main__":
+    unittest.main()
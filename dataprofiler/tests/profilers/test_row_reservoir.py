@@ -0,0 +1,168 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import dataprofiler as dp
+from dataprofiler.profilers.row_reservoir import RowReservoir
+
+from . import utils as test_utils
+
+
+class TestRowReservoir(unittest.TestCase):
+    def setUp(self):
+        test_utils.set_seed(seed=0)
+
+    def test_update(self):
+        reservoir = RowReservoir(10)
+        self.assertEqual(0, len(reservoir))
+        self.assertTrue(reservoir.sample.empty)
+
+        # rows are all kept until the reservoir is full
+        data = pd.DataFrame({"a": range(4), "b": list("wxyz")}, index=[5, 3, 9, 1])
+        reservoir.update(data)
+        self.assertEqual(4, len(reservoir))
+        pd.testing.assert_frame_equal(
+            data.reset_index(drop=True).set_axis([0, 1], axis=1),
+            reservoir.sample.sort_values(0).reset_index(drop=True),
+        )
+
+        for start in range(4, 100, 8):
+            reservoir.update(pd.DataFrame({"a": range(start, start + 8), "b": "text"}))
+        self.assertEqual(10, len(reservoir))
+        self.assertEqual(100, reservoir.rows_seen)
+        self.assertEqual(10, reservoir.sample[0].nunique())
+        self.assertEqual(pd.RangeIndex(10).tolist(), reservoir.sample.index.tolist())
+
+        # empty batches are ignored
+        reservoir.update(pd.DataFrame({"a": [], "b": []}))
+        self.assertEqual(100, reservoir.rows_seen)
+
+    def test_uniform_across_batches(self):
+        # a single large batch and many small batches are equally represented
+        counts = np.zeros(2)
+        for trial in range(200):
+            reservoir = RowReservoir(20)
+            reservoir._rng = np.random.default_rng(trial)
+            reservoir.update(pd.DataFrame({"batch": np.zeros(1000)}))
+            for _ in range(100):
+                reservoir.update(pd.DataFrame({"batch": np.ones(10)}))
+            counts += np.bincount(reservoir.sample[0].astype(int), minlength=2)
+        self.assertAlmostEqual(0.5, counts[1] / counts.sum(), delta=0.03)
+
+    def test_differing_dtypes(self):
+        reservoir = RowReservoir(10)
+        reservoir.update(pd.DataFrame({"a": [1, 2]}))
+        reservoir.update(pd.DataFrame({"a": [np.nan]}))
+        reservoir.update(pd.DataFrame({"a": ["3"]}))
+        self.assertCountEqual([1, 2, "3"], reservoir.sample[0].dropna().tolist())
+
+    def test_add(self):
+        reservoir1 = RowReservoir(10)
+        reservoir1.update(pd.DataFrame({"a": range(100)}))
+        reservoir2 = RowReservoir(5)
+        reservoir2.update(pd.DataFrame({"a": range(100, 103)}))
+
+        merged_reservoir = reservoir1 + reservoir2
+        self.assertEqual(5, merged_reservoir.size)
+        self.assertEqual(5, len(merged_reservoir))
+        self.assertEqual(103, merged_reservoir.rows_seen)
+        self.assertTrue(
+            set(merged_reservoir.sample[0]).issubset(
+                set(reservoir1.sample[0]) | set(reservoir2.sample[0])
+            )
+        )
+
+        # the merged keys are the smallest of both reservoirs
+        keys = np.sort(np.concatenate([reservoir1._keys, reservoir2._keys]))[:5]
+        np.testing.assert_array_equal(keys, np.sort(merged_reservoir._keys))
+
+        # merging with an empty reservoir keeps the other's rows
+        merged_reservoir = RowReservoir(10) + reservoir2
+        self.assertEqual(3, len(merged_reservoir))
+
+    def test_pickle(self):
+        reservoir = RowReservoir(10)
+        reservoir.update(pd.DataFrame({"a": range(20)}))
+        loaded = pickle.loads(pickle.dumps(reservoir))
+        pd.testing.assert_frame_equal(reservoir.sample, loaded.sample)
+        np.testing.assert_array_equal(reservoir._keys, loaded._keys)
+
+
+class TestStructuredProfilerReservoir(unittest.TestCase):
+    def setUp(self):
+        test_utils.set_seed(seed=0)
+        self.options = dp.ProfilerOptions()
+        self.options.set(
+            {
+                "structured_options.reservoir_sampling.is_enabled": True,
+                "structured_options.reservoir_sampling.size": 50,
+            }
+        )
+        self.data = pd.DataFrame(
+            {"int": np.arange(6000), "str": ["a", None, "bb"] * 2000}
+        )
+
+    @mock.patch("dataprofiler.profilers.profile_builder.ColumnDataLabelerCompiler")
+    @mock.patch("dataprofiler.profilers.profile_builder.DataLabeler")
+    def test_label_reservoir(self, mock_data_labeler, mock_labeler_compiler):
+        profiler = dp.StructuredProfiler(self.data[:4000], options=self.options)
+        profiler.update_profile(self.data[4000:])
+
+        # every row profiled by the stats, none labeled until needed
+        self.assertEqual(6000, profiler._profile[0].sample_size)
+        self.assertEqual(6000, profiler._profile[1].sample_size)
+        self.assertEqual(2000, profiler._profile[1].null_count)
+        self.assertNotIn("data_label_profile", profiler._profile[0].profiles)
+        mock_labeler_compiler.assert_not_called()
+
+        # the columns are labeled once from the reservoir, without nulls
+        profiles = profiler.profile
+        profiler.profile
+        self.assertEqual(2, mock_labeler_compiler.call_count)
+        int_data, str_data = [
+            call.args[0] for call in mock_labeler_compiler.call_args_list
+        ]
+        self.assertEqual(50, len(int_data))
+        self.assertTrue(set(int_data.native_series).issubset(range(6000)))
+        self.assertTrue(set(str_data.series).issubset({"a", "bb"}))
+        self.assertIn("data_label_profile", profiles[0].profiles)
+
+        # relabeled once updated
+        profiler.update_profile(self.data[:100])
+        profiler.profile
+        self.assertEqual(4, mock_labeler_compiler.call_count)
+
+    @mock.patch("dataprofiler.profilers.profile_builder.DataLabeler")
+    def test_add_and_save(self, *mocks):
+        self.options.set({"data_labeler.is_enabled": False})
+        profiler1 = dp.StructuredProfiler(self.data[:3000], options=self.options)
+        profiler2 = dp.StructuredProfiler(self.data[3000:], options=self.options)
+
+        merged_profiler = profiler1 + profiler2
+        self.assertEqual(50, len(merged_profiler._reservoir))
+        self.assertEqual(6000, merged_profiler._reservoir.rows_seen)
+        self.assertEqual(6000, merged_profiler.report()["global_stats"]["samples_used"])
+
+        # reservoirs can only be merged with reservoirs
+        options = dp.ProfilerOptions()
+        options.set({"data_labeler.is_enabled": False})
+        profiler3 = dp.StructuredProfiler(self.data[:10], options=options)
+        with self.assertRaisesRegex(ValueError, "reservoir sampling option enabled"):
+            profiler1 + profiler3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "profile.pkl")
+            merged_profiler.save(filepath)
+            loaded_profiler = dp.StructuredProfiler.load(filepath)
+        pd.testing.assert_frame_equal(
+            merged_profiler._reservoir.sample, loaded_profiler._reservoir.sample
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
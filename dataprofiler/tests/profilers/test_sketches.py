@@ -0,0 +1,350 @@
+import contextlib
+import copy
+import gc
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from HLL import HyperLogLog
+
+from dataprofiler.profilers.profile_builder import StructuredProfiler
+from dataprofiler.profilers.profiler_options import ProfilerOptions
+from dataprofiler.profilers.sketches import (
+    HeavyHitterSketch,
+    HyperLogLogSketch,
+    KLLSketch,
+    SortedHashSet,
+    hash_rows,
+)
+
+
+class TestHashRows(unittest.TestCase):
+    def test_hash_rows(self):
+        data = pd.DataFrame({"a": [1, 2, 1], "b": ["x", "y", "x"]})
+        hashes = hash_rows(data)
+        self.assertEqual(np.uint64, hashes.dtype)
+        self.assertEqual(hashes[0], hashes[2])
+        self.assertNotEqual(hashes[0], hashes[1])
+
+        # the order of the columns matters
+        self.assertNotEqual(hashes[0], hash_rows(data[["b", "a"]])[0])
+
+        # a column hashes the same as its frame
+        np.testing.assert_array_equal(hash_rows(data[["a"]]), hash_rows(data["a"]))
+
+    def test_hash_nulls(self):
+        # nulls hash the same regardless of their type or column dtype
+        hashes = hash_rows(pd.DataFrame({"a": ["x"] * 3, "b": [None, np.nan, None]}))
+        self.assertEqual(1, len(set(hashes)))
+        float_hashes = hash_rows(pd.DataFrame({"a": ["x"], "b": [np.nan]}))
+        self.assertEqual(hashes[0], float_hashes[0])
+
+    def test_hash_copy_on_write(self):
+        # copy-on-write is always on from pandas 3 and optional before
+        copy_on_write = contextlib.nullcontext()
+        if int(pd.__version__.split(".")[0]) < 3:
+            try:
+                pd.get_option("mode.copy_on_write")
+            except KeyError:
+                pass
+            else:
+                copy_on_write = pd.option_context("mode.copy_on_write", True)
+        with copy_on_write:
+            data = pd.DataFrame({"a": [1.0, np.nan, 1.0], "b": ["x", None, "x"]})
+            hashes = hash_rows(data)
+            self.assertEqual(hashes[0], hashes[2])
+            self.assertNotEqual(hashes[0], hashes[1])
+            options = ProfilerOptions()
+            options.set({"data_labeler.is_enabled": False})
+            profile = StructuredProfiler(data, options=options)
+            self.assertEqual(2, profile._get_unique_row_ratio() * 3)
+
+    def test_hash_unhashable(self):
+        hashes = hash_rows(pd.Series([[1], [1], [2]]))
+        self.assertEqual(hashes[0], hashes[1])
+        self.assertNotEqual(hashes[0], hashes[2])
+
+
+class TestHyperLogLogSketch(unittest.TestCase):
+    def test_cardinality(self):
+        sketch = HyperLogLogSketch()
+        self.assertEqual(0, sketch.cardinality())
+        self.assertEqual(2**15, len(sketch.registers))
+
+        # exact for small cardinalities
+        sketch.update(pd.DataFrame({"a": [1, 1, 4, 4, 3, 1], "b": [1, 1, 3, 4, 4, 2]}))
+        self.assertEqual(5, sketch.cardinality())
+
+        for register_count in [10, 15]:
+            sketch = HyperLogLogSketch(register_count=register_count)
+            for start in range(0, 200000, 50000):
+                sketch.update(pd.Series(np.arange(start, start + 50000)))
+            self.assertAlmostEqual(200000, sketch.cardinality(), delta=200000 * 0.05)
+
+    def test_add_hashes(self):
+        sketch = HyperLogLogSketch(register_count=4)
+        sketch.add_hashes(np.array([], dtype=np.uint64))
+        self.assertEqual(0, sketch.registers.max())
+
+        # ranks never exceed the bits remaining after the register index
+        sketch.add_hashes(np.arange(10000, dtype=np.uint64))
+        self.assertGreater(sketch.registers.min(), 0)
+        self.assertLessEqual(sketch.registers.max(), 61)
+
+    def test_seed(self):
+        data = pd.Series(np.arange(100))
+        sketch = HyperLogLogSketch(register_count=10, seed=0)
+        sketch.update(data)
+        seeded_sketch = HyperLogLogSketch(register_count=10, seed=5)
+        seeded_sketch.update(data)
+        self.assertFalse(np.array_equal(sketch.registers, seeded_sketch.registers))
+
+        with self.assertRaisesRegex(ValueError, "same register count and seed"):
+            sketch.merge(seeded_sketch)
+        with self.assertRaisesRegex(ValueError, "same register count and seed"):
+            sketch.merge(HyperLogLogSketch(register_count=12))
+
+    def test_merge(self):
+        sketch1 = HyperLogLogSketch()
+        sketch1.update(pd.Series(np.arange(0, 6000)))
+        sketch2 = HyperLogLogSketch()
+        sketch2.update(pd.Series(np.arange(4000, 10000)))
+
+        sketch = HyperLogLogSketch()
+        sketch.update(pd.Series(np.arange(10000)))
+        sketch1.merge(sketch2)
+        np.testing.assert_array_equal(sketch.registers, sketch1.registers)
+
+        loaded_sketch = pickle.loads(pickle.dumps(sketch1))
+        self.assertEqual(sketch1.cardinality(), loaded_sketch.cardinality())
+
+    def test_from_registers(self):
+        hll = HyperLogLog(p=12, seed=3, sparse=False)
+        for value in range(1000):
+            hll.add(str(value))
+
+        sketch = StructuredProfiler._get_row_sketch(hll)
+        self.assertIsInstance(sketch, HyperLogLogSketch)
+        self.assertEqual(12, sketch.register_count)
+        self.assertEqual(3, sketch.seed)
+        self.assertAlmostEqual(hll.cardinality(), sketch.cardinality(), delta=10)
+
+        # converted sketches keep being updated
+        sketch.update(pd.Series(np.arange(1000)))
+        self.assertAlmostEqual(2000, sketch.cardinality(), delta=100)
+        self.assertIs(sketch, StructuredProfiler._get_row_sketch(sketch))
+
+
+class TestSortedHashSet(unittest.TestCase):
+    def test_add_hashes(self):
+        rng = np.random.default_rng(0)
+        hash_set = SortedHashSet()
+        self.assertEqual(0, len(hash_set))
+
+        expected = set()
+        for _ in range(5):
+            hashes = rng.integers(0, 2**20, size=30000, dtype=np.uint64)
+            hash_set.add_hashes(hashes)
+            expected.update(hashes.tolist())
+        self.assertEqual(len(expected), len(hash_set))
+        np.testing.assert_array_equal(sorted(expected), hash_set._hashes)
+        self.assertFalse(hash_set.is_spilled)
+
+        # rows are deduplicated exactly
+        hash_set = SortedHashSet()
+        hash_set.update(
+            pd.DataFrame({"a": [1, 2, 1, None], "b": ["x", "y", "x", None]})
+        )
+        hash_set.update(pd.DataFrame({"a": [2, np.nan], "b": ["y", np.nan]}))
+        self.assertEqual(3, len(hash_set))
+
+    def test_merge(self):
+        hash_set1 = SortedHashSet.from_hashes(np.arange(0, 6000, dtype=np.uint64))
+        hash_set2 = SortedHashSet.from_hashes(np.arange(4000, 10000, dtype=np.uint64))
+        hash_set1.merge(hash_set2)
+        self.assertEqual(10000, len(hash_set1))
+        self.assertEqual(6000, len(hash_set2))
+        np.testing.assert_array_equal(np.arange(10000), hash_set1._hashes)
+
+    def test_spill(self):
+        rng = np.random.default_rng(0)
+        hashes = rng.integers(0, 2**64 - 1, size=50000, dtype=np.uint64)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hash_set = SortedHashSet(spill_threshold=8 * 1000, spill_dirpath=tmpdir)
+            hash_set._min_buffer_size = 500
+            hash_set._chunk_size = 700
+            for start in range(0, len(hashes), 5000):
+                hash_set.add_hashes(hashes[start : start + 5000])
+                hash_set.add_hashes(hashes[: start // 2])
+            self.assertTrue(hash_set.is_spilled)
+            np.testing.assert_array_equal(np.unique(hashes), hash_set._hashes)
+
+            # only the latest file is kept
+            self.assertEqual(1, len(os.listdir(tmpdir)))
+
+            # copies load the hashes into memory
+            for loaded_set in [
+                pickle.loads(pickle.dumps(hash_set)),
+                copy.deepcopy(hash_set),
+            ]:
+                self.assertFalse(loaded_set.is_spilled)
+                np.testing.assert_array_equal(hash_set._hashes, loaded_set._hashes)
+
+            # the file is removed with the set
+            del hash_set
+            gc.collect()
+            self.assertEqual([], os.listdir(tmpdir))
+
+    def test_from_dict(self):
+        hashes = {np.uint64(value): True for value in [5, 3, 2**63 + 1]}
+        hash_set = StructuredProfiler._get_row_sketch(hashes)
+        self.assertIsInstance(hash_set, SortedHashSet)
+        np.testing.assert_array_equal([3, 5, 2**63 + 1], hash_set._hashes)
+        self.assertIs(hash_set, StructuredProfiler._get_row_sketch(hash_set))
+
+
+class TestHeavyHitterSketch(unittest.TestCase):
+    def test_exact(self):
+        sketch = HeavyHitterSketch(capacity=10)
+        sketch.update(pd.Series(["a", "b", "a", "c", "a"]).value_counts())
+        sketch.update({"b": 2, "d": 1})
+        self.assertTrue(sketch.is_exact)
+        self.assertEqual(8, sketch.total)
+        self.assertEqual(4, sketch.distinct_count())
+
+        counts, errors = sketch.top_counts()
+        self.assertEqual({"a": 3, "b": 3, "c": 1, "d": 1}, counts)
+        self.assertEqual({"a": 0, "b": 0, "c": 0, "d": 0}, errors)
+        self.assertEqual(["a", "b"], list(sketch.top_counts(2)[0]))
+        np.testing.assert_array_equal([3, 1, 0], sketch.estimate(["b", "d", "e"]))
+
+    def test_bounds(self):
+        rng = np.random.default_rng(0)
+        data = (rng.zipf(1.5, size=50000) % 5000).astype(str)
+        true_counts = pd.Series(data).value_counts()
+
+        sketch = HeavyHitterSketch(capacity=50, width=256, depth=3)
+        other_sketch = HeavyHitterSketch(capacity=50, width=256, depth=3)
+        for i, batch in enumerate(np.array_split(data, 10)):
+            (sketch if i % 2 else other_sketch).update(pd.Series(batch).value_counts())
+        sketch.merge(other_sketch)
+        self.assertFalse(sketch.is_exact)
+        self.assertEqual(50, len(sketch.counts))
+        self.assertEqual(50000, sketch.total)
+
+        # the counts are upper bounds exceeding the true counts by their error
+        counts, errors = sketch.top_counts()
+        for value, count in counts.items():
+            self.assertLessEqual(true_counts[value], count)
+            self.assertLessEqual(count - errors[value], true_counts[value])
+        self.assertEqual(list(true_counts.index[:5]), list(counts)[:5])
+
+        # values not monitored are bounded by the floor
+        self.assertLessEqual(true_counts.drop(list(counts)).max(), sketch.floor)
+        self.assertTrue((sketch.estimate(true_counts.index) >= true_counts).all())
+
+        self.assertAlmostEqual(
+            len(true_counts), sketch.distinct_count(), delta=len(true_counts) * 0.05
+        )
+
+    def test_merge(self):
+        sketch = HeavyHitterSketch(capacity=3)
+        sketch.update({"a": 5, "b": 1})
+        other_sketch = HeavyHitterSketch(capacity=3)
+        other_sketch.update({"a": 1, "c": 4, "d": 3, "e": 1})
+        self.assertEqual(1, other_sketch.floor)
+
+        sketch.merge(other_sketch)
+        self.assertEqual({"a": 6, "c": 4, "d": 3}, sketch.counts)
+        self.assertEqual({"a": 0, "c": 0, "d": 0}, sketch.errors)
+        self.assertEqual(2, sketch.floor)
+        self.assertEqual(15, sketch.total)
+
+        with self.assertRaisesRegex(ValueError, "same capacity, width, depth"):
+            sketch.merge(HeavyHitterSketch(capacity=3, seed=1))
+
+        loaded_sketch = pickle.loads(pickle.dumps(sketch))
+        self.assertEqual(sketch.top_counts(), loaded_sketch.top_counts())
+
+
+class TestKLLSketch(unittest.TestCase):
+    def test_exact(self):
+        # values are exact until the bottom compactor is full
+        values = np.array([3.0, 1.0, np.nan, 2.0, 5.0])
+        sketch = KLLSketch()
+        sketch.update(values)
+        self.assertEqual(4, sketch.count)
+        quantiles = [0, 0.25, 0.5, 0.9, 1]
+        np.testing.assert_allclose(
+            np.quantile([1.0, 2.0, 3.0, 5.0], quantiles), sketch.quantiles(quantiles)
+        )
+        self.assertEqual(1.0, sketch.median_abs_deviation(2.5))
+
+        sketch = KLLSketch()
+        self.assertTrue(np.isnan(sketch.quantiles([0.5])[0]))
+        self.assertTrue(np.isnan(sketch.median_abs_deviation(0)))
+        sketch.update(np.array([np.nan]))
+        self.assertEqual(0, sketch.count)
+
+    def test_rank_error(self):
+        rng = np.random.default_rng(0)
+        values = rng.lognormal(size=100000)
+        sketch = KLLSketch(compactor_size=200)
+        for batch in np.array_split(values, 20):
+            sketch.update(batch)
+        self.assertEqual(100000, sketch.count)
+
+        # memory is bounded regardless of the number of values
+        self.assertLess(sum(len(level) for level in sketch.levels), 3 * 200)
+
+        quantiles = np.linspace(0, 1, 101)
+        estimates = sketch.quantiles(quantiles)
+        self.assertEqual(values.min(), estimates[0])
+        self.assertEqual(values.max(), estimates[-1])
+        ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+        self.assertLess(np.abs(ranks - quantiles).max(), 0.02)
+
+        median = np.median(values)
+        self.assertAlmostEqual(
+            np.median(np.abs(values - median)),
+            sketch.median_abs_deviation(median),
+            delta=0.02,
+        )
+
+    def test_merge(self):
+        rng = np.random.default_rng(1)
+        values = rng.normal(size=50000)
+        sketches = []
+        for batch in np.array_split(values, 100):
+            sketch = KLLSketch()
+            sketch.update(batch)
+            sketches.append(sketch)
+
+        merged_sketch = copy.deepcopy(sketches[0])
+        for sketch in sketches[1:]:
+            merged_sketch.merge(sketch)
+        merged_sketch.merge(KLLSketch())
+        self.assertEqual(50000, merged_sketch.count)
+        self.assertEqual(500, sketches[0].count)
+
+        # the rank error still holds after many merges
+        quantiles = np.linspace(0.01, 0.99, 99)
+        ranks = np.searchsorted(
+            np.sort(values), merged_sketch.quantiles(quantiles)
+        ) / len(values)
+        self.assertLess(np.abs(ranks - quantiles).max(), 0.02)
+
+        with self.assertRaisesRegex(ValueError, "same compactor size"):
+            merged_sketch.merge(KLLSketch(compactor_size=100))
+
+        loaded_sketch = pickle.loads(pickle.dumps(merged_sketch))
+        self.assertEqual(
+            merged_sketch.quantiles(quantiles), loaded_sketch.quantiles(quantiles)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,12 @@ from unittest import mock
 
 import numpy as np
 import pandas as pd
+import scipy.stats
 
 import dataprofiler as dp
 from dataprofiler.labelers.base_data_labeler import BaseDataLabeler
 from dataprofiler.profilers import utils
+from dataprofiler.profilers.numerical_column_stats import NumericStatsMixin
 
 
 class TestShuffleInChunks(unittest.TestCase):
@@ -349,6 +351,111 @@ class TestShuffleInChunks(unittest.TestCase):
             utils.get_memory_size(["This is test, a Test sentence.!!!"], unit="G"),
         )
 
+    def test_get_numeric_type_masks(self):
+        """
+        Checks the type masks match converting each value individually.
+        """
+        data = pd.Series(
+            [
+                "1",
+                "1.5",
+                " 2 ",
+                "nan",
+                "-inf",
+                "Infinity",
+                "+1e5",
+                "1e400",
+                "1_000",
+                "1.",
+                "",
+                "abc",
+                "1,000",
+                "0x10",
+                "1e",
+                "Apt 5",
+                "1.0000000000000001",
+                "9007199254740993",
+                "1.5.3",
+                "1 2",
+                "1",
+            ]
+        )
+        is_int, is_float, is_text = utils.get_numeric_type_masks(data)
+        np.testing.assert_array_equal(
+            [NumericStatsMixin.is_int(value) for value in data], is_int
+        )
+        np.testing.assert_array_equal(
+            [NumericStatsMixin.is_float(value) for value in data], is_float
+        )
+        np.testing.assert_array_equal(~is_float, is_text)
+
+        # all numeric strings and native data
+        for data in [
+            pd.Series(["1", "2.5", "nan", "-3"]),
+            pd.Series([1, 2.5, np.nan, -3]),
+        ]:
+            is_int, is_float, is_text = utils.get_numeric_type_masks(data)
+            np.testing.assert_array_equal([True, False, False, True], is_int)
+            np.testing.assert_array_equal([True] * 4, is_float)
+            np.testing.assert_array_equal([False] * 4, is_text)
+
+        is_int, is_float, is_text = utils.get_numeric_type_masks(
+            pd.Series([3, 2, 1], dtype=np.uint8)
+        )
+        np.testing.assert_array_equal([True] * 3, is_int)
+        np.testing.assert_array_equal([True] * 3, is_float)
+        np.testing.assert_array_equal([False] * 3, is_text)
+
+    def test_batch_moments(self):
+        """
+        Checks the fused moments match the pandas and scipy computations.
+        """
+        data = pd.Series([1.5, -2.0, 0.0, 4.0, 0.0, 10.25, -0.5])
+        moments = utils.BatchMoments(data)
+        self.assertEqual(7, moments.count)
+        self.assertEqual(data.min(), moments.min)
+        self.assertEqual(data.max(), moments.max)
+        self.assertAlmostEqual(data.sum(), moments.sum)
+        self.assertAlmostEqual(np.var(data), moments.biased_variance)
+        self.assertAlmostEqual(
+            scipy.stats.skew(data, bias=True), moments.biased_skewness
+        )
+        self.assertAlmostEqual(
+            scipy.stats.kurtosis(data, bias=True), moments.biased_kurtosis
+        )
+        self.assertEqual(2, moments.num_zeros)
+        self.assertEqual(2, moments.num_negatives)
+
+        # only the requested moments are computed
+        moments = utils.BatchMoments(data, order=2)
+        self.assertAlmostEqual(np.var(data), moments.biased_variance)
+        self.assertTrue(np.isnan(moments.biased_skewness))
+        self.assertTrue(np.isnan(moments.biased_kurtosis))
+
+        # constant data
+        moments = utils.BatchMoments(np.array([3.0, 3.0]))
+        self.assertEqual(0, moments.biased_variance)
+        self.assertEqual(0, moments.biased_skewness)
+        self.assertEqual(-3, moments.biased_kurtosis)
+
+        # NaN values are skipped except by the skewness and kurtosis
+        moments = utils.BatchMoments(np.array([1.0, np.nan, 3.0]))
+        self.assertEqual(3, moments.count)
+        self.assertEqual(1, moments.min)
+        self.assertEqual(4, moments.sum)
+        self.assertEqual(1, moments.biased_variance)
+        self.assertTrue(np.isnan(moments.biased_skewness))
+
+        # infinite values make the moments invalid
+        moments = utils.BatchMoments(np.array([1.0, np.inf]))
+        self.assertEqual(np.inf, moments.sum)
+        self.assertTrue(np.isnan(moments.biased_variance))
+
+        moments = utils.BatchMoments(np.array([]))
+        self.assertEqual(0, moments.sum)
+        self.assertTrue(np.isnan(moments.min))
+        self.assertTrue(np.isnan(moments.biased_variance))
+
 
 @mock.patch("dataprofiler.profilers.profile_builder.DataLabeler", spec=BaseDataLabeler)
 class TestProfileDistributedMerge(unittest.TestCase):